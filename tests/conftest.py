@@ -103,6 +103,42 @@ def scalar_theory_custom():
     return _create
 
 
+class SchwarzschildStandIn:
+    """
+    Minimaler Metrik-Ersatz mit A = 1 - 2M/r (Referenz für GR-Grenzfälle).
+
+    Bietet die von qnm_spectrum, circular_orbits, accretion_disk und
+    orbit_precession genutzte Schnittstelle der UnifiedSSZMetric.
+    """
+
+    def __init__(self, mass):
+        self.params = UnifiedSSZMetric(mass=mass).params
+        self.r_phi = 1.0
+
+    def delta_M_correction(self):
+        return 0.0
+
+    def pn_series_coefficients(self):
+        return np.array([1.0, -2.0, 0.0, 0.0, 0.0, 0.0, 0.0])
+
+    def metric_function_A_array(self, r):
+        return 1.0 - 2.0 * self.params.G * self.params.mass / (self.params.c**2 * np.asarray(r))
+
+
+@pytest.fixture
+def schwarzschild_metric():
+    """
+    Schwarzschild-Ersatzmetrik (für GR-Referenzwerte).
+    
+    Returns:
+        Function mass -> SchwarzschildStandIn
+    """
+    if not HAS_MODULES:
+        pytest.skip("unified_metric not available")
+    
+    return SchwarzschildStandIn
+
+
 @pytest.fixture
 def r_values_solar(solar_mass_metric):
     """
@@ -198,6 +234,8 @@ __all__ = [
     'jupiter_mass_metric',
     'scalar_theory',
     'scalar_theory_custom',
+    'schwarzschild_metric',
+    'SchwarzschildStandIn',
     'r_values_solar',
     'theta_values',
     'approx_equal',
@@ -0,0 +1,77 @@
+"""
+Test closed-form black hole bomb evolution and (λ_A, K) phase diagrams
+"""
+import sys
+sys.path.insert(0, 'E:/clone/ssz-full-metric')
+
+import numpy as np
+from viz_ssz_metric.unified_metric import UnifiedSSZMetric
+from viz_ssz_metric.bomb_dynamics import (PHI, geometric_evolution, energy_evolution,
+                                          stability_phase_diagram)
+
+M_SUN = 1.98847e30
+
+
+def _loop(E0, g, E_max, steps):
+    """Reference: the original step-by-step recurrence."""
+    E = np.zeros(steps)
+    E[0] = E0
+    first = -1
+    for t in range(steps - 1):
+        if E[t] * g >= E_max and first < 0:
+            first = t + 1
+        E[t + 1] = min(E[t] * g, E_max)
+    return E, first
+
+
+def test_closed_form_matches_recurrence():
+    """E_t = min(E_0 g^t, E_max min(1,g)^(t-1)) for growth, decay and capping"""
+    for g, E_max in [(1.01, 50.0), (0.99, 0.5), (0.99, 5.0), (1.01, 0.8), (1.2, np.inf)]:
+        E, _ = _loop(1.0, g, E_max, 3000)
+        closed = geometric_evolution(1.0, g, 3000, E_max=E_max)
+        assert np.allclose(closed, E, rtol=1e-12, atol=0), (g, E_max)
+
+    print("[OK] Closed form matches recurrence")
+
+
+def test_metric_method_unchanged():
+    """energy_evolution_black_hole_bomb keeps the recurrence semantics"""
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    K = metric.params.K_segments
+    lam = 0.5 * metric.lambda_crit
+    E = metric.energy_evolution_black_hole_bomb(2.0, lam, 500)
+
+    ref, _ = _loop(2.0, 1.0 + lam - lam**2 * K**2, 2.0 * (1.0 - np.exp(-PHI * K)), 500)
+    assert np.allclose(E, ref, rtol=1e-12)
+
+
+def test_phase_diagram_batched():
+    """One call over a (λ_A, K) grid equals per-point recurrences"""
+    lam = np.logspace(-6, -2, 12)
+    K = np.arange(1, 120, 13)
+    diagram = stability_phase_diagram(lam, K, steps=2000)
+
+    assert diagram['log10_E_ssz'].shape == (12, K.size)
+    for i in range(lam.size):
+        for j in range(K.size):
+            g = diagram['growth_ssz'][i, j]
+            E, first = _loop(1.0, g, 1.0 - np.exp(-PHI * K[j]), 2000)
+            if g <= 0 or E[-1] < 1e-290:
+                continue
+            assert np.isclose(np.log10(E[-1]), diagram['log10_E_ssz'][i, j], atol=1e-9)
+            assert diagram['saturation_step'][i, j] == first
+
+    # Batched trajectories and no overflow in log space
+    traj = energy_evolution(1.0, lam[:, None], K[None, :], steps=10, log=True)
+    assert traj.shape == (12, K.size, 10)
+    assert np.all(np.isfinite(stability_phase_diagram([0.5], [1], steps=10**6)['log10_E_gr']))
+
+    print(f"[OK] Phase diagram {diagram['stable'].shape}, "
+          f"{diagram['stable'].sum()} stable points")
+
+
+if __name__ == "__main__":
+    test_closed_form_matches_recurrence()
+    test_metric_method_unchanged()
+    test_phase_diagram_batched()
+    print("\n[OK] All black hole bomb tests passed")
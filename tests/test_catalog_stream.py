@@ -0,0 +1,68 @@
+"""
+Test streaming catalog validation (chunked reader, incremental reducer)
+"""
+import os
+import sys
+sys.path.insert(0, 'E:/clone/ssz-full-metric')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'validation'))
+
+import numpy as np
+import pytest
+from catalog_stream import iter_catalog, cache_catalog, validate_stream, StreamingValidator
+from eso_validation import load_eso_data, prepare_observations, predict_total_redshifts, \
+    validation_statistics
+
+DATA = os.path.join(os.path.dirname(__file__), '..', 'data', 'real_data_full.csv')
+
+
+def test_projected_chunks():
+    """Only validation columns are read, in chunks"""
+    chunks = list(iter_catalog(DATA, chunksize=50))
+
+    assert [len(c) for c in chunks] == [50, 50, 27]
+    assert 'lambda_obs_nm' not in chunks[0].columns
+    assert chunks[0]['z'].dtype == np.float64
+
+
+def test_streaming_matches_in_memory():
+    """Chunked reducer equals the one-shot statistics"""
+    df = prepare_observations(load_eso_data())
+    z_ssz = predict_total_redshifts(df['mass_kg'].values, df['radius_m'].values,
+                                    df['v_los_mps'].values, df['v_tot_mps'].values)
+    reference = validation_statistics(df['z_observed'].values, z_ssz)
+
+    stats = validate_stream(DATA, chunksize=17)
+
+    assert stats['n'] == reference['n']
+    assert stats['matches'] == reference['matches']
+    assert np.isclose(stats['chi_squared'], reference['chi_squared'])
+    assert np.isclose(stats['rms'], reference['rms'])
+    assert sum(stats['category_counts'].values()) == stats['n']
+
+
+def test_category_accuracy():
+    """Per-category accuracy accumulates across chunks"""
+    v = StreamingValidator(tolerance=0.05)
+    v.update([1.0, 1.0], [1.0, 2.0], ['a', 'b'])
+    v.update([1.0, 1.0], [1.01, 1.0], ['a', 'b'])
+    result = v.result()
+
+    assert result['category_accuracy'] == {'a': 1.0, 'b': 0.5}
+    assert result['n'] == 4
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".feather"])
+def test_cache_roundtrip(tmp_path, suffix):
+    """Parquet/Feather cache gives the same result as CSV"""
+    pytest.importorskip("pyarrow")
+    cache = cache_catalog(DATA, str(tmp_path / ("catalog" + suffix)), chunksize=40)
+
+    assert validate_stream(cache)['chi_squared'] == pytest.approx(
+        validate_stream(DATA)['chi_squared'])
+
+
+if __name__ == "__main__":
+    test_projected_chunks()
+    test_streaming_matches_in_memory()
+    test_category_accuracy()
+    print("\n[OK] All catalog stream tests passed")
@@ -0,0 +1,113 @@
+"""
+Test effective-potential circular orbit analysis
+"""
+import sys
+sys.path.insert(0, 'E:/clone/ssz-full-metric')
+
+import numpy as np
+import pytest
+from viz_ssz_metric.unified_metric import UnifiedSSZMetric
+from viz_ssz_metric.circular_orbits import (CircularOrbitAnalysis, asymptotic_rs,
+                                            circular_orbit_radii)
+
+M_SUN = 1.98847e30
+
+
+def test_schwarzschild_limit(schwarzschild_metric):
+    """GR: r_ph = 3M, r_mb = 4M, r_ISCO = 6M, L_ISCO = sqrt(12)"""
+    orbits = CircularOrbitAnalysis(schwarzschild_metric(M_SUN), x_min=2.01)
+
+    assert np.isclose(orbits.photon_sphere, 3.0, rtol=1e-6)
+    assert np.isclose(orbits.marginally_bound, 4.0, rtol=1e-6)
+    assert np.isclose(orbits.isco, 6.0, rtol=1e-6)
+    assert np.isclose(orbits.L2_circular(6.0), 12.0, rtol=1e-6)
+
+    # L = 4: r = 12M (stable), r = 4M (unstable)
+    x_stable, x_unstable = orbits.orbit_radii([4.0])
+    assert np.isclose(x_stable[0], 12.0, rtol=1e-6)
+    assert np.isclose(x_unstable[0], 4.0, rtol=1e-6)
+
+    print(f"[OK] Schwarzschild: r_ph={orbits.photon_sphere:.4f}, r_ISCO={orbits.isco:.4f}")
+
+
+def test_ssz_ordering():
+    """Photon sphere < marginally bound < ISCO; consistent with metric methods"""
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    orbits = metric.circular_orbits()
+
+    assert orbits.photon_sphere < orbits.marginally_bound < orbits.isco
+    M_geom = metric.r_s / 2.0
+    assert np.isclose(orbits.photon_sphere * M_geom, metric.photon_sphere_radius(), rtol=1e-4)
+    assert np.isclose(metric.ISCO_radius(), orbits.isco * M_geom)
+    assert np.isclose(orbits.E2_circular(orbits.marginally_bound), 1.0)
+
+    print(f"[OK] SSZ: r_ph={orbits.photon_sphere:.4f}, r_mb={orbits.marginally_bound:.4f}, "
+          f"r_ISCO={orbits.isco:.4f} GM/c²")
+
+
+def test_stability_matches_isco():
+    """d²V_eff/dr² changes sign at the ISCO"""
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    r_isco = metric.ISCO_radius()
+    r = r_isco * np.array([0.95, 0.99, 1.01, 1.5, 10.0])
+
+    assert list(metric.circular_orbits().is_stable(r / (metric.r_s / 2.0))) == \
+        [False, False, True, True, True]
+    assert metric.geodesics.test_orbit_stability(1.01 * r_isco)
+    assert not metric.geodesics.test_orbit_stability(0.99 * r_isco)
+
+
+def test_batch_roots_are_circular():
+    """Vectorized roots satisfy L_c(x) = L"""
+    orbits = UnifiedSSZMetric(mass=M_SUN).circular_orbits()
+    L = np.linspace(np.sqrt(orbits.L2_circular(orbits.isco)) + 1e-3, 20.0, 10000)
+    x_stable, x_unstable = orbits.orbit_radii(L)
+
+    assert np.all(x_stable > orbits.isco)
+    assert np.all((x_unstable > orbits.photon_sphere) & (x_unstable < orbits.isco))
+    assert np.allclose(np.sqrt(orbits.L2_circular(x_stable)), L, rtol=1e-6)
+    assert np.allclose(np.sqrt(orbits.L2_circular(x_unstable)), L, rtol=1e-6)
+
+
+def test_mass_pairs():
+    """Shared-reference and per-mass branches agree with single-metric analyses"""
+    # Two masses with r_s < asymptotic_rs (Delta(M) mass-dependent), three above
+    masses = np.array([2e22, 1.0 * M_SUN, 6e22, 10.0 * M_SUN, 4.3e6 * M_SUN])
+    L = np.array([5.0, 5.0, 4.5, 4.5, 5.0])
+    r_stable, r_unstable = circular_orbit_radii(masses, L)
+
+    r_s = 2 * 6.67430e-11 * masses / 299792458.0**2
+    small = r_s < asymptotic_rs(UnifiedSSZMetric(mass=masses.max()))
+    assert small.tolist() == [True, False, True, False, False]
+
+    M_geom = r_s / 2
+    for m, l, rs, ru, mg in zip(masses, L, r_stable, r_unstable, M_geom):
+        orbits = CircularOrbitAnalysis.for_metric(UnifiedSSZMetric(mass=m))
+        xs, xu = orbits.orbit_radii(np.array([l]))
+        assert np.isclose(rs, xs[0] * mg, rtol=1e-12)
+        assert np.isclose(ru, xu[0] * mg, rtol=1e-12)
+
+    # Delta(M) differs below the threshold -> radii in GM/c² differ between branches
+    assert not np.isclose(r_stable[0] / M_geom[0], r_stable[4] / M_geom[4], rtol=1e-6)
+    assert np.isclose(r_stable[1] / M_geom[1], r_stable[4] / M_geom[4], rtol=1e-12)
+
+
+def test_asymptotic_threshold_from_delta_coefficients():
+    """Above asymptotic_rs, Delta(M) equals its offset B exactly"""
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    A, alpha, B = metric.params.delta_coefficients
+    threshold = asymptotic_rs(metric)
+
+    r_s = threshold * np.linspace(1.0, 10.0, 1000)
+    assert np.all(A * np.exp(-alpha * r_s) + B == B)
+    assert A * np.exp(-alpha * 0.5 * threshold) + B != B
+
+    # Steeper alpha -> lower threshold
+    metric.params.delta_coefficients = (A, 10 * alpha, B)
+    assert np.isclose(asymptotic_rs(metric), threshold / 10)
+
+    print(f"[OK] Asymptotic r_s threshold = {threshold:.3e} m")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,110 @@
+"""
+Test exact Kretschmann, Weyl and Ricci-squared invariants
+"""
+import sys
+sys.path.insert(0, 'E:/clone/ssz-full-metric')
+
+import numpy as np
+from viz_ssz_metric.unified_metric import UnifiedSSZMetric
+from viz_ssz_metric.kretschmann_weyl import (riemann_invariants, curvature_invariants,
+                                             kretschmann_scalar_exact, weyl_scalar_C2)
+from viz_ssz_metric.riemann_tensor import kretschmann_scalar
+from viz_ssz_metric.ricci_curvature import curvature_components
+from viz_ssz_metric.ssz_mirror_metric import schwarzschild_radius
+
+M_SUN = 1.98847e30
+
+
+def _brute_force_riemann(metric, x, h=1e-4):
+    """Reference: R^a_bcd from Christoffel symbols by nested central differences."""
+    def christoffel(y, dh=1e-5):
+        gi = np.linalg.inv(metric(y))
+        dg = np.array([(metric(y + dh * e) - metric(y - dh * e)) / (2 * dh) for e in np.eye(4)])
+        return 0.5 * (np.einsum('ls,msn->lmn', gi, dg) + np.einsum('ls,nsm->lmn', gi, dg)
+                      - np.einsum('ls,smn->lmn', gi, dg))
+
+    G = christoffel(x)
+    dG = np.array([(christoffel(x + h * e) - christoffel(x - h * e)) / (2 * h) for e in np.eye(4)])
+    return (np.einsum('cadb->abcd', dG) - np.einsum('dacb->abcd', dG)
+            + np.einsum('ace,edb->abcd', G, G) - np.einsum('ade,ecb->abcd', G, G))
+
+
+def test_against_brute_force():
+    """K, C², R_μν R^μν and R match a full Riemann contraction (A·B ≠ 1)"""
+    A = lambda r: 1 - 1 / r + 0.3 / r**2
+    B = lambda r: 1 / (1 - 0.8 / r) + 0.1 / r
+    dA = lambda r: 1 / r**2 - 0.6 / r**3
+    d2A = lambda r: -2 / r**3 + 1.8 / r**4
+    dB = lambda r: -(0.8 / r**2) / (1 - 0.8 / r)**2 - 0.1 / r**2
+    metric = lambda y: np.diag([-A(y[1]), B(y[1]), y[1]**2, (y[1] * np.sin(y[2]))**2])
+
+    for r in (3.0, 5.0):
+        x = np.array([0.0, r, 0.9, 0.0])
+        g = metric(x)
+        g_inv = np.linalg.inv(g)
+        riemann = _brute_force_riemann(metric, x)
+        K = np.einsum('ae,ebcd,bf,cg,dh,afgh->', g, riemann, g_inv, g_inv, g_inv, riemann)
+        ricci = g_inv @ np.einsum('abad->bd', riemann)
+        R = np.trace(ricci)
+        ricci_sq = np.trace(ricci @ ricci)
+
+        inv = riemann_invariants(r, A(r), dA(r), d2A(r), B(r), dB(r))
+        assert np.isclose(inv['kretschmann'], K, rtol=1e-5)
+        assert np.isclose(inv['weyl_C2'], K - 2 * ricci_sq + R**2 / 3, rtol=1e-5)
+        assert np.isclose(inv['ricci_squared'], ricci_sq, rtol=1e-3)
+        assert np.isclose(inv['R'], R, rtol=1e-4)
+
+    print("[OK] Invariants match brute-force Riemann contraction")
+
+
+def test_schwarzschild_and_identities():
+    """K = C² = 12 r_s²/r⁶ for Schwarzschild; C² identity on the PN metric"""
+    rs = 1.0
+    r = np.logspace(0.1, 3, 100)
+    A = 1 - rs / r
+    inv = riemann_invariants(r, A, rs / r**2, -2 * rs / r**3, 1 / A, -(rs / r**2) / A**2)
+    assert np.allclose(inv['kretschmann'], 12 * rs**2 / r**6, rtol=1e-12)
+    assert np.allclose(inv['weyl_C2'], 12 * rs**2 / r**6, rtol=1e-12)
+    assert np.allclose(inv['ricci_squared'], 0, atol=1e-14 * 12 * rs**2 / r**6)
+
+    rs = schwarzschild_radius(M_SUN)
+    r = np.linspace(3, 100, 200) * rs
+    inv = curvature_invariants(M_SUN, r)
+    c = curvature_components(M_SUN, r, np.pi / 2)
+    assert np.allclose(inv['R'], c['R'], rtol=1e-10)
+    assert np.allclose(inv['weyl_C2'],
+                       inv['kretschmann'] - 2 * inv['ricci_squared'] + inv['R']**2 / 3, rtol=1e-9)
+    # Far field → GR
+    assert np.isclose(inv['kretschmann'][-1], 12 * rs**2 / r[-1]**6, rtol=1e-2)
+
+    print("[OK] Schwarzschild limit and Weyl identity")
+
+
+def test_entry_points():
+    """All Kretschmann entry points use the exact invariant and accept arrays"""
+    rs = schwarzschild_radius(M_SUN)
+    r = np.linspace(3, 30, 25) * rs
+    exact = curvature_invariants(M_SUN, r)
+
+    assert np.allclose(kretschmann_scalar_exact(M_SUN, r, np.pi / 2), exact['kretschmann'])
+    assert np.allclose(kretschmann_scalar(M_SUN, r, np.pi / 2), exact['kretschmann'])
+    assert np.allclose(weyl_scalar_C2(M_SUN, r, np.pi / 2), exact['weyl_C2'])
+
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    r = np.logspace(-2, 2, 300) * rs
+    K = metric.kretschmann_scalar(r, np.pi / 2)
+    raw = metric.curvature_invariants(r)['kretschmann']
+    assert np.all(np.isfinite(raw)) and np.all(K <= 1.1 * metric.K_max)
+    outside = r > 2 * metric.r_phi
+    assert np.allclose(K[outside], raw[outside])
+    assert np.isclose(metric.kretschmann_scalar(5 * rs, 0.3),
+                      metric.curvature_invariants(5 * rs)['kretschmann'], rtol=1e-14)
+
+    print("[OK] Entry points routed through exact invariants")
+
+
+if __name__ == "__main__":
+    test_against_brute_force()
+    test_schwarzschild_and_identities()
+    test_entry_points()
+    print("\n[OK] All curvature invariant tests passed")
@@ -0,0 +1,75 @@
+"""
+Test vectorized energy-condition scanner with exact violation boundaries
+"""
+import sys
+sys.path.insert(0, 'E:/clone/ssz-full-metric')
+
+import numpy as np
+from viz_ssz_metric.unified_metric import UnifiedSSZMetric
+from viz_ssz_metric.energy_conditions import (scan_energy_conditions, energy_condition_margins,
+                                              check_all_energy_conditions, violation_regions)
+from viz_ssz_metric.energy_momentum_tensor import perfect_fluid_decomposition
+from viz_ssz_metric.ssz_mirror_metric import schwarzschild_radius
+
+M_SUN = 1.98847e30
+KEYS = ('WEC', 'NEC', 'DEC', 'SEC', 'ANEC', 'AWEC')
+
+
+def test_grid_matches_pointwise():
+    """Boolean arrays on a log grid agree with check_all_energy_conditions"""
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    rs = metric.r_s
+    scan = scan_energy_conditions(M_SUN, 0.05 * rs, 1e4 * rs, num=60, backend=metric)
+    assert np.allclose(scan['r'], np.geomspace(0.05, 1e4, 60) * rs)
+    for i in (0, 17, 31, 45, 59):
+        conditions = check_all_energy_conditions(M_SUN, scan['r'][i], np.pi / 2, backend=metric)
+        for key in KEYS:
+            assert scan['satisfied'][key][i] == conditions[key]
+
+    print("[OK] Vectorized scan matches pointwise checks")
+
+
+def test_boundaries_are_exact():
+    """Every boundary separates satisfied and violated radii to rtol"""
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    rs = metric.r_s
+    scan = scan_energy_conditions(M_SUN, 0.01 * rs, 1e6 * rs, num=2000, backend=metric, rtol=1e-12)
+    assert any(scan['boundaries'][key].size for key in KEYS)
+
+    for key in KEYS:
+        for r_b in scan['boundaries'][key]:
+            r = r_b * np.array([1 - 1e-10, 1 + 1e-10])
+            margins = energy_condition_margins(perfect_fluid_decomposition(M_SUN, r, np.pi / 2, metric))
+            assert (margins[key][0] >= 0) != (margins[key][1] >= 0), (key, r_b / rs)
+
+        # Intervals bracket exactly the violated grid points
+        violated = np.zeros_like(scan['r'], dtype=bool)
+        for start, end in scan['intervals'][key]:
+            assert start <= end
+            violated |= (scan['r'] >= start) & (scan['r'] <= end)
+        assert np.array_equal(violated, ~scan['satisfied'][key]), key
+
+    print("[OK] Boundaries refined to rtol across ten decades")
+
+
+def test_resolution_independent():
+    """Boundaries do not depend on grid resolution (linear and log grids)"""
+    rs = schwarzschild_radius(M_SUN)
+    coarse = scan_energy_conditions(M_SUN, 2 * rs, 1e3 * rs, num=50)
+    fine = scan_energy_conditions(M_SUN, 2 * rs, 1e3 * rs, num=3000)
+    linear = scan_energy_conditions(M_SUN, 2 * rs, 40 * rs, num=80, log=False)
+    nec = fine['boundaries']['NEC']
+    assert nec.size == 1
+    assert np.allclose(coarse['boundaries']['NEC'], nec, rtol=1e-10)
+    assert np.allclose(linear['boundaries']['NEC'], nec, rtol=1e-10)
+
+    regions = violation_regions(M_SUN, 2 * rs, 40 * rs, num=80)
+    assert np.allclose(np.array(regions['NEC']) * rs, linear['r'][~linear['satisfied']['NEC']])
+    print("[OK] Boundaries independent of grid")
+
+
+if __name__ == "__main__":
+    test_grid_matches_pointwise()
+    test_boundaries_are_exact()
+    test_resolution_independent()
+    print("\n[OK] All energy-condition scan tests passed")
@@ -0,0 +1,179 @@
+"""
+Test the optional JIT kernel layer (same results with and without numba)
+"""
+import sys
+sys.path.insert(0, 'E:/clone/ssz-full-metric')
+
+import math
+import numpy as np
+import pytest
+from viz_ssz_metric import jit_kernels
+from viz_ssz_metric.jit_kernels import HAS_NUMBA, jit, metric_A_kernel, metric_A_array_kernel
+from viz_ssz_metric.unified_metric import UnifiedSSZMetric, UnifiedMetricParameters
+from viz_ssz_metric.christoffel_symbols import christoffel_nonzero
+from viz_ssz_metric.geodesics import geodesic_equations_rhs
+from viz_ssz_metric.ssz_mirror_metric import schwarzschild_radius, G_DEFAULT, C_DEFAULT, EPSILON3
+from viz_ssz_metric import ssz_theory_segmented as seg
+
+M_SUN = 1.98847e30
+
+
+def _params(phi_cap):
+    return seg.Params(Z0=1.0, alpha=0.3, beta=0.05, Zmin=0.5, Zmax=1.3, mphi=0.1, lam=0.001,
+                      phi_cap=phi_cap, phip_cap=1.0, cs2=0.3, rho0=1e-9,
+                      abort_on_horizon=True, horizon_margin=1e-6)
+
+
+def _reference_rhs(r, y, p):
+    """Reference: TOV + scalar EOM from the single model functions."""
+    m, Phi, pr_fl, phi, phip = (float(v) for v in y)
+    one_minus = max(1.0 - 2.0 * m / r, 1e-16)
+    Lam = -0.5 * math.log(one_minus)
+    Zp = seg.Zpar(phi, p.Z0, p.alpha, p.beta, p.phi_cap, p.Zmin, p.Zmax)
+    Up = seg.U(phi, p.mphi, p.lam, p.phi_cap)
+    phip_s = seg.sat(phip, p.phip_cap)
+    X = one_minus * phip_s**2
+    rho_fl = pr_fl / p.cs2 + p.rho0
+    rho_tot = rho_fl + 0.5 * Zp * X + Up
+    pr_tot = pr_fl + 0.5 * Zp * X - Up
+    denom = r * (r - 2.0 * m)
+    dPhidr = (m + 4.0 * math.pi * r**3 * pr_tot) / denom
+    dLdr = (m + 4.0 * math.pi * r**3 * rho_tot) / denom
+    Zphi = seg.dZpar_dphi(phi, p.Z0, p.alpha, p.beta, p.phi_cap, p.Zmin, p.Zmax)
+    source = seg.dU_dphi(phi, p.mphi, p.lam, p.phi_cap) + 0.5 * Zphi * X
+    A = math.exp(Phi - Lam) * r**2 * Zp
+    B = math.exp(Phi + Lam) * r**2 * source
+    Aprime = A * (dPhidr - dLdr + 2.0 / r) + math.exp(Phi - Lam) * r**2 * Zphi * phip_s
+    return np.array([4.0 * math.pi * r**2 * rho_tot, dPhidr,
+                     -(rho_fl + pr_fl) * dPhidr + (2.0 / r) * (-Zp * X), phip, (B - Aprime * phip) / A])
+
+
+def test_layer():
+    """Without numba jit is the identity, with numba it compiles"""
+    f = lambda x: 2.0 * x
+    if HAS_NUMBA:
+        assert jit(f) is not f and jit(f)(1.5) == 3.0
+    else:
+        assert jit(f) is f
+        assert jit_kernels.tov_rhs_kernel.__module__ == jit_kernels.__name__
+    print(f"[OK] JIT layer (numba available: {HAS_NUMBA})")
+
+
+def test_tov_rhs():
+    """rhs_dr (kernel) matches the single-function reference; guard raises HorizonError"""
+    rng = np.random.default_rng(0)
+    for phi_cap in (1.5, None):
+        p = _params(phi_cap)
+        for _ in range(200):
+            r = 10**rng.uniform(2, 5)
+            y = np.array([rng.uniform(0, 0.4) * r, rng.normal(), rng.uniform(0, 1e-6),
+                          20 * rng.normal(), rng.normal()])
+            assert np.allclose(seg.rhs_dr(r, y, p), _reference_rhs(r, y, p), rtol=1e-10, atol=0)
+
+    with pytest.raises(seg.HorizonError):
+        seg.rhs_dr(100.0, np.array([49.99999, 0.0, 0.0, 0.0, 0.0]), _params(1.5))
+    print("[OK] TOV kernel matches reference")
+
+
+def test_geodesic_rhs():
+    """Geodesic kernel equals the Christoffel symbols of the PN backend"""
+    rs = schwarzschild_radius(M_SUN)
+    rng = np.random.default_rng(1)
+    for _ in range(100):
+        state = np.array([0.0, rng.uniform(2, 100) * rs, rng.uniform(0.05, 3.1), 0.0,
+                          rng.normal(), rng.normal(), 1e-4 * rng.normal(), 1e-4 * rng.normal()])
+        t, r, theta, phi, v_t, v_r, v_th, v_ph = state
+        g = christoffel_nonzero(M_SUN, r, theta)
+        expected = [v_t, v_r, v_th, v_ph,
+                    -2 * g['Gamma^t_tr'] * v_t * v_r,
+                    -(g['Gamma^r_tt'] * v_t**2 + g['Gamma^r_rr'] * v_r**2
+                      + g['Gamma^r_thth'] * v_th**2 + g['Gamma^r_phph'] * v_ph**2),
+                    -(2 * g['Gamma^th_rth'] * v_r * v_th + g['Gamma^th_phph'] * v_ph**2),
+                    -(2 * g['Gamma^ph_rph'] * v_r * v_ph + 2 * g['Gamma^ph_thph'] * v_th * v_ph)]
+        assert np.allclose(geodesic_equations_rhs(state, 0.0, M_SUN), expected, rtol=1e-12, atol=0)
+
+    with pytest.raises(ValueError):
+        geodesic_equations_rhs(np.array([0, 0.3 * rs, 1.0, 0, 1.0, 0, 0, 0]), 0.0, M_SUN)
+    print("[OK] Geodesic kernel matches Christoffel symbols")
+
+
+def test_metric_A():
+    """Scalar and array A(r) kernels match the staged metric functions"""
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    r = np.geomspace(1e-3, 1e6, 500) * metric.r_s
+
+    def staged(r):
+        A = metric.post_newtonian_coefficients(r)['A_unsaturated']
+        if r < metric.r_phi:
+            A = metric.golden_ratio_saturation(A, 1.0, r)
+        return metric.softplus_floor(A)
+
+    scalar = np.array([metric.metric_function_A(x) for x in r])
+    assert np.allclose(scalar, [staged(x) for x in r], rtol=1e-13, atol=0)
+    assert scalar[0] == metric_A_kernel(r[0], *metric.metric_kernel_args())
+
+    args = metric.metric_kernel_args()
+    grid = r.reshape(20, 25)
+    A = metric_A_array_kernel(grid, *args)
+    assert A.shape == grid.shape and np.array_equal(A.ravel(), scalar)
+    assert np.allclose(A.ravel(), metric.metric_function_A_array(r), rtol=1e-13, atol=0)
+    print("[OK] Metric kernels match staged A(r)")
+
+
+def test_kernel_args_follow_params():
+    """Changing params after the first A(r) call refreshes r_phi and coefficients"""
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    r = np.geomspace(0.3, 50, 40) * metric.r_s
+    before = [metric.metric_function_A(x) for x in r]
+
+    metric.params.delta_coefficients = (50.0, 1e3, 20.0)
+    metric.params.pn_epsilons = (-4.0, 5.0, -10.0, 15.0)
+    metric.params.varphi = 1.5
+    fresh = UnifiedSSZMetric(params=UnifiedMetricParameters(
+        mass=M_SUN, delta_coefficients=(50.0, 1e3, 20.0),
+        pn_epsilons=(-4.0, 5.0, -10.0, 15.0), varphi=1.5))
+    after = [metric.metric_function_A(x) for x in r]
+
+    assert metric.r_phi == fresh.r_phi
+    assert np.array_equal(after, [fresh.metric_function_A(x) for x in r])
+    assert not np.allclose(after, before)
+
+
+
+def test_compiled_kernels():
+    """numba-compiled kernels agree with their pure-Python source"""
+    pytest.importorskip("numba")
+    if not HAS_NUMBA:
+        pytest.skip("JIT disabled via SSZ_DISABLE_JIT")
+
+    p = _params(1.5)
+    r, y = 1e4, np.array([1e3, 0.1, 1e-7, 2.0, 0.3])
+    args = tuple(float(a) for a in p.kernel_args())
+    assert np.allclose(jit_kernels.tov_rhs_kernel(r, y, args),
+                       jit_kernels.tov_rhs_kernel.py_func(r, y, args), rtol=1e-12, atol=0)
+    assert np.allclose(jit_kernels.scalar_sector_kernel(2.0, *args[:8]),
+                       jit_kernels.scalar_sector_kernel.py_func(2.0, *args[:8]), rtol=1e-12)
+
+    rs = schwarzschild_radius(M_SUN)
+    state = np.array([0.0, 10 * rs, 1.0, 0.0, 1.0, -0.1, 1e-4, 1e-4])
+    geo = (G_DEFAULT * M_SUN, C_DEFAULT**2, EPSILON3)
+    assert np.allclose(jit_kernels.geodesic_rhs_pn_kernel(state, *geo),
+                       jit_kernels.geodesic_rhs_pn_kernel.py_func(state, *geo), rtol=1e-12, atol=0)
+    with pytest.raises(ValueError):
+        jit_kernels.geodesic_rhs_pn_kernel(np.array([0, 0.3 * rs, 1.0, 0, 1.0, 0, 0, 0]), *geo)
+
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    grid = np.geomspace(1e-3, 1e6, 200) * metric.r_s
+    A = metric_A_array_kernel(grid, *metric.metric_kernel_args())
+    assert np.allclose(A, metric.metric_function_A_array(grid), rtol=1e-13, atol=0)
+    print("[OK] Compiled kernels match Python source")
+
+
+if __name__ == "__main__":
+    test_layer()
+    test_tov_rhs()
+    test_geodesic_rhs()
+    test_metric_A()
+    test_kernel_args_follow_params()
+    test_compiled_kernels()
+    print("\n[OK] All JIT kernel tests passed")
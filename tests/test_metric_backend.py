@@ -0,0 +1,118 @@
+"""
+Test pluggable metric backends for the curvature modules
+"""
+import sys
+sys.path.insert(0, 'E:/clone/ssz-full-metric')
+
+import numpy as np
+import pytest
+from viz_ssz_metric.unified_metric import UnifiedSSZMetric
+from viz_ssz_metric.ssz_mirror_metric import A_safe, metric_functions_pn, schwarzschild_radius
+from viz_ssz_metric.metric_backend import (PostNewtonianBackend, UnifiedMetricBackend,
+                                           MirrorBlendBackend, as_backend, resolve_backend)
+from viz_ssz_metric.christoffel_symbols import christoffel_nonzero
+from viz_ssz_metric.ricci_curvature import ricci_scalar, ricci_tensor_diagonal
+from viz_ssz_metric.einstein_tensor import einstein_tensor_diagonal
+from viz_ssz_metric.energy_conditions import check_all_energy_conditions
+
+M_SUN = 1.98847e30
+
+
+def _backends():
+    rs = schwarzschild_radius(M_SUN)
+    return [
+        (PostNewtonianBackend(M_SUN), np.linspace(3, 40, 200) * rs),
+        (UnifiedMetricBackend(UnifiedSSZMetric(mass=M_SUN)), np.linspace(0.3, 40, 400) * rs),
+        (MirrorBlendBackend(rs), np.linspace(0.3, 40, 400) * rs),
+    ]
+
+
+def test_analytic_derivatives():
+    """A', A'', B' match central finite differences for every backend"""
+    for backend, r in _backends():
+        f = backend.functions(r)
+        h = 1e-4 * r
+        A_p, A_m = backend.A(r + h), backend.A(r - h)
+        dA_num = (A_p - A_m) / (2 * h)
+        d2A_num = (A_p - 2 * f.A + A_m) / h**2
+        dB_num = (1 / A_p - 1 / A_m) / (2 * h)
+        scale = np.max(np.abs(f.dA))
+        assert np.allclose(f.dA, dA_num, rtol=1e-5, atol=1e-7 * scale), backend
+        assert np.allclose(f.d2A, d2A_num, rtol=1e-3, atol=1e-4 * np.max(np.abs(f.d2A))), backend
+        assert np.allclose(f.dB, dB_num, rtol=1e-5, atol=1e-7 * np.max(np.abs(f.dB))), backend
+        assert np.allclose(f.B, 1 / f.A)
+
+    print("[OK] Analytic derivatives match finite differences")
+
+
+def test_backends_reproduce_metrics():
+    """Backends return the same A as the functions they wrap"""
+    rs = schwarzschild_radius(M_SUN)
+    r = np.linspace(3, 40, 50) * rs
+    pn = PostNewtonianBackend(M_SUN)
+    assert np.allclose(pn.A(r), [metric_functions_pn(M_SUN, ri)[0] for ri in r], rtol=1e-14)
+
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    r = np.linspace(0.3, 40, 50) * rs
+    assert np.allclose(as_backend(metric).A(r), metric.metric_function_A_array(r), rtol=1e-14)
+
+    assert np.allclose(MirrorBlendBackend(rs).A(r), A_safe(r, rs)[0], rtol=1e-12)
+    print("[OK] Backends reproduce PN, unified and mirror-blend A(r)")
+
+
+def test_default_stays_post_newtonian():
+    """Without backend the kernels keep the strict PN series"""
+    rs = schwarzschild_radius(M_SUN)
+    assert resolve_backend(M_SUN) is resolve_backend(M_SUN)
+    with pytest.raises(ValueError):
+        christoffel_nonzero(M_SUN, 0.5 * rs, np.pi / 2)
+
+    # Same values as an explicit PN backend
+    R_tt, _, _, _ = ricci_tensor_diagonal(M_SUN, 5 * rs, np.pi / 2)
+    explicit, _, _, _ = ricci_tensor_diagonal(M_SUN, 5 * rs, np.pi / 2,
+                                              backend=PostNewtonianBackend(M_SUN))
+    assert np.isclose(R_tt, explicit, rtol=1e-14)
+    print("[OK] Default backend is the strict PN series")
+
+
+def test_kernels_with_other_backends():
+    """The same kernels run on unified and mirror-blend metrics, also inside r_s"""
+    rs = schwarzschild_radius(M_SUN)
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    r = np.array([0.5, 1.0, 2.0, 10.0]) * rs
+
+    for backend in (metric, MirrorBlendBackend(rs)):
+        gamma = christoffel_nonzero(M_SUN, r, np.pi / 2, backend=backend)
+        assert gamma['Gamma^t_tr'].shape == r.shape
+        R = ricci_scalar(M_SUN, r, np.pi / 2, backend=backend)
+        G_tt, G_rr, _, _ = einstein_tensor_diagonal(M_SUN, r, np.pi / 2, backend=backend)
+        assert np.all(np.isfinite(R)) and np.all(np.isfinite(G_tt)) and np.all(np.isfinite(G_rr))
+
+    conditions = check_all_energy_conditions(M_SUN, 0.5 * rs, np.pi / 2, backend=metric)
+    assert set(conditions) == {'WEC', 'NEC', 'DEC', 'SEC', 'ANEC', 'AWEC'}
+    print("[OK] Kernels run with unified and mirror-blend backends")
+
+
+def test_cache():
+    """functions(r) is cached per backend and shared through the metric"""
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    backend = as_backend(metric)
+    assert as_backend(metric) is backend
+    assert backend == UnifiedMetricBackend(metric)
+    assert hash(backend) == hash(UnifiedMetricBackend(metric))
+
+    r = np.linspace(1, 10, 100) * metric.r_s
+    first = backend.functions(r)
+    assert backend.functions(r.copy()) is first
+    backend.clear_cache()
+    assert backend.functions(r) is not first
+    print("[OK] Backend cache")
+
+
+if __name__ == "__main__":
+    test_analytic_derivatives()
+    test_backends_reproduce_metrics()
+    test_default_stays_post_newtonian()
+    test_kernels_with_other_backends()
+    test_cache()
+    print("\n[OK] All metric backend tests passed")
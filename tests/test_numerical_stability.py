@@ -0,0 +1,80 @@
+"""
+Test shared numerical-stability kernels (scalar fast path, array path, out= buffers)
+"""
+import sys
+sys.path.insert(0, 'E:/clone/ssz-full-metric')
+
+import numpy as np
+from viz_ssz_metric.numerical_stability import exp_clip, sech2_stable, sat_tanh, sat_pos_tanh
+from viz_ssz_metric.scalar_action_theory import ScalarActionTheory
+from viz_ssz_metric import ssz_theory_segmented as seg
+
+M_SUN = 1.98847e30
+
+
+def test_scalar_and_array_paths_agree():
+    """math fast path (floats) and ufunc path (arrays) give the same values"""
+    z = np.linspace(-60, 60, 1201)
+    kernels = [
+        (lambda x, **kw: exp_clip(x, 50.0, **kw), lambda x: np.exp(np.clip(x, -50, 50))),
+        (sech2_stable, lambda x: np.where(np.abs(x) < 20, 1 / np.cosh(np.clip(x, -20, 20))**2,
+                                          4 * np.exp(-2 * np.abs(x)))),
+        (lambda x, **kw: sat_tanh(x, 3.0, **kw), lambda x: 3.0 * np.tanh(x / 3.0)),
+        (lambda x, **kw: sat_pos_tanh(x, 3.0, **kw), lambda x: 3.0 * np.tanh(np.maximum(x, 0) / 3.0)),
+    ]
+    for kernel, reference in kernels:
+        expected = reference(z)
+        scalar = np.array([kernel(float(x)) for x in z])
+        assert isinstance(kernel(1.5), float)
+        assert np.allclose(scalar, expected, rtol=1e-14, atol=0)
+        assert np.allclose(kernel(z), expected, rtol=1e-14, atol=0)
+
+        out = np.empty_like(z)
+        assert kernel(z, out=out) is out
+        assert np.allclose(out, expected, rtol=1e-14, atol=0)
+
+    # Overflow-free, 0-d arrays, no cap
+    assert sech2_stable(1e4) == 0.0 and np.all(np.isfinite(sech2_stable(np.array([1e4, -1e4]))))
+    assert np.ndim(sech2_stable(np.array(0.5))) == 0
+    assert sat_tanh(7, None) == 7 and sat_pos_tanh(-2.0, None) == 0.0
+
+    print("[OK] Scalar and array kernel paths agree")
+
+
+def test_single_kernel_set():
+    """Scalar theory and TOV module use the same kernels"""
+    theory = ScalarActionTheory()
+    assert seg.sech2_stable is sech2_stable and seg.exp_clip is exp_clip
+    assert seg.sat is sat_tanh and seg.sat_pos is sat_pos_tanh
+    phi = np.linspace(-40, 40, 81)
+    assert np.array_equal(theory.sech2_stable(phi), sech2_stable(phi))
+    assert np.array_equal(theory.sat_tanh(phi, 10.0), sat_tanh(phi, 10.0))
+
+    print("[OK] One kernel set shared")
+
+
+def test_fused_scalar_sector():
+    """scalar_sector matches Zpar, U, dZpar/dφ, dU/dφ used by the TOV RHS"""
+    for phi_cap in (1.5, None):
+        p = seg.Params(Z0=1.0, alpha=0.3, beta=0.05, Zmin=0.5, Zmax=1.3, mphi=0.1, lam=0.001,
+                       phi_cap=phi_cap, phip_cap=1.0, cs2=0.3, rho0=1e-9,
+                       abort_on_horizon=False, horizon_margin=1e-6)
+        for phi in np.linspace(-30, 30, 121):
+            phi = float(phi)
+            expected = (seg.Zpar(phi, p.Z0, p.alpha, p.beta, p.phi_cap, p.Zmin, p.Zmax),
+                        seg.U(phi, p.mphi, p.lam, p.phi_cap),
+                        seg.dZpar_dphi(phi, p.Z0, p.alpha, p.beta, p.phi_cap, p.Zmin, p.Zmax),
+                        seg.dU_dphi(phi, p.mphi, p.lam, p.phi_cap))
+            assert np.allclose(seg.scalar_sector(phi, p), expected, rtol=1e-13, atol=0)
+
+        dy = seg.rhs_dr(3e3, np.array([100.0, 0.1, 1e-7, 0.5, 0.01]), p)
+        assert dy.shape == (5,) and np.all(np.isfinite(dy))
+
+    print("[OK] Fused scalar sector matches single functions")
+
+
+if __name__ == "__main__":
+    test_scalar_and_array_paths_agree()
+    test_single_kernel_set()
+    test_fused_scalar_sector()
+    print("\n[OK] All numerical stability tests passed")
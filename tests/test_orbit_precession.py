@@ -0,0 +1,71 @@
+"""
+Test exact periapsis precession (Gauss-Chebyshev orbit integral)
+"""
+import sys
+sys.path.insert(0, 'E:/clone/ssz-full-metric')
+
+import numpy as np
+import pytest
+from viz_ssz_metric.unified_metric import UnifiedSSZMetric
+from viz_ssz_metric.orbit_precession import periapsis_shift, periapsis_shift_for_masses
+
+M_SUN = 1.98847e30
+M_GEOM_SUN = 6.67430e-11 * M_SUN / 299792458.0**2
+
+MERCURY_A = 5.791e10
+MERCURY_E = 0.2056
+
+
+def test_schwarzschild_mercury(schwarzschild_metric):
+    """Weak field: exact integral reproduces 6πM/p without cancellation"""
+    dphi = periapsis_shift(schwarzschild_metric(M_SUN), MERCURY_A, MERCURY_E)
+    dphi_GR = 6 * np.pi * M_GEOM_SUN / (MERCURY_A * (1 - MERCURY_E**2))
+
+    assert abs(dphi / dphi_GR - 1) < 1e-6
+
+    print(f"[OK] Schwarzschild Mercury: {dphi:.6e} rad (1PN: {dphi_GR:.6e})")
+
+
+def test_weak_and_strong_paths_agree(schwarzschild_metric):
+    """PN divided-difference path equals direct evaluation of A"""
+    metric = schwarzschild_metric(M_SUN)
+    a = np.array([20.0, 40.0, 100.0]) * M_GEOM_SUN
+    weak = periapsis_shift(metric, a, 0.3)
+    metric.r_phi = 1e30  # force direct path
+    strong = periapsis_shift(metric, a, 0.3)
+
+    assert np.allclose(weak, strong, rtol=1e-8)
+
+
+def test_ssz_vectorized():
+    """Arrays of (a, e) and consistency with the metric method"""
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    a = np.geomspace(10, 1e6, 50) * M_GEOM_SUN
+    e = np.linspace(0.0, 0.9, 50)
+    dphi = metric.perihelion_precession_exact(a, e)
+
+    assert dphi.shape == (50,)
+    assert np.all(np.isfinite(dphi))
+    assert np.all(dphi > 0)
+    assert np.isclose(dphi[7], periapsis_shift(metric, a[7], e[7]))
+
+
+def test_mass_scaling():
+    """Δφ depends only on a/M and e"""
+    masses = np.array([1.0, 4.3e6]) * M_SUN
+    a = 1000.0 * M_GEOM_SUN * masses / M_SUN
+    dphi = periapsis_shift_for_masses(masses, a, 0.5)
+
+    assert np.isclose(dphi[0], dphi[1], rtol=1e-10)
+
+
+def test_plunging_orbit_is_nan():
+    """Turning points inside the ISCO region give no bound orbit"""
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    dphi = metric.perihelion_precession_exact(4.0 * M_GEOM_SUN, 0.05)
+
+    assert np.isnan(dphi)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
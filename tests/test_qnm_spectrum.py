@@ -0,0 +1,88 @@
+"""
+Test QNM spectrum solver (WKB 3rd order on the SSZ potential)
+"""
+import sys
+sys.path.insert(0, 'E:/clone/ssz-full-metric')
+
+import numpy as np
+import pytest
+from viz_ssz_metric.unified_metric import UnifiedSSZMetric
+from viz_ssz_metric.qnm_spectrum import QNMSpectrumSolver, wkb_iyer_will, qnm_spectrum
+
+M_SUN = 1.98847e30
+
+
+def test_schwarzschild_reference(schwarzschild_metric):
+    """WKB3 reproduces Iyer & Will (1987) Schwarzschild values"""
+    solver = QNMSpectrumSolver(schwarzschild_metric(M_SUN), spin=2, x_search=(2.5, 20.0))
+    omega = solver.modes([2, 3], [0])[:, 0]
+
+    assert abs(omega[0] - (0.3732 - 0.0892j)) < 2e-3
+    assert abs(omega[1] - (0.5993 - 0.0927j)) < 2e-3
+
+    print(f"[OK] Schwarzschild l=2: {omega[0]:.4f}, l=3: {omega[1]:.4f}")
+
+
+def test_spectrum_shape_and_ordering():
+    """Many (l, n) at once; damping grows with n, frequency with l"""
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    omega = metric.qnm_spectrum([2, 3, 4], [0, 1, 2])
+
+    assert omega.shape == (3, 3)
+    assert np.all(omega.real > 0)
+    assert np.all(omega.imag < 0)
+    assert np.all(np.diff(-omega.imag, axis=1) > 0)
+    assert np.all(np.diff(omega.real[:, 0]) > 0)
+
+    print("[OK] SSZ spectrum l=2..4, n=0..2 computed")
+
+
+def test_wkb_consistency():
+    """quasi_normal_modes_wkb matches the spectrum entry"""
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    omega_r, omega_i = metric.quasi_normal_modes_wkb(l=3, n=1)
+    omega = qnm_spectrum(metric, [3], [1])[0, 0]
+
+    assert np.isclose(omega_r, omega.real)
+    assert np.isclose(omega_i, omega.imag)
+
+
+def test_mass_invariance():
+    """ω·M is mass-invariant (Δ(M) constant for astrophysical masses)"""
+    w1 = UnifiedSSZMetric(mass=M_SUN).qnm_spectrum([2], [0])
+    w2 = UnifiedSSZMetric(mass=1e6 * M_SUN).qnm_spectrum([2], [0])
+
+    assert np.allclose(w1, w2, rtol=1e-6)
+
+    print(f"[OK] Mass invariance: {w1[0, 0]:.4f}")
+
+
+def test_wkb_formula_vectorized():
+    """wkb_iyer_will accepts arrays of overtones"""
+    V = np.array([0.15, 0.0, -0.01, 0.001, 0.0005, 0.0, 0.0])
+    omega = wkb_iyer_will(V, np.arange(4))
+
+    assert omega.shape == (4,)
+    assert np.all(omega.imag < 0)
+
+
+def test_only_damped_modes():
+    """Every returned mode decays; n > l (outside WKB) is NaN"""
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    l_values, n_values = np.arange(2, 7), np.arange(8)
+    for spin in (0, 1, 2):
+        omega = metric.qnm_spectrum(l_values, n_values, spin=spin)
+        finite = np.isfinite(omega)
+
+        assert np.all(omega[finite].imag < 0)
+        assert np.all(omega[finite].real > 0)
+        assert np.all(np.isnan(omega[n_values[None, :] > l_values[:, None]]))
+
+    omega = metric.qnm_spectrum([2], [4, 5])
+    assert np.all(np.isnan(omega))
+
+    print("[OK] Only damped modes returned")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
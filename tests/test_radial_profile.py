@@ -0,0 +1,86 @@
+"""
+Test RadialProfile: one metric evaluation, lazy memoized derived quantities
+"""
+import sys
+sys.path.insert(0, 'E:/clone/ssz-full-metric')
+
+import numpy as np
+from viz_ssz_metric.unified_metric import UnifiedSSZMetric
+from viz_ssz_metric.radial_profile import RadialProfile
+from viz_ssz_metric.metric_backend import MirrorBlendBackend, PostNewtonianBackend
+from viz_ssz_metric.ricci_curvature import ricci_scalar
+from viz_ssz_metric.einstein_tensor import einstein_tensor_diagonal
+from viz_ssz_metric.energy_momentum_tensor import perfect_fluid_decomposition
+from viz_ssz_metric.energy_conditions import check_all_energy_conditions
+from viz_ssz_metric.kretschmann_weyl import kretschmann_scalar_exact
+from viz_ssz_metric.raychaudhuri import raychaudhuri_equation
+
+M_SUN = 1.98847e30
+
+
+class _CountingBackend(PostNewtonianBackend):
+    """PN backend that counts metric evaluations."""
+    calls = 0
+
+    def _evaluate(self, r):
+        type(self).calls += 1
+        return super()._evaluate(r)
+
+
+def test_matches_pointwise_functions():
+    """Profile arrays equal the per-radius module functions"""
+    profile = RadialProfile.in_rs(mass=M_SUN, r_min=3.0, r_max=40.0, num=30)
+    assert len(profile) == 30
+
+    for i in (0, 11, 29):
+        r = profile.r[i]
+        assert np.isclose(profile.ricci_scalar[i], ricci_scalar(M_SUN, r, np.pi / 2), rtol=1e-12)
+        assert np.isclose(profile.einstein[0][i], einstein_tensor_diagonal(M_SUN, r, np.pi / 2)[0],
+                          rtol=1e-12)
+        fluid = perfect_fluid_decomposition(M_SUN, r, np.pi / 2)
+        assert np.isclose(profile.fluid['rho'][i], fluid['rho'], rtol=1e-12)
+        conditions = check_all_energy_conditions(M_SUN, r, np.pi / 2)
+        assert all(profile.energy_conditions[key][i] == conditions[key] for key in conditions)
+        assert np.isclose(profile.invariants['kretschmann'][i],
+                          kretschmann_scalar_exact(M_SUN, r, np.pi / 2), rtol=1e-12)
+        assert np.isclose(profile.raychaudhuri(-1e3)[i],
+                          raychaudhuri_equation(M_SUN, r, np.pi / 2, -1e3), rtol=1e-12)
+
+    print("[OK] Profile matches pointwise functions")
+
+
+def test_single_metric_evaluation():
+    """A, A', A'', B, B' are evaluated once; derived quantities are memoized"""
+    backend = _CountingBackend(M_SUN)
+    r = np.linspace(3, 50, 500) * backend.rs
+    profile = RadialProfile(r, backend=backend)
+    _ = (profile.christoffel, profile.curvature, profile.fluid, profile.energy_conditions,
+         profile.invariants, profile.tidal_eigenvalues, profile.raychaudhuri(-1e3),
+         profile.stress_energy, profile.columns())
+    assert _CountingBackend.calls == 1
+
+    assert profile.fluid is profile.fluid
+    assert profile.raychaudhuri(-1e3) is profile.raychaudhuri(-1e3)
+    assert profile.raychaudhuri(-2e3) is not profile.raychaudhuri(-1e3)
+    print("[OK] Single metric evaluation, memoized derived quantities")
+
+
+def test_strong_field_backends():
+    """Unified and mirror-blend profiles extend inside r_s"""
+    metric = UnifiedSSZMetric(mass=M_SUN)
+    for backend in (metric, MirrorBlendBackend(metric.r_s)):
+        profile = RadialProfile.in_rs(backend, r_min=0.2, r_max=100.0, num=400)
+        columns = profile.columns()
+        assert all(np.shape(v) == (400,) for v in columns.values())
+        assert np.all(np.isfinite(profile.ricci_scalar))
+        assert np.all(profile.time_dilation > 0)
+        assert profile.energy_conditions['NEC'].dtype == bool
+
+    print("[OK] Strong-field profiles")
+
+
+if __name__ == "__main__":
+    test_matches_pointwise_functions()
+    test_single_metric_evaluation()
+    test_strong_field_backends()
+    print("\n[OK] All radial profile tests passed")
@@ -0,0 +1,64 @@
+"""
+Test bootstrap / jackknife uncertainties for validation metrics
+"""
+import os
+import sys
+sys.path.insert(0, 'E:/clone/ssz-full-metric')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'validation'))
+
+import numpy as np
+from eso_validation import validation_statistics
+from resampling import bootstrap, jackknife, row_terms, statistics_from_sums
+
+
+def _sample(n=2000, seed=1):
+    rng = np.random.default_rng(seed)
+    z_obs = rng.uniform(0.1, 1.0, n)
+    z_ssz = z_obs * (1.0 + rng.normal(0.0, 0.05, n))
+    return z_obs, z_ssz
+
+
+def test_point_estimate_matches_validation_statistics():
+    """Summed row terms reproduce validation_statistics"""
+    z_obs, z_ssz = _sample()
+    point = statistics_from_sums(row_terms(z_obs, z_ssz).sum(axis=0), z_obs.size)
+    stats = validation_statistics(z_obs, z_ssz)
+
+    for name in ('accuracy', 'chi_squared_reduced', 'mean', 'rms'):
+        assert np.isclose(point[name], stats[name])
+
+
+def test_bootstrap_reproducible_and_covering():
+    """Fixed seed gives identical replicates (serial vs. pool); CI covers estimate"""
+    z_obs, z_ssz = _sample()
+    terms = row_terms(z_obs, z_ssz)
+    serial = bootstrap(terms, n_replicates=2000, seed=7)
+    parallel = bootstrap(terms, n_replicates=2000, seed=7, jobs=2)
+
+    acc = serial['accuracy']
+    assert np.array_equal(acc['replicates'], parallel['accuracy']['replicates'])
+    assert acc['low'] < acc['estimate'] < acc['high']
+    # Binomial standard error
+    p = acc['estimate']
+    assert np.isclose(acc['std'], np.sqrt(p * (1 - p) / z_obs.size), rtol=0.1)
+
+    print(f"[OK] Bootstrap accuracy {p:.3f} in [{acc['low']:.3f}, {acc['high']:.3f}]")
+
+
+def test_jackknife_leave_one_group_out():
+    """Leave-out values equal statistics recomputed without each group"""
+    z_obs, z_ssz = _sample(300)
+    groups = np.array(['a', 'b', 'c'])[np.arange(z_obs.size) % 3]
+    jack = jackknife(row_terms(z_obs, z_ssz), groups)
+
+    for g in 'abc':
+        keep = groups != g
+        expected = validation_statistics(z_obs[keep], z_ssz[keep])['chi_squared_reduced']
+        assert np.isclose(jack['chi_squared_reduced']['leave_out'][g], expected)
+
+
+if __name__ == "__main__":
+    test_point_estimate_matches_validation_statistics()
+    test_bootstrap_reproducible_and_covering()
+    test_jackknife_leave_one_group_out()
+    print("\n[OK] All resampling tests passed")
@@ -254,6 +254,50 @@ def test_numerical_stability_large_phi(scalar_theory):
     assert abs(Delta) < 1e10
 
 
+def test_array_kernels_match_scalar(scalar_theory):
+    """
+    Test: Array-Auswertung = elementweise Skalar-Auswertung.
+
+    Covers the sech² tail (|phi/phi_cap| > 20).
+    """
+    phi = np.linspace(-300, 300, 401)
+
+    for name in ('Z_parallel', 'dZ_dphi', 'U_potential', 'dU_dphi', 'sech2_stable'):
+        method = getattr(scalar_theory, name)
+        values = method(phi)
+        assert values.shape == phi.shape
+        assert np.allclose(values, [method(x) for x in phi], rtol=1e-14, atol=0), name
+
+    # Overflow-free sech²
+    assert scalar_theory.sech2_stable(1e4) == 0.0
+    assert scalar_theory.sech2_stable(25.0) == pytest.approx(4.0 * np.exp(-50.0), rel=1e-12)
+
+
+def test_stress_energy_arrays(scalar_theory):
+    """
+    Test: Fusionierter Aufruf liefert (rho, p_r, p_t, Delta) auf Gittern.
+    """
+    phi = np.linspace(-5, 5, 50)
+    phi_prime = np.linspace(-2, 2, 50)
+    one_minus = np.linspace(0.2, 1.0, 50)
+
+    fused = scalar_theory.stress_energy_arrays(phi, phi_prime, one_minus)
+    expected = np.array([scalar_theory.stress_energy_tensor(*args)
+                         for args in zip(phi, phi_prime, one_minus)]).T
+
+    for component, reference in zip(fused, expected):
+        assert component.shape == phi.shape
+        assert np.allclose(component, reference, rtol=1e-13, atol=1e-15)
+
+    # Broadcasting: scalar metric factor, (3, 1) x (50,) field grid
+    rho, _, _, Delta = scalar_theory.stress_energy_arrays(phi[None, :], phi_prime[:3, None], 0.9)
+    assert rho.shape == Delta.shape == (3, 50)
+
+    source = scalar_theory.scalar_eom_source(phi, phi_prime, one_minus)
+    assert np.allclose(source, [scalar_theory.scalar_eom_source(*args)
+                                for args in zip(phi, phi_prime, one_minus)])
+
+
 if __name__ == "__main__":
     # Run tests
     pytest.main([__file__, "-v"])
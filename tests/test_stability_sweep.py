@@ -0,0 +1,68 @@
+"""
+Test (λ_A, K, φ) black hole bomb stability sweep
+"""
+import sys
+sys.path.insert(0, 'E:/clone/ssz-full-metric')
+
+import numpy as np
+from viz_ssz_metric.stability_sweep import (SWEEP_DTYPE, SATURATED, DAMPED, UNPHYSICAL,
+                                            StabilitySweep, load_sweep)
+
+
+def _loop(lam, K, phi, steps):
+    """Reference: step-by-step recurrence with Golden Ratio cap."""
+    g = 1.0 + lam - lam**2 * K**2
+    E_max = 1.0 - np.exp(-phi * K)
+    E, first = 1.0, -1
+    for t in range(1, steps):
+        if E * g >= E_max and first < 0:
+            first = t
+        E = min(E * g, E_max)
+    return g, E, first
+
+
+def test_sweep_matches_recurrence():
+    """Every grid point equals the recurrence (status, step, final energy)"""
+    lam = np.logspace(-6, -1, 9)
+    K = np.array([1.0, 2.0, 5.0, 30.0])
+    varphi = np.array([0.3, 1.0, 1.618])
+    grid = StabilitySweep(lam, K, varphi, steps=400).run()
+
+    assert grid.shape == (9, 4, 3)
+    for i, l in enumerate(lam):
+        for j, k in enumerate(K):
+            for m, phi in enumerate(varphi):
+                g, E, first = _loop(l, k, phi, 400)
+                point = grid[i, j, m]
+                if g <= 0:
+                    assert point['status'] == UNPHYSICAL
+                    continue
+                assert point['saturation_step'] == first
+                assert point['status'] == (SATURATED if first >= 0 else DAMPED)
+                if E > 1e-30:
+                    assert np.isclose(point['log10_E'], np.log10(E), atol=1e-5)
+
+    print("[OK] Sweep matches recurrence on 108 grid points")
+
+
+def test_sharded_pool_writes_memmap(tmp_path):
+    """Process-pool shards written to .npy equal the serial in-memory sweep"""
+    sweep = StabilitySweep(np.logspace(-8, -1, 30), np.arange(1, 40), np.linspace(1.2, 2.0, 4))
+    serial = sweep.run()
+    path = str(tmp_path / 'sweep.npy')
+    sweep.run(path, jobs=2, shard_points=1000)
+
+    stored, axes = load_sweep(path)
+    assert stored.dtype == SWEEP_DTYPE
+    assert np.array_equal(axes['K'], sweep.K)
+    for field in SWEEP_DTYPE.names:
+        assert np.array_equal(stored[field], serial[field], equal_nan=True)
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+    test_sweep_matches_recurrence()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_sharded_pool_writes_memmap(Path(tmp))
+    print("\n[OK] All stability sweep tests passed")
@@ -13,6 +13,11 @@ import sys
 import numpy as np
 import matplotlib.pyplot as plt
 
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from viz_ssz_metric.bomb_dynamics import geometric_evolution, growth_factor_segment_damped
+
 # Golden ratio
 PHI = (1 + np.sqrt(5)) / 2
 
@@ -21,23 +26,17 @@ def simulate_continuous_GR(K=100, lambda_A=0.005, steps=10000):
     """
     GR continuous model - explosive energy growth.
     
-    E[t+1] = E[t] × (1 + λ_A)
+    E[t+1] = E[t] × (1 + λ_A)  →  E[t] = (1 + λ_A)^t  (closed form, log space)
     
     Args:
         K: Number of segments (not used in continuous)
-        lambda_A: Coupling constant
+        lambda_A: Coupling constant (scalar or array)
         steps: Time steps
     
     Returns:
-        E: Energy array
+        E: Energy array (*lambda_A.shape, steps)
     """
-    E = np.zeros(steps)
-    E[0] = 1.0
-    
-    for t in range(steps-1):
-        E[t+1] = E[t] * (1 + lambda_A)
-    
-    return E
+    return geometric_evolution(1.0, 1.0 + np.asarray(lambda_A, float), steps)
 
 
 def simulate_discrete_SSZ(K=100, lambda_A=0.005, steps=10000):
@@ -48,26 +47,17 @@ def simulate_discrete_SSZ(K=100, lambda_A=0.005, steps=10000):
     Damping factor: 1 / (1 + lambda_A * K * phi)
     
     Args:
-        K: Number of segments
-        lambda_A: Coupling constant
+        K: Number of segments (scalar or array)
+        lambda_A: Coupling constant (scalar or array, broadcast with K)
         steps: Time steps
     
     Returns:
-        E: Energy array
+        E: Energy array (*broadcast(K, lambda_A).shape, steps)
     """
-    E = np.zeros(steps)
-    E[0] = 1.0
-    
     # SSZ damping through segments
     # Growth in GR: lambda_A
     # Growth in SSZ: lambda_A / (1 + damping)
-    damping_factor = 1 + lambda_A * K * PHI
-    growth_SSZ = lambda_A / damping_factor
-    
-    for t in range(steps-1):
-        E[t+1] = E[t] * (1 + growth_SSZ)
-    
-    return E
+    return geometric_evolution(1.0, growth_factor_segment_damped(lambda_A, K, PHI), steps)
 
 
 def validate():
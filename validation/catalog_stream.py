@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming Catalog Validation - chunked reader + incremental statistics
+
+For multi-GB survey exports:
+- Column-projected, typed CSV reader (only the columns validation needs)
+- Parquet/Feather cache for repeated runs (optional, needs pyarrow)
+- Streaming reducer: χ², residual histogram, per-category accuracy
+  accumulated chunk by chunk, constant memory
+
+© 2025 Carmen Wrede & Lino Casu
+Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
+"""
+import os
+import sys
+import numpy as np
+import pandas as pd
+from scipy.stats import chi2
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from eso_validation import (CATALOG_DTYPES, predict_redshifts, predict_total_redshifts,
+                            prepare_observations)
+
+try:
+    import pyarrow.parquet as pq
+    import pyarrow.ipc as ipc
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+DEFAULT_CHUNKSIZE = 1_000_000
+
+
+def _cache_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ('.parquet', '.pq'):
+        return 'parquet'
+    if ext in ('.feather', '.arrow', '.ipc'):
+        return 'feather'
+    return 'csv'
+
+
+def _require_pyarrow():
+    if not HAS_PYARROW:
+        raise ImportError("Parquet/Feather support requires pyarrow (pip install pyarrow)")
+
+
+def iter_catalog(path, chunksize=DEFAULT_CHUNKSIZE, columns=None):
+    """
+    Iterate over a catalog in chunks with column projection.
+
+    CSV is read with usecols/dtype; Parquet by row groups/batches;
+    Feather (Arrow IPC) by record batches.
+
+    Args:
+        path: .csv, .parquet or .feather file
+        chunksize: Rows per chunk (CSV/Parquet)
+        columns: Columns to keep (default: CATALOG_DTYPES keys present)
+
+    Yields:
+        pandas.DataFrame chunks
+    """
+    wanted = set(CATALOG_DTYPES if columns is None else columns)
+    fmt = _cache_format(path)
+
+    if fmt == 'csv':
+        dtypes = {k: v for k, v in CATALOG_DTYPES.items() if k in wanted}
+        reader = pd.read_csv(path, usecols=lambda c: c in wanted, dtype=dtypes,
+                             chunksize=chunksize)
+        for chunk in reader:
+            yield chunk
+    elif fmt == 'parquet':
+        _require_pyarrow()
+        pf = pq.ParquetFile(path)
+        cols = [c for c in pf.schema_arrow.names if c in wanted]
+        for batch in pf.iter_batches(batch_size=chunksize, columns=cols):
+            yield batch.to_pandas()
+    else:
+        _require_pyarrow()
+        with ipc.open_file(path) as reader:
+            cols = [c for c in reader.schema.names if c in wanted]
+            for i in range(reader.num_record_batches):
+                yield reader.get_batch(i).select(cols).to_pandas()
+
+
+def cache_catalog(csv_path, cache_path=None, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Convert a CSV catalog to a projected Parquet/Feather copy (streamed).
+
+    The cache is reused while it is newer than the CSV.
+
+    Args:
+        csv_path: Source CSV
+        cache_path: Target (.parquet or .feather); default: <csv>.parquet
+        chunksize: Rows per chunk / row group
+
+    Returns:
+        Path of the cache file
+    """
+    _require_pyarrow()
+    import pyarrow as pa
+
+    if cache_path is None:
+        cache_path = os.path.splitext(csv_path)[0] + '.parquet'
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(csv_path):
+        return cache_path
+
+    fmt = _cache_format(cache_path)
+    tmp_path = cache_path + '.tmp'
+    writer = None
+    try:
+        for chunk in iter_catalog(csv_path, chunksize):
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                if fmt == 'parquet':
+                    writer = pq.ParquetWriter(tmp_path, table.schema)
+                else:
+                    writer = ipc.new_file(tmp_path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    os.replace(tmp_path, cache_path)
+    return cache_path
+
+
+class StreamingValidator:
+    """
+    Incremental validation statistics (constant memory).
+
+    Accumulates χ², residual moments, a histogram of relative residuals
+    and per-category match counts; result() gives the same keys as
+    eso_validation.validation_statistics (median from the histogram).
+    """
+
+    def __init__(self, tolerance=0.05, sigma_fraction=0.05,
+                 bins=np.linspace(-1.0, 1.0, 401)):
+        self.tolerance = tolerance
+        self.sigma_fraction = sigma_fraction
+        self.bins = np.asarray(bins, dtype=float)
+        self.histogram = np.zeros(self.bins.size + 1, dtype=np.int64)  # + under/overflow
+        self.n = 0
+        self.matches = 0
+        self.chi_squared = 0.0
+        self.sum_rel = 0.0
+        self.sum_rel2 = 0.0
+        self.categories = {}
+
+    def update(self, z_obs, z_ssz, category=None):
+        """Add one chunk of observations."""
+        z_obs = np.asarray(z_obs, dtype=float)
+        rel = (z_obs - z_ssz) / z_obs
+        match = np.abs(rel) < self.tolerance
+
+        self.n += z_obs.size
+        self.matches += int(np.count_nonzero(match))
+        self.chi_squared += float(np.sum((rel / self.sigma_fraction)**2))
+        self.sum_rel += float(np.sum(rel))
+        self.sum_rel2 += float(np.sum(rel**2))
+        self.histogram += np.bincount(np.searchsorted(self.bins, rel, side='right'),
+                                      minlength=self.histogram.size)
+
+        if category is not None:
+            codes, names = pd.factorize(pd.Series(category).fillna('unknown'))
+            counts = np.bincount(codes, minlength=len(names))
+            hits = np.bincount(codes, weights=match, minlength=len(names))
+            for name, n_cat, m_cat in zip(names, counts, hits):
+                n_old, m_old = self.categories.get(name, (0, 0))
+                self.categories[name] = (n_old + int(n_cat), m_old + int(m_cat))
+
+    def _histogram_median(self):
+        cdf = np.cumsum(self.histogram)
+        k = int(np.searchsorted(cdf, 0.5 * self.n))
+        if k == 0:
+            return float(self.bins[0])
+        if k >= self.bins.size:
+            return float(self.bins[-1])
+        return float(0.5 * (self.bins[k - 1] + self.bins[k]))
+
+    def result(self):
+        """Final statistics dict."""
+        n = max(self.n, 1)
+        dof = max(self.n - 1, 1)
+        mean = self.sum_rel / n
+        return {
+            'chi_squared': self.chi_squared,
+            'dof': dof,
+            'chi_squared_reduced': self.chi_squared / dof,
+            'p_value': float(chi2.sf(self.chi_squared, dof)),
+            'tolerance': self.tolerance,
+            'matches': self.matches,
+            'n': self.n,
+            'accuracy': self.matches / n,
+            'mean': mean,
+            'median': self._histogram_median(),
+            'std': float(np.sqrt(max(self.sum_rel2 / n - mean**2, 0.0))),
+            'rms': float(np.sqrt(self.sum_rel2 / n)),
+            'histogram': (self.bins.copy(), self.histogram.copy()),
+            'category_accuracy': {k: m / c for k, (c, m) in self.categories.items()},
+            'category_counts': {k: c for k, (c, _) in self.categories.items()},
+        }
+
+
+def validate_stream(path, chunksize=DEFAULT_CHUNKSIZE, use_cache=False,
+                    include_doppler=True, **kwargs):
+    """
+    Stream a catalog through the SSZ validation.
+
+    Args:
+        path: Catalog (.csv, .parquet, .feather)
+        chunksize: Rows per chunk
+        use_cache: Convert CSV to a Parquet cache first (needs pyarrow)
+        include_doppler: Add SR Doppler terms from v_los_mps/v_tot_mps
+        **kwargs: Passed to StreamingValidator (tolerance, sigma_fraction, bins)
+
+    Returns:
+        Statistics dict (see StreamingValidator.result)
+    """
+    if use_cache and _cache_format(path) == 'csv':
+        path = cache_catalog(path, chunksize=chunksize)
+
+    validator = StreamingValidator(**kwargs)
+    for chunk in iter_catalog(path, chunksize):
+        df = prepare_observations(chunk)
+        if len(df) == 0:
+            continue
+        if include_doppler:
+            z_ssz = predict_total_redshifts(df['mass_kg'].values, df['radius_m'].values,
+                                            df['v_los_mps'].values, df['v_tot_mps'].values)
+        else:
+            z_ssz = predict_redshifts(df['mass_kg'].values, df['radius_m'].values)
+        category = df['category'].values if 'category' in df.columns else None
+        validator.update(df['z_observed'].values, z_ssz, category)
+    return validator.result()
+
+
+if __name__ == "__main__":
+    data_path = sys.argv[1] if len(sys.argv) > 1 else \
+        os.path.join(os.path.dirname(__file__), '..', 'data', 'real_data_full.csv')
+    stats = validate_stream(data_path)
+    print(f"Observations: {stats['n']}")
+    print(f"Accuracy:     {stats['accuracy']:.3%}")
+    print(f"Chi^2/dof:    {stats['chi_squared_reduced']:.3f}")
+    for name, acc in sorted(stats['category_accuracy'].items()):
+        print(f"  {name:16s} {acc:.3%}  (n={stats['category_counts'][name]})")
@@ -16,25 +16,41 @@ from scipy.stats import chi2
 
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
 
 from viz_ssz_metric.unified_metric import UnifiedSSZMetric
+from viz_ssz_metric.circular_orbits import asymptotic_rs
 
 # Constants
 M_SUN = 1.98847e30  # kg
 M_SGR_A = 4.15e6 * M_SUN  # Sgr A* mass
+C_LIGHT = 2.99792458e8  # m/s
 
+# Columns needed for validation (alternatives mapped in prepare_observations)
+CATALOG_DTYPES = {
+    'z': 'float64', 'redshift': 'float64',
+    'r_emit_m': 'float64', 'r_m': 'float64', 'distance_m': 'float64',
+    'M_solar': 'float64', 'v_los_mps': 'float64', 'v_tot_mps': 'float64',
+    'category': 'str', 'source': 'str', 'case': 'str',
+}
 
-def load_eso_data():
-    """Load ESO S-star observations"""
-    data_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'real_data_full.csv')
+
+def load_eso_data(data_path=None):
+    """
+    Load ESO S-star observations (only the columns validation needs).
+    
+    For large catalogs use catalog_stream.validate_stream instead.
+    """
+    if data_path is None:
+        data_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'real_data_full.csv')
     
     if not os.path.exists(data_path):
         raise FileNotFoundError(f"ESO data not found at {data_path}")
     
-    df = pd.read_csv(data_path)
+    df = pd.read_csv(data_path, usecols=lambda c: c in CATALOG_DTYPES,
+                     dtype=CATALOG_DTYPES)
     
-    print(f"Loaded {len(df)} observations")
-    print(f"Columns: {list(df.columns)}")
+    print(f"Loaded {len(df)} observations ({len(df.columns)} columns)")
     
     return df
 
@@ -43,28 +59,103 @@ def compute_ssz_redshift(metric, r):
     """
     SSZ gravitational redshift prediction.
     
-    z = sqrt(1/A(r)) - 1
+    z = sqrt(1/A(r)) - 1  (r scalar or array)
     """
-    A = metric.metric_function_A(r)
+    A = metric.metric_function_A_array(r)
     z_ssz = np.sqrt(1.0 / A) - 1.0
     return z_ssz
 
 
-def validate():
+def predict_redshifts(mass_kg, r):
     """
-    Main validation function.
+    Vectorized SSZ redshift for per-row masses.
+    
+    Rows are grouped by mass; each group is one array call to A(r).
+    For r_s > asymptotic_rs(metric), Δ(M) is constant and A depends only on
+    r/(GM/c²), so all such rows share one reference metric (r rescaled).
+    
+    Args:
+        mass_kg: Masses [kg] (array)
+        r: Emission radii [m] (array, same shape)
     
     Returns:
-        accuracy: Fraction of observations matching within 5%
-        chi_squared_reduced: χ²/dof
+        z_ssz (array)
     """
-    print("\n" + "="*80)
-    print("ESO S-STARS VALIDATION - SSZ vs. Observations")
-    print("="*80)
+    mass_kg, r = np.broadcast_arrays(np.asarray(mass_kg, float), np.asarray(r, float))
+    z_ssz = np.empty(mass_kg.shape)
+    
+    reference = UnifiedSSZMetric(mass=float(mass_kg.max()))
+    G, c = reference.params.G, reference.params.c
+    asymptotic = 2.0 * G * mass_kg / c**2 > asymptotic_rs(reference)
+    if np.any(asymptotic):
+        r_scaled = r[asymptotic] * (reference.params.mass / mass_kg[asymptotic])
+        z_ssz[asymptotic] = compute_ssz_redshift(reference, r_scaled)
+    
+    masses, inverse = np.unique(mass_kg[~asymptotic], return_inverse=True)
+    if masses.size:
+        r_small = r[~asymptotic]
+        z_small = np.empty(r_small.shape)
+        order = np.argsort(inverse, kind='stable')
+        bounds = np.searchsorted(inverse[order], np.arange(masses.size + 1))
+        for k, M in enumerate(masses):
+            rows = order[bounds[k]:bounds[k + 1]]
+            z_small[rows] = compute_ssz_redshift(UnifiedSSZMetric(mass=float(M)), r_small[rows])
+        z_ssz[~asymptotic] = z_small
     
-    # Load data
-    df = load_eso_data()
+    return z_ssz
+
+
+def kinematic_redshift(v_los, v_tot):
+    """
+    Special-relativistic Doppler redshift (column-wise).
+    
+    1 + z_kin = γ (1 + v_los/c),  γ = 1/sqrt(1 - v_tot²/c²)
+    
+    v_los > 0 means recession. v_tot is raised to |v_los| where the
+    catalog is inconsistent; v_tot ≥ c gives NaN.
+    
+    Args:
+        v_los: Line-of-sight velocity [m/s]
+        v_tot: Total velocity [m/s]
     
+    Returns:
+        z_kin (array)
+    """
+    beta_los = np.asarray(v_los, float) / C_LIGHT
+    beta_tot = np.maximum(np.asarray(v_tot, float) / C_LIGHT, np.abs(beta_los))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        gamma = 1.0 / np.sqrt(1.0 - beta_tot**2)
+    return gamma * (1.0 + beta_los) - 1.0
+
+
+def predict_total_redshifts(mass_kg, r, v_los=0.0, v_tot=0.0):
+    """
+    Full SSZ prediction: gravitational × kinematic redshift per row.
+    
+    1 + z = (1 + z_grav) (1 + z_kin)
+    
+    Args:
+        mass_kg: Masses [kg] (array)
+        r: Emission radii [m]
+        v_los: Line-of-sight velocities [m/s]
+        v_tot: Total velocities [m/s]
+    
+    Returns:
+        z_ssz (array)
+    """
+    z_grav = predict_redshifts(mass_kg, r)
+    z_kin = kinematic_redshift(v_los, v_tot)
+    return (1.0 + z_grav) * (1.0 + z_kin) - 1.0
+
+
+def prepare_observations(df):
+    """
+    Map column names and filter valid rows.
+    
+    Returns:
+        DataFrame with z_observed, radius_m, mass_kg
+        (and v_los_mps, v_tot_mps with missing velocities set to 0)
+    """
     # Check and map column names
     if 'z' in df.columns:
         df['z_observed'] = df['z']
@@ -78,69 +169,153 @@ def validate():
     elif 'distance_m' in df.columns:
         df['radius_m'] = df['distance_m']
     
+    # Per-row mass (fallback: Sgr A*)
+    if 'M_solar' in df.columns:
+        df['mass_kg'] = df['M_solar'] * M_SUN
+    else:
+        df['mass_kg'] = M_SGR_A
+    
+    # Kinematics (missing = at rest)
+    for column in ('v_los_mps', 'v_tot_mps'):
+        if column in df.columns:
+            df[column] = df[column].fillna(0.0)
+        else:
+            df[column] = 0.0
+    
     # Filter valid data
-    df = df.dropna(subset=['z_observed', 'radius_m'])
-    df = df[df['radius_m'] > 0]
-    df = df[df['z_observed'] > 0]
+    df = df.dropna(subset=['z_observed', 'radius_m', 'mass_kg'])
+    df = df[(df['radius_m'] > 0) & (df['z_observed'] > 0) & (df['mass_kg'] > 0)]
+    return df
+
+
+def validation_statistics(z_obs, z_ssz, tolerance=0.05, sigma_fraction=0.05):
+    """
+    Residuals, χ² and accuracy (all NumPy, no Python loops).
+    
+    Args:
+        z_obs: Observed redshifts
+        z_ssz: Predicted redshifts
+        tolerance: Relative tolerance for a match
+        sigma_fraction: Assumed uncertainty as fraction of z_obs
+    
+    Returns:
+        dict with chi_squared, dof, chi_squared_reduced, p_value,
+        matches, accuracy and residual statistics
+    """
+    z_obs = np.asarray(z_obs, float)
+    residuals = z_obs - z_ssz
+    relative_residuals = residuals / z_obs
+    
+    sigma = sigma_fraction * z_obs
+    chi_squared = float(np.sum((residuals / sigma)**2))
+    dof = max(z_obs.size - 1, 1)
+    
+    matches = int(np.count_nonzero(np.abs(relative_residuals) < tolerance))
+    
+    return {
+        'chi_squared': chi_squared,
+        'dof': dof,
+        'chi_squared_reduced': chi_squared / dof,
+        'p_value': float(chi2.sf(chi_squared, dof)),
+        'tolerance': tolerance,
+        'matches': matches,
+        'n': z_obs.size,
+        'accuracy': matches / z_obs.size,
+        'mean': float(np.mean(relative_residuals)),
+        'median': float(np.median(relative_residuals)),
+        'std': float(np.std(relative_residuals)),
+        'rms': float(np.sqrt(np.mean(relative_residuals**2))),
+    }
+
+
+def validate(df=None, n_bootstrap=10_000, seed=None, jobs=1, include_doppler=True):
+    """
+    Main validation function.
+    
+    Args:
+        df: Optional observations DataFrame (default: real_data_full.csv)
+        n_bootstrap: Bootstrap replicates for confidence intervals (0 = off)
+        seed: Resampling seed (default: resampling.DEFAULT_SEED)
+        jobs: Processes for the bootstrap
+        include_doppler: Add SR Doppler terms from v_los_mps/v_tot_mps
+            (full observed redshift instead of only the gravitational part)
+    
+    Returns:
+        accuracy: Fraction of observations matching within 5%
+        chi_squared_reduced: χ²/dof
+    """
+    print("\n" + "="*80)
+    print("ESO S-STARS VALIDATION - SSZ vs. Observations")
+    print("="*80)
+    
+    # Load data
+    if df is None:
+        df = load_eso_data()
+    df = prepare_observations(df)
     
     print(f"\nValid observations after filtering: {len(df)}")
     
     if len(df) < 100:
         print("[WARN] Less than 100 valid observations!")
     
-    # Create SSZ metric for Sgr A*
-    print(f"\nSgr A* Parameters:")
-    print(f"  Mass: {M_SGR_A/M_SUN:.2e} Msun")
+    masses = df['mass_kg'].values
+    print(f"\nMass groups: {np.unique(masses).size} "
+          f"({masses.min()/M_SUN:.2e} - {masses.max()/M_SUN:.2e} Msun)")
     
-    metric = UnifiedSSZMetric(mass=M_SGR_A)
-    print(f"  r_s: {metric.r_s/1e9:.3f} Gm")
-    print(f"  r_phi: {metric.r_phi/1e9:.3f} Gm")
-    
-    # Compute SSZ predictions
+    # Compute SSZ predictions (grouped by mass, one array call per group)
     print("\nComputing SSZ predictions...")
     z_obs = df['z_observed'].values
-    r_vals = df['radius_m'].values
-    
-    z_ssz = np.array([compute_ssz_redshift(metric, r) for r in r_vals])
+    if include_doppler:
+        z_ssz = predict_total_redshifts(masses, df['radius_m'].values,
+                                        df['v_los_mps'].values, df['v_tot_mps'].values)
+        print("  Gravitational + SR Doppler (v_los, v_tot)")
+    else:
+        z_ssz = predict_redshifts(masses, df['radius_m'].values)
+        print("  Gravitational only")
     
     # Statistics
     print("\nStatistical Analysis:")
+    stats = validation_statistics(z_obs, z_ssz)
+    accuracy = stats['accuracy']
+    chi_squared_reduced = stats['chi_squared_reduced']
     
-    # Residuals
-    residuals = z_obs - z_ssz
-    relative_residuals = residuals / z_obs
-    
-    # Chi-squared
-    # Assuming uncertainty ~5% of observed value
-    sigma = 0.05 * z_obs
-    chi_squared = np.sum((residuals / sigma)**2)
-    dof = len(z_obs) - 1
-    chi_squared_reduced = chi_squared / dof
-    
-    print(f"  Chi^2 = {chi_squared:.2f}")
-    print(f"  dof = {dof}")
+    print(f"  Chi^2 = {stats['chi_squared']:.2f}")
+    print(f"  dof = {stats['dof']}")
     print(f"  Chi^2/dof = {chi_squared_reduced:.3f}")
-    
-    # p-value
-    p_value = 1 - chi2.cdf(chi_squared, dof)
-    print(f"  p-value = {p_value:.4f}")
-    
-    # Accuracy (within 5% tolerance)
-    tolerance = 0.05
-    matches = np.abs(relative_residuals) < tolerance
-    accuracy = np.sum(matches) / len(z_obs)
+    print(f"  p-value = {stats['p_value']:.4f}")
     
     print(f"\nAccuracy Metrics:")
-    print(f"  Tolerance: {tolerance*100}%")
-    print(f"  Matches: {np.sum(matches)}/{len(z_obs)}")
+    print(f"  Tolerance: {stats['tolerance']*100}%")
+    print(f"  Matches: {stats['matches']}/{stats['n']}")
     print(f"  Accuracy: {accuracy:.3%}")
     
     # Residual statistics
     print(f"\nResidual Statistics:")
-    print(f"  Mean: {np.mean(relative_residuals):.4f}")
-    print(f"  Median: {np.median(relative_residuals):.4f}")
-    print(f"  Std: {np.std(relative_residuals):.4f}")
-    print(f"  RMS: {np.sqrt(np.mean(relative_residuals**2)):.4f}")
+    print(f"  Mean: {stats['mean']:.4f}")
+    print(f"  Median: {stats['median']:.4f}")
+    print(f"  Std: {stats['std']:.4f}")
+    print(f"  RMS: {stats['rms']:.4f}")
+    
+    # Resampling uncertainties (bootstrap + jackknife by category/source)
+    if n_bootstrap > 0:
+        from resampling import DEFAULT_SEED, bootstrap, jackknife, row_terms
+        
+        terms = row_terms(z_obs, z_ssz)
+        boot = bootstrap(terms, n_bootstrap,
+                         DEFAULT_SEED if seed is None else seed, jobs=jobs)
+        print(f"\nBootstrap ({n_bootstrap} replicates, 95% CI):")
+        print(f"  Accuracy: [{boot['accuracy']['low']:.3%}, {boot['accuracy']['high']:.3%}]")
+        print(f"  Chi^2/dof: [{boot['chi_squared_reduced']['low']:.3f}, "
+              f"{boot['chi_squared_reduced']['high']:.3f}]")
+        
+        for column in ('category', 'source'):
+            if column in df.columns and df[column].nunique(dropna=False) > 1:
+                jack = jackknife(terms, df[column].values)
+                print(f"\nJackknife by {column} ({df[column].nunique(dropna=False)} groups):")
+                print(f"  Accuracy: {jack['accuracy']['estimate']:.3%} "
+                      f"+/- {jack['accuracy']['std']:.3%}")
+                print(f"  Chi^2/dof: {jack['chi_squared_reduced']['estimate']:.3f} "
+                      f"+/- {jack['chi_squared_reduced']['std']:.3f}")
     
     # Results
     print("\n" + "="*80)
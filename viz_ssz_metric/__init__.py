@@ -39,6 +39,7 @@ from .ssz_mirror_metric import (
     A_GR,
     
     # Mirror-Blend (starkes Feld)
+    u_star,
     solve_r_star,
     A_safe,
     B_safe,
@@ -58,6 +59,16 @@ from .ssz_mirror_metric import (
     curvature_proxy,
 )
 
+# Metrik-Backends (A, A', A'', B, B' für die Krümmungs-Module)
+from .metric_backend import (
+    MetricBackend,
+    PostNewtonianBackend,
+    UnifiedMetricBackend,
+    MirrorBlendBackend,
+    as_backend,
+)
+from .radial_profile import RadialProfile
+
 __all__ = [
     # Main interface (recommended)
     "UnifiedSSZMetric",
@@ -75,6 +86,7 @@ __all__ = [
     "A_GR",
     
     # Mirror-Blend
+    "u_star",
     "solve_r_star",
     "A_safe",
     "B_safe",
@@ -92,4 +104,12 @@ __all__ = [
     "D_from_A",
     "redshift_from_A",
     "curvature_proxy",
+    
+    # Metric backends
+    "MetricBackend",
+    "PostNewtonianBackend",
+    "UnifiedMetricBackend",
+    "MirrorBlendBackend",
+    "as_backend",
+    "RadialProfile",
 ]
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+Dünne Akkretionsscheibe auf der SSZ-Metrik (Novikov-Thorne-artig)
+
+1. Kreisbahnen aus V_eff (circular_orbits.py): Ω, E, L, ISCO
+2. Strahlungsfluss F(r) nach Page & Thorne (1974) für statische Metriken
+3. Gebündelter Ray-Tracer: u'' = -u A + A'/2  (u = 1/x, B = 1/A),
+   RK4 in φ für alle Pixel gleichzeitig, Tabellen-Interpolation der Kraft
+4. Rotverschiebung g = 1 / [u^t (1 - Ω b sin i cos α)]
+5. Bilder (bolometrisch, spektral) und Linienprofile; parallel über Bildkacheln
+
+Einheiten: x = r/(GM/c²), Bildschirm-Koordinaten (X, Y) in GM/c²,
+Fluss in Ṁ c⁶/(G²M²), Frequenzen in k T_ref / h.
+
+Referenzen:
+    Page & Thorne (1974), ApJ 191, 499
+    Luminet (1979), A&A 75, 228
+
+© 2025 Carmen Wrede & Lino Casu
+Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
+"""
+from __future__ import annotations
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Sequence, Tuple
+
+try:
+    from .circular_orbits import CircularOrbitAnalysis
+except ImportError:
+    from circular_orbits import CircularOrbitAnalysis
+
+
+class ThinDiskModel:
+    """
+    Geometrisch dünne, optisch dicke Scheibe in der Äquatorebene.
+
+    Verwendung:
+    >>> disk = ThinDiskModel(metric, inclination_deg=60.0)
+    >>> result = disk.image(n_pix=256, fov=25.0, jobs=4)
+    >>> result['intensity'].shape
+    (256, 256)
+    >>> g_bins, profile = disk.line_profile(n_pix=256, fov=25.0)
+    """
+
+    def __init__(self, metric, inclination_deg: float = 60.0,
+                 r_in: Optional[float] = None, r_out: float = 50.0,
+                 n_radial: int = 4000, n_steps: int = 256):
+        """
+        Initialize disk model.
+
+        Args:
+            metric: UnifiedSSZMetric instance
+            inclination_deg: Inklination (0 = face-on)
+            r_in: Innenrand in GM/c² (default: ISCO)
+            r_out: Außenrand in GM/c²
+            n_radial: Radiale Gitterpunkte für F(r)
+            n_steps: RK4-Schritte pro Strahl
+        """
+        self.metric = metric
+        self.orbits = CircularOrbitAnalysis.for_metric(metric)
+        self.inclination = np.radians(inclination_deg)
+        self.r_in = self.orbits.isco if r_in is None else float(r_in)
+        self.r_out = float(r_out)
+        if not (self.r_in < self.r_out):
+            raise ValueError(f"r_in ({self.r_in}) must be < r_out ({self.r_out})")
+        self.n_steps = n_steps
+        self.x_capture = self.orbits.photon_sphere
+
+        self._tabulate_disk(n_radial)
+        self._tabulate_force()
+
+    # ---------------------------------------------------------- Scheibe
+
+    def _tabulate_disk(self, n_radial: int) -> None:
+        """Ω, u^t und Page-Thorne-Fluss auf dem radialen Gitter."""
+        x = np.geomspace(self.r_in, self.r_out, n_radial)
+        A, dA = self.orbits.f(x), self.orbits.df(x)
+        Omega = np.sqrt(dA / (2.0 * x))
+        E = np.sqrt(self.orbits.E2_circular(x))
+        L = np.sqrt(self.orbits.L2_circular(x))
+
+        dOmega = np.gradient(Omega, x)
+        dL = np.gradient(L, x)
+        integrand = (E - Omega * L) * dL
+        integral = np.concatenate(([0.0], np.cumsum(
+            0.5 * (integrand[1:] + integrand[:-1]) * np.diff(x))))
+        F = -dOmega / (4.0 * np.pi * x * (E - Omega * L)**2) * integral
+
+        self.x_disk = x
+        self.Omega_disk = Omega
+        self.ut_disk = 1.0 / np.sqrt(A - x**2 * Omega**2)
+        self.flux_disk = np.maximum(F, 0.0)
+        self.T_ref = float(np.max(self.flux_disk))**0.25
+
+    def flux(self, x) -> np.ndarray:
+        """Page-Thorne-Fluss F(x) (0 außerhalb der Scheibe)."""
+        return np.interp(x, self.x_disk, self.flux_disk, left=0.0, right=0.0)
+
+    def temperature(self, x) -> np.ndarray:
+        """Lokale Temperatur T(x)/T_ref mit T ∝ F^(1/4)."""
+        return self.flux(x)**0.25 / self.T_ref
+
+    def redshift_factor(self, x, b, cos_alpha) -> np.ndarray:
+        """
+        g = ν_obs/ν_emit für Emission bei x, Stoßparameter b, Bildwinkel α.
+
+        Args:
+            x: Emissionsradius (GM/c²)
+            b: Stoßparameter (GM/c²)
+            cos_alpha: cos des Bildschirm-Polarwinkels (X-Achse = Bahnrichtung)
+
+        Returns:
+            g (NaN außerhalb der Scheibe)
+        """
+        Omega = np.interp(x, self.x_disk, self.Omega_disk, left=np.nan, right=np.nan)
+        ut = np.interp(x, self.x_disk, self.ut_disk, left=np.nan, right=np.nan)
+        return 1.0 / (ut * (1.0 - Omega * b * np.sin(self.inclination) * cos_alpha))
+
+    # ---------------------------------------------------------- Ray-Tracing
+
+    def _tabulate_force(self, n_table: int = 20000) -> None:
+        """Tabelle der Kraft u'' = -u A(1/u) + A'(1/u)/2 bis zum Lichtring."""
+        u = np.linspace(0.0, 1.0 / self.x_capture, n_table)
+        x = 1.0 / np.maximum(u, 1e-12)
+        self.u_table = u
+        self.force_table = -u * self.orbits.f(x) + 0.5 * self.orbits.df(x)
+        self.force_table[0] = 0.0
+
+    def _force(self, u: np.ndarray) -> np.ndarray:
+        return np.interp(u, self.u_table, self.force_table)
+
+    def trace(self, X: np.ndarray, Y: np.ndarray, order: int = 0) -> np.ndarray:
+        """
+        Emissionsradius für Bildschirm-Punkte (X, Y), vektorisiert.
+
+        Der Strahl überstreicht γ + nπ bis zur Äquatorebene
+        (cos γ = -sin α sin i / sqrt(cos² i + sin² α sin² i)).
+        Strahlen innerhalb des Lichtrings gelten als eingefangen.
+
+        Args:
+            X, Y: Bildschirm-Koordinaten in GM/c² (beliebige Form)
+            order: Bildordnung (0 = primär, 1 = sekundär)
+
+        Returns:
+            x_emit in GM/c² (NaN: kein Treffer der Scheibe)
+        """
+        X = np.asarray(X, dtype=float)
+        Y = np.asarray(Y, dtype=float)
+        b = np.hypot(X, Y)
+        alpha = np.arctan2(Y, X)
+        si, ci = np.sin(self.inclination), np.cos(self.inclination)
+        gamma = np.arccos(-np.sin(alpha) * si / np.sqrt(ci**2 + (np.sin(alpha) * si)**2))
+        gamma = gamma + order * np.pi
+
+        u = np.zeros_like(b)
+        du = 1.0 / np.where(b > 0, b, np.inf)
+        h = gamma / self.n_steps
+        alive = b > 0
+        u_capture = 1.0 / self.x_capture
+        for _ in range(self.n_steps):
+            k1u, k1v = du, self._force(u)
+            k2u, k2v = du + 0.5 * h * k1v, self._force(u + 0.5 * h * k1u)
+            k3u, k3v = du + 0.5 * h * k2v, self._force(u + 0.5 * h * k2u)
+            k4u, k4v = du + h * k3v, self._force(u + h * k3u)
+            u = u + h / 6.0 * (k1u + 2.0 * k2u + 2.0 * k3u + k4u)
+            du = du + h / 6.0 * (k1v + 2.0 * k2v + 2.0 * k3v + k4v)
+            # Entkommen (u < 0) oder eingefangen (innerhalb Lichtring)
+            alive &= (u > 0) & (u < u_capture)
+
+        x_emit = np.where(alive, 1.0 / np.where(u > 0, u, 1.0), np.nan)
+        on_disk = (x_emit >= self.r_in) & (x_emit <= self.r_out)
+        return np.where(on_disk, x_emit, np.nan)
+
+    # ---------------------------------------------------------- Bilder
+
+    def screen(self, n_pix: int, fov: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Pixel-Mittelpunkte (X, Y) für ein n_pix × n_pix Bild mit Halbbreite fov."""
+        edges = np.linspace(-fov, fov, n_pix + 1)
+        centers = 0.5 * (edges[1:] + edges[:-1])
+        X, Y = np.meshgrid(centers, centers[::-1])
+        return X, Y
+
+    def render_points(self, X: np.ndarray, Y: np.ndarray,
+                      orders: Sequence[int] = (0, 1)) -> Dict[str, np.ndarray]:
+        """
+        Bolometrische Intensität I = g⁴ F(x) für beliebige Bildpunkte.
+
+        Args:
+            X, Y: Bildschirm-Koordinaten in GM/c²
+            orders: Summierte Bildordnungen
+
+        Returns:
+            Dict mit 'intensity', 'g', 'x_emit' (Werte der primären Ordnung
+            für g/x_emit, wo vorhanden, sonst der nächsten)
+        """
+        b = np.hypot(X, Y)
+        cos_alpha = np.divide(X, b, out=np.zeros_like(b), where=b > 0)
+        intensity = np.zeros_like(b)
+        g_out = np.full_like(b, np.nan)
+        x_out = np.full_like(b, np.nan)
+        for order in orders:
+            x_emit = self.trace(X, Y, order)
+            g = self.redshift_factor(x_emit, b, cos_alpha)
+            hit = np.isfinite(g)
+            intensity[hit] += g[hit]**4 * self.flux(x_emit[hit])
+            fill = hit & np.isnan(g_out)
+            g_out[fill] = g[fill]
+            x_out[fill] = x_emit[fill]
+        return {'intensity': intensity, 'g': g_out, 'x_emit': x_out}
+
+    def image(self, n_pix: int = 256, fov: float = 25.0, orders: Sequence[int] = (0, 1),
+              tiles: int = 1, jobs: int = 1) -> Dict[str, np.ndarray]:
+        """
+        Bolometrisches Bild, optional parallel über Zeilen-Kacheln.
+
+        Args:
+            n_pix: Pixel pro Achse
+            fov: Halbe Bildbreite in GM/c²
+            orders: Bildordnungen (0 = primär, 1 = sekundär)
+            tiles: Anzahl Kacheln (default: jobs)
+            jobs: Prozesse (1 = seriell)
+
+        Returns:
+            Dict mit 'intensity', 'g', 'x_emit' (n_pix, n_pix) und 'X', 'Y'
+        """
+        X, Y = self.screen(n_pix, fov)
+        tiles = max(tiles, jobs, 1)
+        bounds = np.linspace(0, n_pix, tiles + 1).astype(int)
+        tasks = [(self, X[a:b], Y[a:b], tuple(orders)) for a, b in zip(bounds[:-1], bounds[1:])]
+        if jobs > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                parts = list(pool.map(_render_tile, tasks))
+        else:
+            parts = [_render_tile(task) for task in tasks]
+        result = {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+        result['X'], result['Y'] = X, Y
+        return result
+
+    def spectral_image(self, nu: Sequence[float], image: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Spektrales Bild I_ν = g³ B_ν(ν/g, T(x)) für viele Frequenzen.
+
+        Args:
+            nu: Beobachtete Frequenzen in k T_ref / h
+            image: Ergebnis von image() (primäre Ordnung für g, x_emit)
+
+        Returns:
+            Array (len(nu), n_pix, n_pix)
+        """
+        nu = np.asarray(nu, dtype=float)[:, None, None]
+        g = image['g'][None]
+        T = self.temperature(np.nan_to_num(image['x_emit']))[None]
+        hit = np.isfinite(g) & (T > 0)
+        g_safe = np.where(hit, g, 1.0)
+        T_safe = np.where(hit, T, 1.0)
+        with np.errstate(over='ignore'):
+            B = (nu / g_safe)**3 / np.expm1(np.minimum(nu / (g_safe * T_safe), 700.0))
+        return np.where(hit, g_safe**3 * B, 0.0)
+
+    def line_profile(self, n_pix: int = 256, fov: float = 25.0, q: float = 3.0,
+                     bins: int = 200, g_range: Tuple[float, float] = (0.3, 1.6),
+                     image: Optional[Dict[str, np.ndarray]] = None,
+                     jobs: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Emissionslinien-Profil F(g) mit Emissivität ε ∝ x^(-q).
+
+        F_ν ∝ Σ_pixel g³ ε(x) ΔΩ, histogrammiert in g = ν/ν0.
+
+        Args:
+            n_pix: Pixel pro Achse (falls image nicht gegeben)
+            fov: Halbe Bildbreite in GM/c²
+            q: Emissivitäts-Index
+            bins: Anzahl g-Bins
+            g_range: Bereich von g
+            image: Vorhandenes Ergebnis von image() (spart Ray-Tracing)
+            jobs: Prozesse für das Ray-Tracing
+
+        Returns:
+            (g_centers, profile) mit auf 1 normiertem Maximum
+        """
+        if image is None:
+            image = self.image(n_pix=n_pix, fov=fov, orders=(0,), jobs=jobs)
+        g, x = image['g'], image['x_emit']
+        hit = np.isfinite(g)
+        weights = g[hit]**3 * x[hit]**(-q)
+        profile, edges = np.histogram(g[hit], bins=bins, range=g_range, weights=weights)
+        if profile.max() > 0:
+            profile = profile / profile.max()
+        return 0.5 * (edges[1:] + edges[:-1]), profile
+
+    def ring_radius(self, image: Dict[str, np.ndarray]) -> float:
+        """Intensitätsgewichteter mittlerer Bildradius (GM/c²)."""
+        b = np.hypot(image['X'], image['Y'])
+        I = image['intensity']
+        return float(np.sum(b * I) / np.sum(I)) if np.sum(I) > 0 else np.nan
+
+
+def _render_tile(task) -> Dict[str, np.ndarray]:
+    """Worker für ProcessPoolExecutor (muss modulweit picklebar sein)."""
+    model, X, Y, orders = task
+    return model.render_points(X, Y, orders)
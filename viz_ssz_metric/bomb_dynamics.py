@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+Black Hole Bomb - Geschlossene Form der Energie-Rekursion
+
+Die Rekursion
+
+    E_{t+1} = min(E_t · g, E_max),   E_0 gegeben
+
+hat für g > 0 die exakte Lösung (t ≥ 1)
+
+    E_t = min(E_0 g^t, E_max · min(1, g)^(t-1))
+
+(für g ≥ 1 bleibt E nach dem Erreichen von E_max dort; für g < 1
+zerfällt ein gekapptes E weiter mit g). Ausgewertet in log-Raum:
+log E_t = log E_0 + t log g, daher kein Überlauf für 10^4 Schritte
+und beliebige (λ_A, K)-Gitter in einem Aufruf.
+
+Wachstumsfaktoren:
+    SSZ-Metrik (energy_evolution_black_hole_bomb):  g = 1 + λ_A - λ_A² K²
+    Segment-Dämpfung (validation/black_hole_bomb):  g = 1 + λ_A / (1 + λ_A K φ)
+    GR kontinuierlich:                               g = 1 + λ_A
+
+g ≤ 0 (λ_A² K² ≥ 1 + λ_A, weit jenseits λ_crit = 1/K²) ist kein
+Wachstumsprozess mehr → NaN.
+
+© 2025 Carmen Wrede & Lino Casu
+Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
+"""
+from __future__ import annotations
+import numpy as np
+from typing import Dict
+
+PHI = (1.0 + np.sqrt(5.0)) / 2.0
+
+
+def growth_factor_ssz(lambda_A, K):
+    """g = 1 + λ_A - λ_A² K² (UnifiedSSZMetric.energy_evolution_black_hole_bomb)."""
+    lambda_A = np.asarray(lambda_A, float)
+    return 1.0 + lambda_A - lambda_A**2 * np.asarray(K, float)**2
+
+
+def growth_factor_segment_damped(lambda_A, K, phi=PHI):
+    """g = 1 + λ_A / (1 + λ_A K φ) (diskretes SSZ-Modell der Validierung)."""
+    lambda_A = np.asarray(lambda_A, float)
+    return 1.0 + lambda_A / (1.0 + lambda_A * np.asarray(K, float) * phi)
+
+
+def saturation_energy(E_initial, K, phi=PHI):
+    """Golden-Ratio-Sättigung E_max = E_0 (1 - exp(-φK))."""
+    return np.asarray(E_initial, float) * (1.0 - np.exp(-phi * np.asarray(K, float)))
+
+
+def log_energy_at(t, log_E0, log_g, log_E_max=None):
+    """
+    log E_t der gekappten geometrischen Rekursion (vektorisiert).
+
+    Args:
+        t: Schritt(e) ≥ 0 (broadcast)
+        log_E0: log E_0
+        log_g: log g (g > 0)
+        log_E_max: log E_max oder None (ungekappt)
+
+    Returns:
+        log E_t
+    """
+    t = np.asarray(t, float)
+    log_E = log_E0 + t * log_g
+    if log_E_max is None:
+        return log_E
+    capped = log_E_max + (t - 1.0) * np.minimum(log_g, 0.0)
+    return np.where(t > 0, np.minimum(log_E, capped), log_E0)
+
+
+def first_saturation_step(log_E0, log_g, log_E_max, t_final) -> np.ndarray:
+    """
+    Erster Schritt mit aktiver Kappung (geschlossene Form, -1 falls nie).
+
+    Kappung ab t = 1, falls E_0 g ≥ E_max; sonst nur für g > 1 bei
+    t = ceil(log(E_max/E_0) / log g). Danach ändert sich für g ≥ 1 nichts
+    mehr - die Zeitentwicklung kann dort abgebrochen werden.
+
+    Args:
+        log_E0, log_g, log_E_max: Logarithmen (broadcast; log_g NaN für g ≤ 0)
+        t_final: Letzter betrachteter Schritt
+
+    Returns:
+        int-Array der Sättigungsschritte
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        at_once = log_E0 + log_g >= log_E_max
+        t_sat = np.where(at_once, 1.0,
+                         np.where(log_g > 0, np.ceil((log_E_max - log_E0) / log_g), np.inf))
+    return np.where(np.isfinite(t_sat) & (t_sat <= t_final), t_sat, -1).astype(int)
+
+
+def geometric_evolution(E_initial, growth_factor, steps: int, E_max=None,
+                        log: bool = False) -> np.ndarray:
+    """
+    Trajektorien E_0..E_{steps-1} für beliebig geformte g (und E_max).
+
+    Args:
+        E_initial: E_0 (> 0, broadcast mit g)
+        growth_factor: g (Array)
+        steps: Anzahl Zeitschritte
+        E_max: Kappung (broadcast mit g) oder None
+        log: log E statt E zurückgeben (kein Überlauf)
+
+    Returns:
+        Array (*g.shape, steps); NaN für g ≤ 0
+    """
+    g = np.asarray(growth_factor, float)
+    E0 = np.asarray(E_initial, float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_g = np.where(g > 0, np.log(np.where(g > 0, g, 1.0)), np.nan)[..., None]
+        log_E0 = np.log(E0)[..., None]
+        log_E_max = None if E_max is None else np.log(np.asarray(E_max, float))[..., None]
+    t = np.arange(steps)
+    log_E = log_energy_at(t, log_E0, log_g, log_E_max)
+    if log:
+        return log_E
+    with np.errstate(over='ignore'):
+        return np.exp(log_E)
+
+
+def energy_evolution(E_initial, lambda_A, K, steps: int = 1000, phi: float = PHI,
+                     log: bool = False) -> np.ndarray:
+    """
+    SSZ-Metrik-Rekursion für Arrays von (λ_A, K), gekappt bei E_max.
+
+    Args:
+        E_initial: E_0
+        lambda_A: Kopplung(en)
+        K: Segment-Anzahl(en) (broadcast mit λ_A)
+        steps: Zeitschritte
+        phi: Golden Ratio
+        log: log E zurückgeben
+
+    Returns:
+        Array (*broadcast(λ_A, K).shape, steps)
+    """
+    g = growth_factor_ssz(lambda_A, K)
+    E_max = saturation_energy(E_initial, K, phi)
+    E0 = np.broadcast_to(np.asarray(E_initial, float), g.shape)
+    return geometric_evolution(E0, g, steps, E_max=np.broadcast_to(E_max, g.shape), log=log)
+
+
+def stability_phase_diagram(lambda_A, K, steps: int = 10000, E_initial: float = 1.0,
+                            phi: float = PHI) -> Dict[str, np.ndarray]:
+    """
+    Stabilitäts-Phasendiagramm über ein (λ_A, K)-Gitter in einem Aufruf.
+
+    Nur Endwerte in geschlossener Form - keine Zeitachse im Speicher,
+    daher auch für große Gitter × 10^4 Schritte.
+
+    Args:
+        lambda_A: 1D-Array der Kopplungen
+        K: 1D-Array der Segment-Anzahlen
+        steps: Zeitschritte (Endzeit t = steps - 1)
+        E_initial: E_0
+        phi: Golden Ratio
+
+    Returns:
+        dict mit (len(λ_A), len(K))-Arrays:
+        lambda_A, K (Gitter), lambda_crit, stable (λ_A < 1/K²),
+        growth_ssz, growth_damped, growth_gr,
+        log10_E_ssz (gekappte Metrik-Rekursion), log10_E_damped, log10_E_gr,
+        log10_eta (= log10 E_GR/E_damped), saturation_step
+        (erster Schritt mit aktiver Kappung, -1 falls nie)
+    """
+    lam, KK = np.meshgrid(np.asarray(lambda_A, float), np.asarray(K, float), indexing='ij')
+    t_final = steps - 1
+    log_E0 = np.log(E_initial)
+    ln10 = np.log(10.0)
+
+    g_ssz = growth_factor_ssz(lam, KK)
+    g_damped = growth_factor_segment_damped(lam, KK, phi)
+    g_gr = 1.0 + lam
+    E_max = saturation_energy(E_initial, KK, phi)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_g_ssz = np.where(g_ssz > 0, np.log(np.where(g_ssz > 0, g_ssz, 1.0)), np.nan)
+        log_E_max = np.log(E_max)
+        log_E_ssz = log_energy_at(t_final, log_E0, log_g_ssz, log_E_max)
+        log_E_damped = log_E0 + t_final * np.log1p(g_damped - 1.0)
+        log_E_gr = log_E0 + t_final * np.log1p(lam)
+
+    saturation_step = first_saturation_step(log_E0, log_g_ssz, log_E_max, t_final)
+
+    return {
+        'lambda_A': lam,
+        'K': KK,
+        'lambda_crit': 1.0 / KK**2,
+        'stable': lam < 1.0 / KK**2,
+        'growth_ssz': g_ssz,
+        'growth_damped': g_damped,
+        'growth_gr': g_gr,
+        'log10_E_ssz': log_E_ssz / ln10,
+        'log10_E_damped': log_E_damped / ln10,
+        'log10_E_gr': log_E_gr / ln10,
+        'log10_eta': (log_E_gr - log_E_damped) / ln10,
+        'saturation_step': saturation_step,
+    }
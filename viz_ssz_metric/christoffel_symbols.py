@@ -15,30 +15,32 @@ from __future__ import annotations
 import numpy as np
 import math
 from typing import Tuple
-from .ssz_mirror_metric import (
-    metric_functions_pn, schwarzschild_radius, G_DEFAULT, C_DEFAULT
-)
+from .ssz_mirror_metric import schwarzschild_radius, G_DEFAULT, C_DEFAULT
+from .metric_backend import resolve_backend
 
 
-def dA_dr_numerical(mass: float, r: float, dr: float = 1e-3) -> float:
+def dA_dr_numerical(mass: float, r: float, dr: float = 1e-3, backend=None) -> float:
     """Numerische Ableitung von A(r).
     
     dA/dr ≈ (A(r+dr) - A(r-dr)) / (2·dr)
     
+    (Referenz für Tests; die Module verwenden die analytischen
+    Ableitungen des Metrik-Backends.)
+    
     Args:
         mass: Masse in kg
         r: Radius in m
         dr: Finite-difference Schritt
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         dA/dr
     """
-    A_plus, _ = metric_functions_pn(mass, r + dr)
-    A_minus, _ = metric_functions_pn(mass, r - dr)
-    return (A_plus - A_minus) / (2 * dr)
+    b = resolve_backend(mass, backend)
+    return (b.A(r + dr) - b.A(r - dr)) / (2 * dr)
 
 
-def dB_dr_numerical(mass: float, r: float, dr: float = 1e-3) -> float:
+def dB_dr_numerical(mass: float, r: float, dr: float = 1e-3, backend=None) -> float:
     """Numerische Ableitung von B(r) = 1/A(r).
     
     dB/dr = -dA/dr / A²
@@ -47,16 +49,17 @@ def dB_dr_numerical(mass: float, r: float, dr: float = 1e-3) -> float:
         mass: Masse in kg
         r: Radius in m
         dr: Finite-difference Schritt
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         dB/dr
     """
-    A, _ = metric_functions_pn(mass, r)
-    dA = dA_dr_numerical(mass, r, dr)
+    A = resolve_backend(mass, backend).A(r)
+    dA = dA_dr_numerical(mass, r, dr, backend)
     return -dA / (A**2)
 
 
-def christoffel_nonzero(mass: float, r: float, theta: float) -> dict:
+def christoffel_nonzero(mass: float, r: float, theta: float, backend=None) -> dict:
     """Berechne nicht-triviale Christoffel-Symbole für SSZ-Metrik.
     
     Für statische, sphärisch-symmetrische Metrik g_μν = diag(-A, B, r², r²sin²θ)
@@ -81,15 +84,16 @@ def christoffel_nonzero(mass: float, r: float, theta: float) -> dict:
     
     Args:
         mass: Masse in kg
-        r: Radius in m
-        theta: Polwinkel in Radiant
+        r: Radius in m (scalar or array)
+        theta: Polwinkel in Radiant (broadcast mit r)
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         dict mit Christoffel-Symbolen
     """
-    A, B = metric_functions_pn(mass, r)
-    dA = dA_dr_numerical(mass, r)
-    dB = dB_dr_numerical(mass, r)
+    f = resolve_backend(mass, backend).functions(r)
+    A, B, dA, dB = f.A, f.B, f.dA, f.dB
+    sin_t, cos_t = np.sin(theta), np.cos(theta)
     
     # Zeitartige
     Gamma_t_tr = dA / (2 * A)
@@ -98,15 +102,15 @@ def christoffel_nonzero(mass: float, r: float, theta: float) -> dict:
     # Radiale
     Gamma_r_rr = dB / (2 * B)
     Gamma_r_thth = -r / B
-    Gamma_r_phph = -r * (math.sin(theta)**2) / B
+    Gamma_r_phph = -r * (sin_t**2) / B
     
     # Polare
     Gamma_th_rth = 1.0 / r
-    Gamma_th_phph = -math.sin(theta) * math.cos(theta)
+    Gamma_th_phph = -sin_t * cos_t
     
     # Azimuthale
     Gamma_ph_rph = 1.0 / r
-    cot_theta = math.cos(theta) / math.sin(theta) if math.sin(theta) > 1e-10 else 0
+    cot_theta = np.where(sin_t > 1e-10, cos_t / np.where(sin_t == 0, 1.0, sin_t), 0.0)[()]
     Gamma_ph_thph = cot_theta
     
     return {
@@ -134,7 +138,8 @@ def christoffel_nonzero(mass: float, r: float, theta: float) -> dict:
 
 
 def geodesic_acceleration(mass: float, r: float, theta: float, 
-                         v_r: float, v_theta: float, v_phi: float) -> Tuple[float, float, float]:
+                         v_r: float, v_theta: float, v_phi: float,
+                         backend=None) -> Tuple[float, float, float]:
     """Berechne Beschleunigung entlang Geodäte.
     
     Geodätengleichung: d²x^μ/dλ² = -Γ^μ_νρ (dx^ν/dλ)(dx^ρ/dλ)
@@ -143,11 +148,12 @@ def geodesic_acceleration(mass: float, r: float, theta: float,
         mass: Masse in kg
         r, theta: Position (m, rad)
         v_r, v_theta, v_phi: Geschwindigkeiten (m/s, rad/s, rad/s)
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         Tuple (a_r, a_theta, a_phi) Beschleunigungen
     """
-    gamma = christoffel_nonzero(mass, r, theta)
+    gamma = christoffel_nonzero(mass, r, theta, backend)
     
     # Radiale Beschleunigung
     a_r = -(
@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+"""
+Kreisbahnen im effektiven Potential der SSZ-Metrik
+
+Zeitartige Geodäten in der statischen Metrik ds² = -A dt² + B dr² + r² dΩ²:
+
+    V_eff(r; L) = A(r) · (1 + L²/r²)
+
+Kreisbahn (V' = 0):     L_c²(r) = r³ A' / (2A - r A')
+                        E_c²(r) = 2 A² / (2A - r A')
+Stabilität:             V'' > 0  ⇔  dL_c²/dr > 0
+Photonensphäre:         2A - r A' = 0
+ISCO:                   Minimum von L_c²(r)
+Marginal gebunden:      E_c = 1
+
+Alle Größen dimensionslos: x = r/(GM/c²), L in GM/c.
+Die Analyse läuft auf einem logarithmischen Radialgitter, zerlegt L_c²
+in monotone Äste und löst L_c(x) = L für beliebig viele L gleichzeitig
+(searchsorted + vektorisierte Regula Falsi). Cache pro Metrik-Signatur.
+
+© 2025 Carmen Wrede & Lino Casu
+Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
+"""
+from __future__ import annotations
+import numpy as np
+from typing import Dict, List, Tuple
+
+try:
+    from .qnm_spectrum import metric_signature
+except ImportError:
+    from qnm_spectrum import metric_signature
+
+
+# Cache: Metrik-Signatur -> CircularOrbitAnalysis
+_ORBIT_CACHE: Dict[tuple, "CircularOrbitAnalysis"] = {}
+
+def clear_cache() -> None:
+    """Leere den Kreisbahn-Cache."""
+    _ORBIT_CACHE.clear()
+
+
+def asymptotic_rs(metric) -> float:
+    """
+    r_s [m], oberhalb dessen Δ(M) = B in Maschinengenauigkeit gilt.
+
+    A·exp(-α r_s) < ε·B/4 (unter einer halben Einheit der letzten Stelle
+    von B)  ⇔  r_s > ln(4A / (ε B)) / α  mit (A, α, B) = params.delta_coefficients.
+    Darüber ist Δ(M) == B exakt und alle Massen teilen sich dieselbe
+    dimensionslose Analyse (in GM/c²).
+
+    Args:
+        metric: Metrik mit params.delta_coefficients
+
+    Returns:
+        Schwelle in Metern (inf, falls Δ(M) nie konstant wird)
+    """
+    A, alpha, B = metric.params.delta_coefficients
+    if A == 0:
+        return 0.0
+    if B == 0 or alpha <= 0:
+        return np.inf
+    return float(np.log(4.0 * abs(A) / (np.finfo(float).eps * abs(B))) / alpha)
+
+
+def _roots_bisect(func, lo: np.ndarray, hi: np.ndarray, iterations: int = 50) -> np.ndarray:
+    """
+    Vektorisierte Bisektion für viele Intervalle gleichzeitig.
+
+    Args:
+        func: Vektorisierte Funktion g(x) mit Vorzeichenwechsel in [lo, hi]
+        lo, hi: Intervallgrenzen (Arrays gleicher Form)
+        iterations: Anzahl Halbierungen
+
+    Returns:
+        Nullstellen (gleiche Form wie lo)
+    """
+    lo = np.array(lo, dtype=float)
+    hi = np.array(hi, dtype=float)
+    g_lo = func(lo)
+    for _ in range(iterations):
+        mid = 0.5 * (lo + hi)
+        g_mid = func(mid)
+        left = np.sign(g_mid) == np.sign(g_lo)
+        lo = np.where(left, mid, lo)
+        g_lo = np.where(left, g_mid, g_lo)
+        hi = np.where(left, hi, mid)
+    return 0.5 * (lo + hi)
+
+
+def _roots_regula_falsi(func, lo: np.ndarray, hi: np.ndarray, g_lo: np.ndarray,
+                        g_hi: np.ndarray, iterations: int = 4) -> np.ndarray:
+    """
+    Vektorisierte Illinois-Regula-Falsi mit bekannten Klammerwerten.
+
+    Für feine Gitterklammern konvergiert das in wenigen Schritten;
+    deutlich billiger als Bisektion für Millionen von Nullstellen.
+
+    Args:
+        func: Vektorisierte Funktion g(x)
+        lo, hi: Intervallgrenzen
+        g_lo, g_hi: g(lo), g(hi) mit entgegengesetztem Vorzeichen
+        iterations: Anzahl Schritte
+
+    Returns:
+        Nullstellen (gleiche Form wie lo)
+    """
+    lo, hi = np.array(lo, dtype=float), np.array(hi, dtype=float)
+    g_lo, g_hi = np.array(g_lo, dtype=float), np.array(g_hi, dtype=float)
+    for _ in range(iterations):
+        denom = g_hi - g_lo
+        x = np.where(denom != 0, hi - g_hi * (hi - lo) / np.where(denom != 0, denom, 1.0),
+                     0.5 * (lo + hi))
+        g = func(x)
+        left = np.sign(g) == np.sign(g_lo)
+        # Illinois: Gewicht der festgehaltenen Seite halbieren
+        g_hi = np.where(left, g_hi * 0.5, g)
+        hi = np.where(left, hi, x)
+        g_lo = np.where(left, g, g_lo * 0.5)
+        lo = np.where(left, x, lo)
+    denom = g_hi - g_lo
+    return np.where(denom != 0, hi - g_hi * (hi - lo) / np.where(denom != 0, denom, 1.0),
+                    0.5 * (lo + hi))
+
+
+def _sign_change_roots(x: np.ndarray, g: np.ndarray, func, rising=None) -> np.ndarray:
+    """Alle Nullstellen von g auf dem Gitter, verfeinert mit Bisektion."""
+    valid = np.isfinite(g[:-1]) & np.isfinite(g[1:])
+    change = valid & (np.sign(g[:-1]) != np.sign(g[1:])) & (g[:-1] != 0)
+    if rising is not None:
+        change &= (g[1:] > g[:-1]) if rising else (g[1:] < g[:-1])
+    idx = np.nonzero(change)[0]
+    if idx.size == 0:
+        return np.empty(0)
+    return _roots_bisect(func, x[idx], x[idx + 1])
+
+
+class CircularOrbitAnalysis:
+    """
+    Alle Kreisbahnen einer SSZ-Metrik aus V_eff(r; L).
+
+    Verwendung:
+    >>> orbits = CircularOrbitAnalysis.for_metric(metric)
+    >>> orbits.isco, orbits.photon_sphere, orbits.marginally_bound   # in GM/c²
+    >>> x_stable, x_unstable = orbits.orbit_radii(L=np.linspace(3.5, 10, 10**6))
+    """
+
+    def __init__(self, metric, x_min: float = 1.0, x_max: float = 1e4,
+                 n_grid: int = 20000):
+        """
+        Initialize analysis (prefer for_metric() for caching).
+
+        Args:
+            metric: UnifiedSSZMetric instance (braucht metric_function_A_array)
+            x_min: Innerer Gitterrand (in GM/c²)
+            x_max: Äußerer Gitterrand (in GM/c²); begrenzt L ≲ sqrt(x_max)
+            n_grid: Anzahl Gitterpunkte (logarithmisch)
+        """
+        # Referenz-Metrik nur für A(x); die Ergebnisse gelten (in GM/c²)
+        # für alle Massen mit derselben Signatur
+        self.metric = metric
+        p = metric.params
+        self._M_ref = p.G * p.mass / p.c**2
+
+        self.x = np.geomspace(x_min, x_max, n_grid)
+        self.A = self.f(self.x)
+        self.dA = self.df(self.x)
+        self.L2 = self.L2_circular(self.x)
+        self.dL2 = np.gradient(self.L2, self.x)
+
+        self.light_rings = _sign_change_roots(self.x, self._D(self.x), self._D)
+        self.marginally_stable = _sign_change_roots(self.x, self.dL2, self._dL2)
+        self.branches = self._monotone_branches()
+
+        # Äußerste Lichtring-/ISCO-/E=1-Lösungen (Schwarzschild-artige Struktur)
+        unstable_rings = [x for x in self.light_rings if self._dD(x) > 0]
+        self.photon_sphere = float(max(unstable_rings)) if unstable_rings else np.nan
+        isco = [x for x in self.marginally_stable
+                if self._dL2(x * (1 + 1e-6)) > 0 and x > np.nan_to_num(self.photon_sphere)]
+        self.isco = float(max(isco)) if isco else np.nan
+        mb = _sign_change_roots(self.x, self._E2_minus_1(self.x), self._E2_minus_1)
+        mb = mb[(mb > self.photon_sphere) & (mb < self.isco)]
+        self.marginally_bound = float(mb.max()) if mb.size else np.nan
+
+    @classmethod
+    def for_metric(cls, metric, **kwargs) -> "CircularOrbitAnalysis":
+        """
+        Gecachte Analyse (pro dimensionsloser Metrik-Signatur).
+
+        Args:
+            metric: UnifiedSSZMetric instance
+            **kwargs: Gitter-Parameter (siehe __init__)
+
+        Returns:
+            CircularOrbitAnalysis
+        """
+        key = (metric_signature(metric),) + tuple(sorted(kwargs.items()))
+        if key not in _ORBIT_CACHE:
+            _ORBIT_CACHE[key] = cls(metric, **kwargs)
+        return _ORBIT_CACHE[key]
+
+    # ---------------------------------------------------------------- Basis
+
+    def f(self, x) -> np.ndarray:
+        """A(x) mit x = r/M (vektorisiert)."""
+        return self.metric.metric_function_A_array(np.asarray(x, float) * self._M_ref)
+
+    def df(self, x) -> np.ndarray:
+        """dA/dx (zentrale Differenz, relative Schrittweite)."""
+        x = np.asarray(x, float)
+        h = 1e-6 * x
+        return (self.f(x + h) - self.f(x - h)) / (2.0 * h)
+
+    def _D(self, x) -> np.ndarray:
+        """2A - xA' (Nullstellen = Lichtringe)."""
+        return 2.0 * self.f(x) - x * self.df(x)
+
+    def _dD(self, x, h: float = 1e-5) -> float:
+        return float((self._D(x + h) - self._D(x - h)) / (2.0 * h))
+
+    def L2_circular(self, x) -> np.ndarray:
+        """
+        L_c²(x) der Kreisbahn bei x (NaN wo keine zeitartige Kreisbahn existiert).
+
+        Args:
+            x: Radius in GM/c²
+
+        Returns:
+            L² in (GM/c)²
+        """
+        x = np.asarray(x, float)
+        A, dA = self.f(x), self.df(x)
+        D = 2.0 * A - x * dA
+        with np.errstate(divide='ignore', invalid='ignore'):
+            L2 = x**3 * dA / D
+        return np.where((D > 0) & (dA > 1e-12), L2, np.nan)
+
+    def E2_circular(self, x) -> np.ndarray:
+        """E_c²(x) der Kreisbahn (NaN wo keine existiert)."""
+        x = np.asarray(x, float)
+        A, dA = self.f(x), self.df(x)
+        D = 2.0 * A - x * dA
+        with np.errstate(divide='ignore', invalid='ignore'):
+            E2 = 2.0 * A**2 / D
+        return np.where((D > 0) & (dA > 1e-12), E2, np.nan)
+
+    def _dL2(self, x) -> np.ndarray:
+        x = np.asarray(x, float)
+        h = 1e-5 * x
+        return (self.L2_circular(x + h) - self.L2_circular(x - h)) / (2.0 * h)
+
+    def _E2_minus_1(self, x) -> np.ndarray:
+        return self.E2_circular(x) - 1.0
+
+    def effective_potential(self, x, L) -> np.ndarray:
+        """
+        V_eff(x; L) = A(x)(1 + L²/x²), broadcast über x und L.
+
+        Args:
+            x: Radius in GM/c²
+            L: Spezifischer Drehimpuls in GM/c
+
+        Returns:
+            V_eff (dimensionslos)
+        """
+        x = np.asarray(x, float)
+        L = np.asarray(L, float)
+        return self.f(x) * (1.0 + L**2 / x**2)
+
+    def stability(self, x) -> np.ndarray:
+        """
+        d²V_eff/dx² bei L = L_c(x), vektorisiert.
+
+        Args:
+            x: Radius in GM/c²
+
+        Returns:
+            V'' (> 0 stabil, < 0 instabil, NaN keine Kreisbahn)
+        """
+        x = np.asarray(x, float)
+        L2 = self.L2_circular(x)
+        h = 1e-4 * x
+        V = lambda y: self.f(y) * (1.0 + L2 / y**2)
+        return (V(x + h) - 2.0 * V(x) + V(x - h)) / h**2
+
+    # ---------------------------------------------------------- Kreisbahnen
+
+    def _monotone_branches(self) -> List[Tuple[np.ndarray, np.ndarray, bool]]:
+        """Zerlege L_c²(x) in monotone Äste: (x, L², stabil)."""
+        branches = []
+        finite = np.isfinite(self.L2)
+        edges = np.flatnonzero(np.diff(np.r_[0, finite.astype(int), 0]))
+        for start, stop in zip(edges[::2], edges[1::2]):
+            seg_x, seg_L2 = self.x[start:stop], self.L2[start:stop]
+            if seg_x.size < 2:
+                continue
+            step = np.sign(np.diff(seg_L2))
+            cuts = np.flatnonzero(step[1:] != step[:-1]) + 1
+            for a, b in zip(np.r_[0, cuts], np.r_[cuts, seg_x.size - 1]):
+                if b > a and step[a] != 0:
+                    branches.append((seg_x[a:b + 1], seg_L2[a:b + 1], bool(step[a] > 0)))
+        return branches
+
+    def circular_orbits(self, L) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Alle Kreisbahnen für viele L auf einmal.
+
+        Args:
+            L: Spezifische Drehimpulse in GM/c (Array)
+
+        Returns:
+            (x_orbits, stable) mit Form (len(L), n_branches);
+            x_orbits ist NaN wo der Ast L nicht erreicht
+        """
+        L2 = np.atleast_1d(np.asarray(L, dtype=float))**2
+        out = np.full((L2.size, len(self.branches)), np.nan)
+        stable = np.zeros(len(self.branches), dtype=bool)
+        for k, (bx, bL2, is_stable) in enumerate(self.branches):
+            stable[k] = is_stable
+            ordered = bL2 if is_stable else bL2[::-1]
+            hit = (L2 >= ordered[0]) & (L2 <= ordered[-1])
+            if not np.any(hit):
+                continue
+            j = np.clip(np.searchsorted(ordered, L2[hit]), 1, ordered.size - 1)
+            if not is_stable:
+                j = bx.size - j
+            # In 1/L² lösen: regulär am Lichtring, wo L_c² divergiert
+            target = 1.0 / L2[hit]
+            out[hit, k] = _roots_regula_falsi(
+                lambda y, t=target: 1.0 / self.L2_circular(y) - t,
+                bx[j - 1], bx[j], 1.0 / bL2[j - 1] - target, 1.0 / bL2[j] - target
+            )
+        return out, np.broadcast_to(stable, out.shape)
+
+    def orbit_radii(self, L) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Äußerste stabile und instabile Kreisbahn für jedes L.
+
+        Args:
+            L: Spezifische Drehimpulse in GM/c
+
+        Returns:
+            (x_stable, x_unstable) in GM/c² (NaN wenn nicht vorhanden)
+        """
+        x_orb, stable = self.circular_orbits(L)
+        with np.errstate(invalid='ignore'):
+            x_stable = np.nanmax(np.where(stable, x_orb, np.nan), axis=1, initial=-np.inf)
+            x_unstable = np.nanmax(np.where(~stable, x_orb, np.nan), axis=1, initial=-np.inf)
+        x_stable[np.isinf(x_stable)] = np.nan
+        x_unstable[np.isinf(x_unstable)] = np.nan
+        return x_stable, x_unstable
+
+    def is_stable(self, x) -> np.ndarray:
+        """
+        Stabilität der Kreisbahn bei x (d²V_eff/dx² > 0).
+
+        Args:
+            x: Radius in GM/c² (scalar or array)
+
+        Returns:
+            Bool-Array (False wo keine Kreisbahn existiert)
+        """
+        return np.nan_to_num(self.stability(x), nan=-1.0) > 0
+
+
+def circular_orbit_radii(masses, L, metric_factory=None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stabile/instabile Kreisbahn-Radien [m] für viele (Masse, L)-Paare.
+
+    Massen werden nach Metrik-Signatur gruppiert: für r_s > asymptotic_rs
+    ist Δ(M) konstant und eine Analyse (in GM/c²) gilt für alle.
+
+    Args:
+        masses: Massen [kg] (Array)
+        L: Spezifische Drehimpulse in GM/c (gleiche Form wie masses)
+        metric_factory: Callable mass -> Metrik (default: UnifiedSSZMetric)
+
+    Returns:
+        (r_stable, r_unstable) in Metern
+    """
+    if metric_factory is None:
+        try:
+            from .unified_metric import UnifiedSSZMetric
+        except ImportError:
+            from unified_metric import UnifiedSSZMetric
+        metric_factory = lambda m: UnifiedSSZMetric(mass=float(m))
+
+    masses, L = np.broadcast_arrays(np.asarray(masses, float), np.asarray(L, float))
+    masses, L = masses.ravel(), L.ravel()
+    x_stable = np.full(masses.size, np.nan)
+    x_unstable = np.full(masses.size, np.nan)
+
+    reference = metric_factory(masses.max())
+    G, c = reference.params.G, reference.params.c
+    r_s = 2.0 * G * masses / c**2
+    asymptotic = r_s > asymptotic_rs(reference)
+    groups = [(asymptotic, reference)]
+    for m in np.unique(masses[~asymptotic]):
+        groups.append((masses == m, metric_factory(m)))
+
+    for mask, metric in groups:
+        if np.any(mask):
+            orbits = CircularOrbitAnalysis.for_metric(metric)
+            x_stable[mask], x_unstable[mask] = orbits.orbit_radii(L[mask])
+
+    M_geom = G * masses / c**2
+    return x_stable * M_geom, x_unstable * M_geom
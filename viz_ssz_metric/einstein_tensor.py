@@ -15,11 +15,11 @@ from __future__ import annotations
 import numpy as np
 import math
 from typing import Tuple
-from .ricci_curvature import ricci_tensor_diagonal, ricci_scalar
-from .ssz_mirror_metric import metric_functions_pn, schwarzschild_radius, G_DEFAULT, C_DEFAULT
+from .ricci_curvature import curvature_components
+from .ssz_mirror_metric import schwarzschild_radius, G_DEFAULT, C_DEFAULT
 
 
-def einstein_tensor_diagonal(mass: float, r: float, theta: float) -> Tuple[float, float, float, float]:
+def einstein_tensor_diagonal(mass: float, r: float, theta: float, backend=None) -> Tuple[float, float, float, float]:
     """Berechne Einstein-Tensor G_μν = R_μν - (1/2) g_μν R.
     
     Dies ist die linke Seite der Einstein-Feldgleichungen.
@@ -31,27 +31,17 @@ def einstein_tensor_diagonal(mass: float, r: float, theta: float) -> Tuple[float
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         Tuple (G_tt, G_rr, G_θθ, G_φφ)
     """
-    # Metrik
-    A, B = metric_functions_pn(mass, r)
-    
-    # Ricci-Größen
-    R_tt, R_rr, R_thth, R_phph = ricci_tensor_diagonal(mass, r, theta)
-    R = ricci_scalar(mass, r, theta)
-    
-    # Einstein-Tensor G_μν = R_μν - (1/2) g_μν R
-    G_tt = R_tt - (1.0/2.0) * (-A) * R     # g_tt = -A
-    G_rr = R_rr - (1.0/2.0) * B * R        # g_rr = B
-    G_thth = R_thth - (1.0/2.0) * (r**2) * R  # g_θθ = r²
-    G_phph = R_phph - (1.0/2.0) * (r**2 * math.sin(theta)**2) * R  # g_φφ = r²sin²θ
-    
-    return G_tt, G_rr, G_thth, G_phph
+    # Geschlossene Form (ricci_curvature.diagonal_curvature)
+    c = curvature_components(mass, r, theta, backend)
+    return c['G_tt'], c['G_rr'], c['G_thth'], c['G_phph']
 
 
-def einstein_tensor_trace(mass: float, r: float, theta: float) -> float:
+def einstein_tensor_trace(mass: float, r: float, theta: float, backend=None) -> float:
     """Spur des Einstein-Tensors G^μ_μ = g^μν G_μν.
     
     In 4D: G^μ_μ = -R (aus Kontraktion)
@@ -62,15 +52,15 @@ def einstein_tensor_trace(mass: float, r: float, theta: float) -> float:
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         G^μ_μ (Spur)
     """
-    R = ricci_scalar(mass, r, theta)
-    return -R
+    return -curvature_components(mass, r, theta, backend)['R']
 
 
-def effective_stress_energy_tensor(mass: float, r: float, theta: float) -> Tuple[float, float, float, float]:
+def effective_stress_energy_tensor(mass: float, r: float, theta: float, backend=None) -> Tuple[float, float, float, float]:
     """Effektiver Energie-Impuls-Tensor T_μν aus Einstein-Gleichungen.
     
     T_μν = (c⁴/8πG) G_μν
@@ -81,11 +71,12 @@ def effective_stress_energy_tensor(mass: float, r: float, theta: float) -> Tuple
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         Tuple (T_tt, T_rr, T_θθ, T_φφ)
     """
-    G_tt, G_rr, G_thth, G_phph = einstein_tensor_diagonal(mass, r, theta)
+    G_tt, G_rr, G_thth, G_phph = einstein_tensor_diagonal(mass, r, theta, backend)
     
     # Kopplungskonstante c⁴/(8πG)
     coupling = (C_DEFAULT**4) / (8 * math.pi * G_DEFAULT)
@@ -98,10 +89,32 @@ def effective_stress_energy_tensor(mass: float, r: float, theta: float) -> Tuple
     return T_tt, T_rr, T_thth, T_phph
 
 
-def energy_density_from_einstein(mass: float, r: float, theta: float) -> float:
+def fluid_from_curvature(components: dict) -> dict:
+    """Dichte und Drücke aus den gemischten Einstein-Komponenten.
+    
+    Für einen statischen Beobachter:
+    ρc² = -(c⁴/8πG) G^t_t,  p_r = (c⁴/8πG) G^r_r,
+    p_θ = (c⁴/8πG) G^θ_θ,   p_φ = (c⁴/8πG) G^φ_φ
+    
+    Args:
+        components: dict aus ricci_curvature.curvature_components
+    
+    Returns:
+        dict mit Keys 'rho' (kg/m³), 'p_r', 'p_theta', 'p_phi' (Pa)
+    """
+    coupling = (C_DEFAULT**4) / (8 * math.pi * G_DEFAULT)
+    return {
+        'rho': -coupling * components['G^t_t'] / C_DEFAULT**2,
+        'p_r': coupling * components['G^r_r'],
+        'p_theta': coupling * components['G^th_th'],
+        'p_phi': coupling * components['G^ph_ph'],
+    }
+
+
+def energy_density_from_einstein(mass: float, r: float, theta: float, backend=None) -> float:
     """Energie-Dichte ρ aus Einstein-Tensor.
     
-    ρ = (c⁴/8πG) G_tt / c² = (c²/8πG) G_tt
+    ρ = -(c⁴/8πG) G^t_t / c² = -(c²/8πG) G^t_t
     
     (In Einheiten kg/m³)
     
@@ -109,41 +122,32 @@ def energy_density_from_einstein(mass: float, r: float, theta: float) -> float:
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         ρ (Energie-Dichte in kg/m³)
     """
-    G_tt, _, _, _ = einstein_tensor_diagonal(mass, r, theta)
-    
-    # ρ = (c²/8πG) G_tt
-    rho = ((C_DEFAULT**2) / (8 * math.pi * G_DEFAULT)) * G_tt
-    
-    return rho
+    c = curvature_components(mass, r, theta, backend)
+    return fluid_from_curvature(c)['rho']
 
 
-def pressure_from_einstein(mass: float, r: float, theta: float) -> Tuple[float, float, float]:
+def pressure_from_einstein(mass: float, r: float, theta: float, backend=None) -> Tuple[float, float, float]:
     """Druck-Komponenten aus Einstein-Tensor.
     
-    p_r = (c⁴/8πG) G_rr  (radialer Druck)
-    p_t = (c⁴/8πG) G_θθ  (tangentialer Druck)
+    p_r = (c⁴/8πG) G^r_r  (radialer Druck)
+    p_t = (c⁴/8πG) G^θ_θ  (tangentialer Druck)
     
     Args:
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         Tuple (p_r, p_theta, p_phi) in Pascal
     """
-    _, G_rr, G_thth, G_phph = einstein_tensor_diagonal(mass, r, theta)
-    
-    coupling = (C_DEFAULT**4) / (8 * math.pi * G_DEFAULT)
-    
-    p_r = coupling * G_rr
-    p_theta = coupling * G_thth / (r**2)  # Normalisiert
-    p_phi = coupling * G_phph / (r**2 * math.sin(theta)**2)  # Normalisiert
-    
-    return p_r, p_theta, p_phi
+    fluid = fluid_from_curvature(curvature_components(mass, r, theta, backend))
+    return fluid['p_r'], fluid['p_theta'], fluid['p_phi']
 
 
 def demo():
@@ -17,24 +17,54 @@ Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
 from __future__ import annotations
 import numpy as np
 from typing import Dict, List
-from .energy_momentum_tensor import perfect_fluid_decomposition
+from .energy_momentum_tensor import perfect_fluid_decomposition, fluid_decomposition_from_curvature
+from .ricci_curvature import curvature_components
 from .ssz_mirror_metric import schwarzschild_radius, PHI
+from .metric_backend import resolve_backend
 
 
-def check_all_energy_conditions(mass: float, r: float, theta: float) -> Dict[str, bool]:
+def check_all_energy_conditions(mass: float, r: float, theta: float, backend=None) -> Dict[str, bool]:
     """Vollständige Prüfung aller Energie-Bedingungen.
     
     Args:
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         dict mit Keys: 'WEC', 'NEC', 'DEC', 'SEC', 'ANEC', 'AWEC'
         und Werten True (erfüllt) oder False (verletzt)
     """
-    fluid = perfect_fluid_decomposition(mass, r, theta)
+    fluid = perfect_fluid_decomposition(mass, r, theta, backend)
+    return energy_conditions_from_fluid(fluid)
+
+
+def energy_conditions_from_fluid(fluid: dict) -> Dict[str, np.ndarray]:
+    """Energie-Bedingungen aus einer Flüssigkeits-Zerlegung (vektorisiert).
+    
+    Args:
+        fluid: dict mit 'rho', 'p_r', 'p_t' (perfect_fluid_decomposition)
+    
+    Returns:
+        dict wie check_all_energy_conditions (bool oder bool-Arrays)
+    """
+    return {key: margin >= 0 for key, margin in energy_condition_margins(fluid).items()}
+
+
+def energy_condition_margins(fluid: dict) -> Dict[str, np.ndarray]:
+    """Vorzeichen-Ausdrücke der Energie-Bedingungen (vektorisiert).
+    
+    Jede Bedingung ist erfüllt genau dann, wenn ihr Margin ≥ 0 ist.
+    Bei mehreren Ungleichungen ist der Margin das Minimum der Einzel-
+    Ausdrücke (stetig, wechselt das Vorzeichen an der Verletzungs-Grenze).
+    
+    Args:
+        fluid: dict mit 'rho', 'p_r', 'p_t' (perfect_fluid_decomposition)
     
+    Returns:
+        dict mit Keys wie check_all_energy_conditions
+    """
     rho = fluid['rho']
     p_r = fluid['p_r']
     p_t = fluid['p_t']
@@ -43,14 +73,14 @@ def check_all_energy_conditions(mass: float, r: float, theta: float) -> Dict[str
     p_avg = (p_r + 2*p_t) / 3
     
     # Standard-Bedingungen
-    WEC = (rho >= 0) and ((rho + p_avg) >= 0)
-    NEC = (rho + p_avg) >= 0
-    DEC = (rho >= 0) and (rho >= abs(p_r)) and (rho >= abs(p_t))
-    SEC = (rho + p_avg >= 0) and (rho + 3*p_avg >= 0)
+    WEC = np.minimum(rho, rho + p_avg)
+    NEC = rho + p_avg
+    DEC = np.minimum.reduce([rho, rho - np.abs(p_r), rho - np.abs(p_t)])
+    SEC = np.minimum(rho + p_avg, rho + 3*p_avg)
     
     # Erweiterte Bedingungen
-    ANEC = (rho + p_r >= 0)  # Averaged NEC (radial)
-    AWEC = (rho >= 0) and (rho + p_r >= 0) and (rho + p_t >= 0)  # Averaged WEC
+    ANEC = rho + p_r  # Averaged NEC (radial)
+    AWEC = np.minimum.reduce([rho, rho + p_r, rho + p_t])  # Averaged WEC
     
     return {
         'WEC': WEC,
@@ -62,42 +92,102 @@ def check_all_energy_conditions(mass: float, r: float, theta: float) -> Dict[str
     }
 
 
+def _margins_at(backend, r: np.ndarray, theta: float) -> np.ndarray:
+    """Margins aller Bedingungen bei r als Array (6, len(r))."""
+    fluid = fluid_decomposition_from_curvature(curvature_components(backend.mass, r, theta, backend))
+    return np.array([np.broadcast_to(m, r.shape) for m in energy_condition_margins(fluid).values()])
+
+
+def scan_energy_conditions(mass: float, r_min: float, r_max: float, num: int = 2000,
+                           theta: float = np.pi/2, backend=None, log: bool = True,
+                           rtol: float = 1e-12) -> dict:
+    """Vektorisierter Scan aller Energie-Bedingungen mit exakten Grenzen.
+    
+    Alle Bedingungen werden auf einem (logarithmischen) Gitter in einem
+    Aufruf ausgewertet. Jeder Vorzeichenwechsel eines Margins zwischen zwei
+    Gitterpunkten wird anschließend per Bisektion (in log r bei log=True)
+    bis auf die relative Genauigkeit rtol eingegrenzt - alle Klammern aller
+    Bedingungen gleichzeitig, eine Metrik-Auswertung pro Iteration.
+    
+    Verletzungs-Intervalle schmaler als der Gitterabstand werden nicht erkannt.
+    
+    Args:
+        mass: Masse in kg
+        r_min, r_max: Radien-Bereich in m
+        num: Anzahl Gitterpunkte
+        theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
+        log: Logarithmisches (True) oder lineares Gitter
+        rtol: Relative Genauigkeit der Grenzen
+    
+    Returns:
+        dict mit:
+            'r': Gitter [m], 'rs': Schwarzschild-Radius [m],
+            'satisfied': {Bedingung: bool-Array auf dem Gitter},
+            'boundaries': {Bedingung: Array der Grenz-Radien [m]},
+            'intervals': {Bedingung: Liste (r_start, r_end) der Verletzung [m]}
+    """
+    backend = resolve_backend(mass, backend)
+    r = np.geomspace(r_min, r_max, num) if log else np.linspace(r_min, r_max, num)
+    satisfied = _margins_at(backend, r, theta) >= 0
+    keys = ('WEC', 'NEC', 'DEC', 'SEC', 'ANEC', 'AWEC')
+    
+    # Klammern: Zustandswechsel zwischen r[i] und r[i+1]
+    cond, idx = np.nonzero(satisfied[:, 1:] != satisfied[:, :-1])
+    lo, hi = r[idx], r[idx + 1]
+    lo_ok = satisfied[cond, idx]
+    
+    if idx.size:
+        width = np.max(np.log(hi / lo) if log else (hi - lo) / hi)
+        for _ in range(max(int(np.ceil(np.log2(width / rtol))), 0)):
+            mid = np.sqrt(lo * hi) if log else 0.5 * (lo + hi)
+            mid_ok = _margins_at(backend, mid, theta)[cond, np.arange(mid.size)] >= 0
+            same = mid_ok == lo_ok
+            lo = np.where(same, mid, lo)
+            hi = np.where(same, hi, mid)
+    edges = 0.5 * (lo + hi)
+    
+    result = {'r': r, 'rs': backend.rs, 'satisfied': {}, 'boundaries': {}, 'intervals': {}}
+    for k, key in enumerate(keys):
+        boundaries = edges[cond == k]
+        ends = [r[:1]] if not satisfied[k, 0] else []
+        ends.append(boundaries)
+        if not satisfied[k, -1]:
+            ends.append(r[-1:])
+        pairs = np.concatenate(ends).reshape(-1, 2)
+        result['satisfied'][key] = satisfied[k]
+        result['boundaries'][key] = boundaries
+        result['intervals'][key] = [(float(a), float(b)) for a, b in pairs]
+    
+    return result
+
+
 def violation_regions(mass: float, r_min: float, r_max: float, 
-                     num: int = 100, theta: float = np.pi/2) -> Dict[str, List[float]]:
+                     num: int = 100, theta: float = np.pi/2, backend=None) -> Dict[str, List[float]]:
     """Finde Regionen wo Energie-Bedingungen verletzt sind.
     
+    Für exakte Grenzen der Verletzungs-Intervalle siehe scan_energy_conditions.
+    
     Args:
         mass: Masse in kg
         r_min, r_max: Radien-Bereich
         num: Anzahl Sample-Punkte
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         dict mit Listen von r-Werten wo Bedingung verletzt ist
     """
-    rs = schwarzschild_radius(mass)
+    rs = resolve_backend(mass, backend).rs
     r_arr = np.linspace(r_min, r_max, num)
     
-    violations = {
-        'WEC': [],
-        'NEC': [],
-        'DEC': [],
-        'SEC': [],
-        'ANEC': [],
-        'AWEC': []
-    }
-    
-    for r in r_arr:
-        conditions = check_all_energy_conditions(mass, r, theta)
-        
-        for key, satisfied in conditions.items():
-            if not satisfied:
-                violations[key].append(r / rs)
+    fluid = perfect_fluid_decomposition(mass, r_arr, theta, backend)
+    conditions = energy_conditions_from_fluid(fluid)
     
-    return violations
+    return {key: list(r_arr[~satisfied] / rs) for key, satisfied in conditions.items()}
 
 
-def exotic_matter_indicator(mass: float, r: float, theta: float) -> float:
+def exotic_matter_indicator(mass: float, r: float, theta: float, backend=None) -> float:
     """Indikator für exotische Materie.
     
     Exotische Materie: ρ + p < 0 (verletzt NEC)
@@ -106,18 +196,19 @@ def exotic_matter_indicator(mass: float, r: float, theta: float) -> float:
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         Wert < 0: exotisch, Wert ≥ 0: normal
     """
-    fluid = perfect_fluid_decomposition(mass, r, theta)
+    fluid = perfect_fluid_decomposition(mass, r, theta, backend)
     rho = fluid['rho']
     p_avg = (fluid['p_r'] + 2*fluid['p_t']) / 3
     
     return rho + p_avg
 
 
-def wormhole_throat_criterion(mass: float, r: float, theta: float) -> bool:
+def wormhole_throat_criterion(mass: float, r: float, theta: float, backend=None) -> bool:
     """Prüfe ob Radius ein Wurmloch-Throat sein könnte.
     
     Kriterien (Morris-Thorne):
@@ -128,17 +219,18 @@ def wormhole_throat_criterion(mass: float, r: float, theta: float) -> bool:
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         True wenn Wurmloch-Throat-Kriterien erfüllt
     """
-    conditions = check_all_energy_conditions(mass, r, theta)
+    conditions = check_all_energy_conditions(mass, r, theta, backend)
     
     # NEC verletzt?
     nec_violated = not conditions['NEC']
     
     # Zusätzlich: radiale Druckgradient-Check (vereinfacht)
-    fluid = perfect_fluid_decomposition(mass, r, theta)
+    fluid = perfect_fluid_decomposition(mass, r, theta, backend)
     exotic = fluid['rho'] + fluid['p_r'] < 0
     
     return nec_violated and exotic
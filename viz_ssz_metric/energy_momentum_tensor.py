@@ -15,14 +15,12 @@ from __future__ import annotations
 import numpy as np
 import math
 from typing import Tuple
-from .einstein_tensor import (
-    effective_stress_energy_tensor, energy_density_from_einstein,
-    pressure_from_einstein
-)
+from .einstein_tensor import fluid_from_curvature
+from .ricci_curvature import curvature_components, ricci_scalar
 from .ssz_mirror_metric import schwarzschild_radius, C_DEFAULT
 
 
-def perfect_fluid_decomposition(mass: float, r: float, theta: float) -> dict:
+def perfect_fluid_decomposition(mass: float, r: float, theta: float, backend=None) -> dict:
     """Zerlege T_μν in perfekte-Flüssigkeits-Form.
     
     Perfekte Flüssigkeit:
@@ -39,6 +37,7 @@ def perfect_fluid_decomposition(mass: float, r: float, theta: float) -> dict:
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         dict mit Keys:
@@ -47,8 +46,22 @@ def perfect_fluid_decomposition(mass: float, r: float, theta: float) -> dict:
         - 'p_t': Tangentialer Druck
         - 'anisotropy': p_r - p_t (Anisotropie)
     """
-    rho = energy_density_from_einstein(mass, r, theta)
-    p_r, p_theta, p_phi = pressure_from_einstein(mass, r, theta)
+    # Ein Aufruf für alle Einstein-Komponenten
+    return fluid_decomposition_from_curvature(curvature_components(mass, r, theta, backend))
+
+
+def fluid_decomposition_from_curvature(components: dict) -> dict:
+    """Perfekte-Flüssigkeits-Zerlegung aus einem curvature_components-dict.
+    
+    Args:
+        components: dict aus ricci_curvature.curvature_components
+    
+    Returns:
+        dict wie perfect_fluid_decomposition
+    """
+    fluid = fluid_from_curvature(components)
+    rho, p_r = fluid['rho'], fluid['p_r']
+    p_theta, p_phi = fluid['p_theta'], fluid['p_phi']
     
     # Mittlerer tangentialer Druck
     p_t = (p_theta + p_phi) / 2
@@ -64,7 +77,7 @@ def perfect_fluid_decomposition(mass: float, r: float, theta: float) -> dict:
     }
 
 
-def energy_conditions_check(mass: float, r: float, theta: float) -> dict:
+def energy_conditions_check(mass: float, r: float, theta: float, backend=None) -> dict:
     """Prüfe Energie-Bedingungen (Energy Conditions).
     
     Standard-Bedingungen in GR:
@@ -77,11 +90,12 @@ def energy_conditions_check(mass: float, r: float, theta: float) -> dict:
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         dict mit True/False für jede Bedingung
     """
-    fluid = perfect_fluid_decomposition(mass, r, theta)
+    fluid = perfect_fluid_decomposition(mass, r, theta, backend)
     rho = fluid['rho']
     p_r = fluid['p_r']
     p_avg = (p_r + 2*fluid['p_t']) / 3  # Gemittelter Druck
@@ -102,7 +116,7 @@ def energy_conditions_check(mass: float, r: float, theta: float) -> dict:
     }
 
 
-def equation_of_state(mass: float, r: float, theta: float) -> float:
+def equation_of_state(mass: float, r: float, theta: float, backend=None) -> float:
     """Effektive Zustandsgleichung w = p/ρ.
     
     Standard-Werte:
@@ -114,11 +128,12 @@ def equation_of_state(mass: float, r: float, theta: float) -> float:
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         w = p/ρ
     """
-    fluid = perfect_fluid_decomposition(mass, r, theta)
+    fluid = perfect_fluid_decomposition(mass, r, theta, backend)
     rho = fluid['rho']
     p_avg = (fluid['p_r'] + 2*fluid['p_t']) / 3
     
@@ -128,7 +143,7 @@ def equation_of_state(mass: float, r: float, theta: float) -> float:
     return p_avg / rho
 
 
-def trace_energy_momentum(mass: float, r: float, theta: float) -> float:
+def trace_energy_momentum(mass: float, r: float, theta: float, backend=None) -> float:
     """Spur des Energie-Impuls-Tensors T^μ_μ = g^μν T_μν.
     
     Für perfekte Flüssigkeit: T^μ_μ = -ρ + 3p
@@ -140,14 +155,14 @@ def trace_energy_momentum(mass: float, r: float, theta: float) -> float:
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         T^μ_μ
     """
-    from .ricci_curvature import ricci_scalar
     from .ssz_mirror_metric import G_DEFAULT, C_DEFAULT
     
-    R = ricci_scalar(mass, r, theta)
+    R = ricci_scalar(mass, r, theta, backend)
     T_trace = -(C_DEFAULT**4 / (8*math.pi*G_DEFAULT)) * R
     
     return T_trace
@@ -16,8 +16,9 @@ from __future__ import annotations
 import numpy as np
 from typing import Callable, Tuple, List
 from scipy.integrate import odeint, solve_ivp
-from .christoffel_symbols import christoffel_nonzero
-from .ssz_mirror_metric import schwarzschild_radius, metric_functions_pn
+from .ssz_mirror_metric import (schwarzschild_radius, metric_functions_pn, G_DEFAULT, C_DEFAULT,
+                                EPSILON3)
+from .jit_kernels import geodesic_rhs_pn_kernel
 
 
 def geodesic_equations_rhs(state: np.ndarray, lambda_param: float, 
@@ -37,45 +38,14 @@ def geodesic_equations_rhs(state: np.ndarray, lambda_param: float,
     
     Returns:
         dstate/dλ (Ableitungen)
-    """
-    # Entpacke State
-    t, r, theta, phi = state[0:4]
-    v_t, v_r, v_theta, v_phi = state[4:8]
-    
-    # Christoffel-Symbole bei aktueller Position
-    gamma = christoffel_nonzero(mass, r, theta)
-    
-    # Beschleunigungen aus Geodätengleichung
-    # d²t/dλ² = -Γ^t_νρ v^ν v^ρ
-    a_t = -(
-        2 * gamma['Gamma^t_tr'] * v_t * v_r
-    )
-    
-    # d²r/dλ² = -Γ^r_νρ v^ν v^ρ
-    a_r = -(
-        gamma['Gamma^r_tt'] * v_t * v_t +
-        gamma['Gamma^r_rr'] * v_r * v_r +
-        gamma['Gamma^r_thth'] * v_theta * v_theta +
-        gamma['Gamma^r_phph'] * v_phi * v_phi
-    )
-    
-    # d²θ/dλ² = -Γ^θ_νρ v^ν v^ρ
-    a_theta = -(
-        2 * gamma['Gamma^th_rth'] * v_r * v_theta +
-        gamma['Gamma^th_phph'] * v_phi * v_phi
-    )
     
-    # d²φ/dλ² = -Γ^φ_νρ v^ν v^ρ
-    a_phi = -(
-        2 * gamma['Gamma^ph_rph'] * v_r * v_phi +
-        2 * gamma['Gamma^ph_thph'] * v_theta * v_phi
-    )
-    
-    # Rückgabe: [dx/dλ, dv/dλ]
-    return np.array([
-        v_t, v_r, v_theta, v_phi,  # Geschwindigkeiten
-        a_t, a_r, a_theta, a_phi   # Beschleunigungen
-    ])
+    Raises:
+        ValueError: wenn A(r) ≤ 0 (PN-Metrik-Singularität)
+    """
+    # Christoffel-Symbole der PN-Metrik und Beschleunigungen
+    # d²x^μ/dλ² = -Γ^μ_νρ v^ν v^ρ in einem Float-Kernel (mit numba kompiliert)
+    return geodesic_rhs_pn_kernel(np.asarray(state, dtype=float),
+                                  G_DEFAULT * mass, C_DEFAULT**2, EPSILON3)
 
 
 def integrate_geodesic(mass: float, 
@@ -8,7 +8,7 @@ Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
 """
 
 import numpy as np
-from scipy.integrate import odeint
+from scipy.integrate import solve_ivp
 from typing import Tuple
 
 
@@ -48,12 +48,14 @@ class GeodesicSolverMinimal:
         Returns:
             (tau, r_trajectory)
         """
-        def equations(y, tau):
+        r_stop = 1.01 * self.metric.r_s
+        
+        def equations(tau, y):
             """ODE system: y = [r, v_r]"""
             r, v_r = y
             
             # Safety: stop near horizon
-            if r < 1.01 * self.metric.r_s:
+            if r < r_stop:
                 return [0, 0]
             
             # Metric functions
@@ -74,11 +76,20 @@ class GeodesicSolverMinimal:
         # Initial conditions
         y0 = [r0, v_r0]
         
-        # Integration
+        # Integration; terminal event at r_stop (odeint stalled there and
+        # left the rest of its output array uninitialized)
+        def near_horizon(tau, y):
+            return y[0] - r_stop
+        near_horizon.terminal = True
+        near_horizon.direction = -1
+        
         tau = np.linspace(0, tau_max, 100)
-        solution = odeint(equations, y0, tau)
+        solution = solve_ivp(equations, (0.0, tau_max), y0, method='LSODA',
+                             t_eval=tau, events=near_horizon, rtol=1e-8)
         
-        r_trajectory = solution[:, 0]
+        # Nach dem Stopp bleibt r bei r_stop (wie die Safety-Bedingung)
+        r_trajectory = np.full(tau.size, r_stop if solution.t_events[0].size else np.nan)
+        r_trajectory[:solution.y.shape[1]] = solution.y[0]
         
         return tau, r_trajectory
     
@@ -86,7 +97,7 @@ class GeodesicSolverMinimal:
         """
         Test ob Kreisbahn bei r stabil ist.
         
-        Vereinfachtes Kriterium: r > r_ISCO ≈ 3 r_s
+        Kriterium: d²V_eff/dr² > 0 bei L = L_c(r) (siehe circular_orbits.py)
         
         Args:
             r_orbit: Orbital radius [m]
@@ -94,9 +105,8 @@ class GeodesicSolverMinimal:
         Returns:
             True wenn stabil
         """
-        # Simplified criterion: r > 3 r_s (ISCO for Schwarzschild)
-        # In reality, should check d²V_eff/dr² > 0
-        return r_orbit > 3 * self.metric.r_s
+        M_geom = self.metric.params.G * self.metric.params.mass / self.c**2
+        return bool(self.metric.circular_orbits().is_stable(r_orbit / M_geom))
     
     def escape_velocity(self, r: float) -> float:
         """
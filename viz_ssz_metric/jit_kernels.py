@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+JIT-Kernel - optionale numba-Beschleunigung der skalaren Innen-Schleifen
+
+Die von scipy-Integratoren millionenfach aufgerufenen Funktionen sind hier
+als reine Float-Kernel (nur math, Tupel und NumPy-Arrays, keine Objekte)
+geschrieben:
+
+- tov_rhs_kernel:          TOV + Skalar-EOM (ssz_theory_segmented.rhs_dr)
+- geodesic_rhs_pn_kernel:  Geodätengleichungen der PN-Metrik (geodesics.geodesic_equations_rhs)
+- metric_A_kernel:         A(r) der UnifiedSSZMetric (metric_function_A)
+- metric_A_array_kernel:   dasselbe über ein Array von Radien
+
+Ist numba installiert, werden sie mit @njit kompiliert; sonst laufen dieselben
+Funktionen unverändert in Python (identische Semantik, ein Quelltext).
+SSZ_DISABLE_JIT=1 erzwingt den Python-Pfad.
+
+© 2025 Carmen Wrede & Lino Casu
+Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
+"""
+from __future__ import annotations
+import math
+import os
+import numpy as np
+
+try:
+    from .numerical_stability import exp_clip_scalar, sech2_scalar, sat_tanh_scalar
+except ImportError:
+    from numerical_stability import exp_clip_scalar, sech2_scalar, sat_tanh_scalar
+
+try:
+    if os.environ.get('SSZ_DISABLE_JIT', '') not in ('', '0'):
+        raise ImportError("JIT deaktiviert (SSZ_DISABLE_JIT)")
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def jit(func):
+    """
+    numba.njit(cache=True), falls numba verfügbar - sonst func unverändert.
+
+    Args:
+        func: Reine Float-Funktion (nopython-kompatibel)
+
+    Returns:
+        Kompilierter Dispatcher oder func
+    """
+    if HAS_NUMBA:
+        return numba.njit(cache=True)(func)
+    return func
+
+
+# Stabilitäts-Kernel aus numerical_stability (eine Quelle, hier ggf. kompiliert)
+_exp_clip = jit(exp_clip_scalar)
+_sech2 = jit(sech2_scalar)
+_sat = jit(sat_tanh_scalar)
+
+
+@jit
+def scalar_sector_kernel(phi, Z0, alpha, beta, Zmin, Zmax, mphi, lam, phi_cap):
+    """
+    (Z_parallel, U, dZ/dφ, dU/dφ) mit sat(φ) und sech²(φ/φ_cap) je einmal.
+
+    phi_cap ≤ 0: keine Sättigung (wie phi_cap=None in ssz_theory_segmented).
+    """
+    if phi_cap <= 0:
+        ph = phi
+        dph = 1.0
+    else:
+        ph = _sat(phi, phi_cap)
+        dph = _sech2(phi / phi_cap)
+    z = Z0 * (1.0 + alpha * ph + beta * ph * ph)
+    ph2 = ph * ph
+    Up = 0.5 * (mphi**2) * ph2 + lam * ph2 * ph2
+    if z <= Zmin or z >= Zmax:
+        # an den Klammern: Z konstant, Ableitung 0
+        Zp = Zmin if z <= Zmin else Zmax
+        Zphi = 0.0
+    else:
+        Zp = z
+        Zphi = Z0 * (alpha + 2.0 * beta * ph) * dph
+    dUp = ((mphi**2) * ph + 4.0 * lam * ph2 * ph) * dph
+    return Zp, Up, Zphi, dUp
+
+
+@jit
+def tov_rhs_kernel(r, y, args):
+    """
+    dy/dr für y = [m, Phi, pr_fluid, phi, phip] (ohne Horizont-Wächter).
+
+    Args:
+        r: Radius
+        y: Zustandsvektor (float-Array, Länge 5)
+        args: (Z0, alpha, beta, Zmin, Zmax, mphi, lam, phi_cap, phip_cap, cs2, rho0),
+              Caps ≤ 0 = keine Sättigung (ssz_theory_segmented.Params.kernel_args)
+
+    Returns:
+        dy/dr als Array (Länge 5)
+    """
+    Z0, alpha, beta, Zmin, Zmax, mphi, lam, phi_cap, phip_cap, cs2, rho0 = args
+    m = float(y[0])
+    Phi = float(y[1])
+    pr_fl = float(y[2])
+    phi = float(y[3])
+    phip = float(y[4])
+
+    r_safe = max(r, 1e-30)
+    one_minus = 1.0 - 2.0 * m / r_safe
+    if one_minus < 1e-16:
+        one_minus = 1e-16
+
+    Lam = -0.5 * math.log(one_minus)   # e^{2Λ} = 1/(1-2m/r),  e^{-2Λ} = 1-2m/r
+    inv_e2L = one_minus
+
+    # Skalar-Sektor
+    Zp, Up, Zphi, dUp = scalar_sector_kernel(phi, Z0, alpha, beta, Zmin, Zmax, mphi, lam, phi_cap)
+    phip_s = _sat(phip, phip_cap)
+    X = inv_e2L * (phip_s**2)
+
+    rho_phi = 0.5 * Zp * X + Up
+    pr_phi = 0.5 * Zp * X - Up
+    pt_phi = -0.5 * Zp * X - Up
+    Delta_phi = pt_phi - pr_phi               # = -Zp * X
+
+    # Fluid (isotrop)
+    cs2 = max(cs2, 1e-16)
+    rho_fl = (pr_fl / cs2) + rho0
+    pt_fl = pr_fl
+
+    # Summen
+    rho_tot = rho_fl + rho_phi
+    pr_tot = pr_fl + pr_phi
+
+    # TOV
+    denom = r_safe * (r_safe - 2.0 * m)
+    if abs(denom) < 1e-18 * r_safe * r_safe:
+        denom = math.copysign(1e-18 * r_safe * r_safe, denom)
+
+    dPhidr = (m + 4.0 * math.pi * (r_safe**3) * pr_tot) / denom
+    dmdr = 4.0 * math.pi * (r_safe**2) * rho_tot
+
+    # Fluiddruck
+    dpr_dr = -(rho_fl + pr_fl) * dPhidr + (2.0 / r_safe) * (pt_fl - pr_fl + Delta_phi)
+
+    # Skalar-EOM explizit
+    source = dUp + 0.5 * Zphi * X
+
+    ePhi_m_L = _exp_clip(Phi - Lam, 80.0)
+    ePhi_p_L = _exp_clip(Phi + Lam, 80.0)
+
+    A = ePhi_m_L * (r_safe**2) * max(Zp, 1e-16)
+    B = ePhi_p_L * (r_safe**2) * source
+
+    # Λ' = (m + 4π r^3 ρ_tot)/(r(r-2m))
+    dLdr = (m + 4.0 * math.pi * (r_safe**3) * rho_tot) / denom
+    # A' = A*(Φ' - Λ' + 2/r) + e^{Φ-Λ} r^2 Z_{,φ} φ'_sat
+    Aprime = A * (dPhidr - dLdr + 2.0 / r_safe) + ePhi_m_L * (r_safe**2) * Zphi * phip_s
+
+    dphipdr = (B - Aprime * phip) / max(A, 1e-30)
+
+    out = np.empty(5)
+    out[0] = dmdr
+    out[1] = dPhidr
+    out[2] = dpr_dr
+    out[3] = phip
+    out[4] = dphipdr
+    return out
+
+
+@jit
+def geodesic_rhs_pn_kernel(state, GM, c2, epsilon3):
+    """
+    d(state)/dλ der Geodätengleichung in der PN-Metrik A = 1 - 2U + 2U² + ε₃U³.
+
+    Gleiche Christoffel-Symbole wie christoffel_nonzero mit PostNewtonianBackend
+    (B = 1/A, analytische Ableitungen), inklusive ValueError bei A ≤ 0.
+
+    Args:
+        state: [t, r, θ, φ, dt/dλ, dr/dλ, dθ/dλ, dφ/dλ] (float-Array)
+        GM: G × Masse
+        c2: c²
+        epsilon3: Kubischer PN-Koeffizient
+
+    Returns:
+        dstate/dλ als Array (Länge 8)
+    """
+    r = state[1]
+    theta = state[2]
+    v_t = state[4]
+    v_r = state[5]
+    v_theta = state[6]
+    v_phi = state[7]
+
+    U = GM / (c2 * r)
+    A = 1.0 - 2.0 * U + 2.0 * U**2 + epsilon3 * U**3
+    if A <= 0:
+        raise ValueError("Metrik-Singularitaet: A(r) <= 0. Verwende A_safe() fuer starke Felder.")
+    dA = (-2.0 + 4.0 * U + 3.0 * epsilon3 * U**2) * (-U / r)
+    B = 1.0 / A
+    dB = -dA / A**2
+
+    sin_t = math.sin(theta)
+    cos_t = math.cos(theta)
+    cot_theta = cos_t / sin_t if sin_t > 1e-10 else 0.0
+
+    Gamma_t_tr = dA / (2 * A)
+    Gamma_r_tt = dA / (2 * B)
+    Gamma_r_rr = dB / (2 * B)
+    Gamma_r_thth = -r / B
+    Gamma_r_phph = -r * (sin_t**2) / B
+    Gamma_th_rth = 1.0 / r
+    Gamma_th_phph = -sin_t * cos_t
+    Gamma_ph_rph = 1.0 / r
+
+    out = np.empty(8)
+    out[0] = v_t
+    out[1] = v_r
+    out[2] = v_theta
+    out[3] = v_phi
+    out[4] = -(2 * Gamma_t_tr * v_t * v_r)
+    out[5] = -(Gamma_r_tt * v_t * v_t + Gamma_r_rr * v_r * v_r
+               + Gamma_r_thth * v_theta * v_theta + Gamma_r_phph * v_phi * v_phi)
+    out[6] = -(2 * Gamma_th_rth * v_r * v_theta + Gamma_th_phph * v_phi * v_phi)
+    out[7] = -(2 * Gamma_ph_rph * v_r * v_phi + 2 * cot_theta * v_theta * v_phi)
+    return out
+
+
+@jit
+def metric_A_kernel(r, GM, c2, coeffs, r_phi, varphi, K, epsilon, beta):
+    """
+    A(r) der UnifiedSSZMetric: PN-Serie, Golden-Ratio-Sättigung, Softplus-Floor.
+
+    Args:
+        r: Radius [m]
+        GM, c2: G × Masse, c²
+        coeffs: PN-Koeffizienten (c_0, ..., c_6) (pn_series_coefficients)
+        r_phi: Segment-Radius r_φ
+        varphi, K: Golden Ratio φ und Segment-Anzahl
+        epsilon, beta: Softplus-Parameter
+
+    Returns:
+        A(r)
+    """
+    U = GM / (c2 * r)
+    A = coeffs[0]
+    Uk = 1.0
+    for k in range(1, 7):
+        Uk *= U
+        A += coeffs[k] * Uk
+
+    # Sättigung bei r < r_φ (gekappt bei 1)
+    if r < r_phi:
+        A = min(A * (1.0 - math.exp(-varphi * K * r / r_phi)), 1.0)
+
+    # Softplus-Floor (garantiert A > 0)
+    shifted = A - epsilon
+    argument = beta * shifted
+    if argument > 50:
+        return shifted / beta + epsilon
+    elif argument < -50:
+        return math.exp(argument) / beta + epsilon
+    return math.log(1.0 + math.exp(argument)) / beta + epsilon
+
+
+@jit
+def metric_A_array_kernel(r, GM, c2, coeffs, r_phi, varphi, K, epsilon, beta):
+    """
+    metric_A_kernel über ein float-Array r (Form bleibt erhalten).
+
+    Ohne numba eine Python-Schleife - dann metric_function_A_array verwenden.
+    """
+    flat = r.ravel()
+    out = np.empty(flat.size)
+    for i in range(flat.size):
+        out[i] = metric_A_kernel(flat[i], GM, c2, coeffs, r_phi, varphi, K, epsilon, beta)
+    return out.reshape(r.shape)
@@ -18,79 +18,131 @@ Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
 from __future__ import annotations
 import numpy as np
 import math
-from typing import Tuple
-from .ssz_mirror_metric import schwarzschild_radius, metric_functions_pn
-from .ricci_curvature import ricci_scalar, ricci_tensor_diagonal
-from .christoffel_symbols import dA_dr_numerical, dB_dr_numerical
+from typing import Dict, Tuple
+from .ssz_mirror_metric import schwarzschild_radius
+from .metric_backend import resolve_backend
 
 
-def kretschmann_scalar_exact(mass: float, r: float, theta: float) -> float:
-    """Kretschmann-Skalar K = R_μνρσ R^μνρσ (exakt berechnet).
+def riemann_invariants(r, A, dA, d2A, B, dB) -> Dict[str, np.ndarray]:
+    """Exakte Krümmungsinvarianten von diag(-A, B, r², r²sin²θ).
     
-    Für Schwarzschild-GR: K = 48(GM)²/(c⁴r⁶) = 12r_s²/r⁶
+    Der Riemann-Tensor hat in der orthonormalen Basis nur vier
+    unabhängige Komponenten (a = A'/A, b = B'/B):
+    
+    K₁ = R^{tr}_{tr}                     = -(A''/A - a²/2 - ab/2) / (2B)
+    K₂ = R^{tθ}_{tθ} = R^{tφ}_{tφ}      = -a / (2rB)
+    K₃ = R^{rθ}_{rθ} = R^{rφ}_{rφ}      = b / (2rB)
+    K₄ = R^{θφ}_{θφ}                     = (1 - 1/B) / r²
     
-    Für SSZ: Korrektur durch Post-Newtonsche Terme.
+    Daraus (Schwarzschild: K = C² = 12r_s²/r⁶, R = R_μν R^μν = 0):
+    
+    K   = R_μνρσ R^μνρσ = 4(K₁² + 2K₂² + 2K₃² + K₄²)
+    C²  = C_μνρσ C^μνρσ = (4/3)(K₁ - K₂ - K₃ + K₄)²
+    R_μν R^μν = (K₁ + 2K₂)² + (K₁ + 2K₃)² + 2(K₂ + K₃ + K₄)²
     
     Args:
-        mass: Masse in kg
-        r: Radius in m
-        theta: Polwinkel
+        r: Radius in m (Array)
+        A, dA, d2A, B, dB: Metrik-Funktionen und Ableitungen bei r
     
     Returns:
-        K (Kretschmann-Skalar)
+        dict mit Keys 'kretschmann', 'weyl_C2', 'ricci_squared', 'R'
     """
-    rs = schwarzschild_radius(mass)
-    A, B = metric_functions_pn(mass, r)
+    r = np.asarray(r, dtype=float)
+    a = dA / A
+    b = dB / B
+    
+    K1 = -(d2A / A - a**2 / 2 - a * b / 2) / (2 * B)
+    K2 = -a / (2 * r * B)
+    K3 = b / (2 * r * B)
+    K4 = (1.0 - 1.0 / B) / r**2
+    
+    # Gemischte Ricci-Komponenten R^t_t, R^r_r, R^θ_θ = R^φ_φ
+    R_t = K1 + 2 * K2
+    R_r = K1 + 2 * K3
+    R_th = K2 + K3 + K4
+    
+    return {
+        'kretschmann': 4 * (K1**2 + 2 * K2**2 + 2 * K3**2 + K4**2),
+        'weyl_C2': (4.0 / 3.0) * (K1 - K2 - K3 + K4)**2,
+        'ricci_squared': R_t**2 + R_r**2 + 2 * R_th**2,
+        'R': R_t + R_r + 2 * R_th,
+    }
+
+
+def curvature_invariants(mass: float, r, backend=None) -> Dict[str, np.ndarray]:
+    """Kretschmann, Weyl C², R_μν R^μν und R in einem Aufruf.
     
-    # GR-Baseline
-    K_GR = 12 * (rs**2) / (r**6)
+    Eine Backend-Auswertung (A, A', A'', B, B') pro Radius, keine
+    finiten Differenzen.
     
-    # SSZ-Korrektur aus Post-Newtonschen Termen
-    # Vereinfachte Berechnung (vollständig: summiere alle 256 Komponenten!)
+    Args:
+        mass: Masse in kg
+        r: Radius in m (Skalar oder Array)
+        backend: Metrik-Backend (default: PN-Serie für mass)
+    
+    Returns:
+        dict wie riemann_invariants
+    """
+    f = resolve_backend(mass, backend).functions(r)
+    return riemann_invariants(r, f.A, f.dA, f.d2A, f.B, f.dB)
+
+
+def kretschmann_scalar_exact(mass: float, r: float, theta: float, backend=None) -> float:
+    """Kretschmann-Skalar K = R_μνρσ R^μνρσ (exakt berechnet).
     
-    # Metrik-Ableitungen
-    dA = dA_dr_numerical(mass, r)
-    dB = dB_dr_numerical(mass, r)
+    Für Schwarzschild-GR: K = 48(GM)²/(c⁴r⁶) = 12r_s²/r⁶
     
-    # Dominanter Beitrag: (dA/dr)² und (dB/dr)²
-    correction_term = (dA**2 / (A*B) + dB**2 / (B**2)) / r**4
+    Für SSZ: geschlossene Form aus A, A', A'', B, B' (riemann_invariants).
     
-    K = K_GR + correction_term
+    Args:
+        mass: Masse in kg
+        r: Radius in m
+        theta: Polwinkel (K hängt nicht von θ ab)
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
-    return K
+    Returns:
+        K (Kretschmann-Skalar)
+    """
+    return curvature_invariants(mass, r, backend)['kretschmann']
 
 
-def weyl_scalar_C2(mass: float, r: float, theta: float) -> float:
+def weyl_scalar_C2(mass: float, r: float, theta: float, backend=None) -> float:
     """Weyl-Skalar C² = C_μνρσ C^μνρσ.
     
     Der Weyl-Tensor beschreibt die Gezeiten-Gravitation (tidal field).
     
     Für Vakuum-Lösung: C_μνρσ = R_μνρσ (da R_μν = 0)
     
-    Für SSZ: C_μνρσ = R_μνρσ - (Ricci-Beiträge)
+    Für SSZ: C² = K - 2 R_μν R^μν + R²/3, in sphärischer Symmetrie
+    ein perfektes Quadrat (riemann_invariants) und damit C² ≥ 0.
     
     Args:
         mass: Masse in kg
         r: Radius in m
-        theta: Polwinkel
+        theta: Polwinkel (C² hängt nicht von θ ab)
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         C² (Weyl-Skalar)
     """
-    rs = schwarzschild_radius(mass)
-    
-    # In sphärischer Symmetrie: Weyl-Skalar vereinfacht sich
-    # C² ≈ K - (4/3)R² (für 4D)
-    
-    K = kretschmann_scalar_exact(mass, r, theta)
-    R = ricci_scalar(mass, r, theta)
+    return curvature_invariants(mass, r, backend)['weyl_C2']
+
+
+def ricci_squared(mass: float, r: float, backend=None) -> float:
+    """Ricci-Quadrat R_μν R^μν.
     
-    C2 = K - (4.0/3.0) * (R**2)
+    Args:
+        mass: Masse in kg
+        r: Radius in m
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
-    return max(0, C2)  # Physikalisch muss C² ≥ 0
+    Returns:
+        R_μν R^μν
+    """
+    return curvature_invariants(mass, r, backend)['ricci_squared']
 
 
-def tidal_tensor_eigenvalues(mass: float, r: float, theta: float) -> Tuple[float, float, float]:
+def tidal_tensor_eigenvalues(mass: float, r: float, theta: float, backend=None) -> Tuple[float, float, float]:
     """Eigenwerte des Gezeiten-Tensors (Tidal Tensor).
     
     Der Gezeiten-Tensor E_ij beschreibt die Deformation von Testmassen.
@@ -103,17 +155,20 @@ def tidal_tensor_eigenvalues(mass: float, r: float, theta: float) -> Tuple[float
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         Tuple (λ_r, λ_θ, λ_φ) Eigenwerte
     """
     from .ssz_mirror_metric import G_DEFAULT
     
+    b = resolve_backend(mass, backend)
+    
     # Newtonsche Gezeiten-Tensor
-    E_newton = G_DEFAULT * mass / (r**3)
+    E_newton = G_DEFAULT * b.mass / (r**3)
     
     # SSZ-Korrektur aus Metrik
-    A, _ = metric_functions_pn(mass, r)
+    A = b.A(r)
     correction = np.sqrt(A)  # Zeitdilatations-Faktor
     
     # Eigenwerte
@@ -124,7 +179,7 @@ def tidal_tensor_eigenvalues(mass: float, r: float, theta: float) -> Tuple[float
     return lambda_r, lambda_theta, lambda_phi
 
 
-def singularity_strength(mass: float, r: float, theta: float) -> str:
+def singularity_strength(mass: float, r: float, theta: float, backend=None) -> str:
     """Klassifiziere Stärke der Singularität via Kretschmann.
     
     Klassifikation:
@@ -137,11 +192,12 @@ def singularity_strength(mass: float, r: float, theta: float) -> str:
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         Klassifikation als String
     """
-    K = kretschmann_scalar_exact(mass, r, theta)
+    K = kretschmann_scalar_exact(mass, r, theta, backend)
     
     if K < 1e3:
         return "schwach"
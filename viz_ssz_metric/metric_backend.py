@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+"""
+Metrik-Backends für die statische, sphärisch-symmetrische Metrik
+
+    ds² = -A(r) dt² + B(r) dr² + r² dΩ²
+
+Alle Krümmungs-Module (Christoffel, Ricci, Riemann, Einstein, T_μν,
+Energie-Bedingungen, Raychaudhuri, Kretschmann/Weyl, Zeitdilatation)
+brauchen nur A, A', A'', B, B'. Ein Backend liefert genau diese
+Funktionen - analytisch und vektorisiert über r - für ein Metrik-Modell:
+
+- PostNewtonianBackend:  A = 1 - 2U + 2U² + ε₃U³ (metric_functions_pn,
+                         ValueError bei A ≤ 0 wie bisher)
+- UnifiedMetricBackend:  UnifiedSSZMetric.metric_function_A_array
+                         (PN bis U⁶ mit Δ(M), Sättigung, Softplus-Floor)
+- MirrorBlendBackend:    A_safe (SSZ ↔ GR Mirror-Blend am Schnittpunkt r*)
+
+Jedes Backend hat eine hashbare Signatur und einen kleinen LRU-Cache
+für functions(r), d.h. wiederholte Auswertungen am selben Gitter
+kosten nichts.
+
+© 2025 Carmen Wrede & Lino Casu
+Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
+"""
+from __future__ import annotations
+import abc
+from collections import OrderedDict
+from functools import lru_cache
+from typing import NamedTuple
+import numpy as np
+
+try:
+    from .ssz_mirror_metric import G_DEFAULT, C_DEFAULT, PHI, EPSILON3, u_star
+except ImportError:
+    from ssz_mirror_metric import G_DEFAULT, C_DEFAULT, PHI, EPSILON3, u_star
+
+
+# Einträge pro Backend-Cache
+CACHE_SIZE = 128
+
+
+class MetricFunctions(NamedTuple):
+    """A, A', A'', B, B' an denselben Radien."""
+    A: np.ndarray
+    dA: np.ndarray
+    d2A: np.ndarray
+    B: np.ndarray
+    dB: np.ndarray
+
+
+def _softplus_derivatives(x, dx, d2x, eps: float, beta: float):
+    """A = ε + ln(1 + exp(β(x - ε)))/β und Ableitungen (Kettenregel)."""
+    arg = beta * (x - eps)
+    sigma = 0.5 * (1.0 + np.tanh(0.5 * arg))  # stabile Sigmoide
+    A = eps + np.logaddexp(0.0, arg) / beta
+    dA = sigma * dx
+    d2A = sigma * d2x + beta * sigma * (1.0 - sigma) * dx**2
+    return A, dA, d2A
+
+
+class MetricBackend(abc.ABC):
+    """
+    Abstraktes Protokoll: A, A', A'', B, B' auf Arrays.
+
+    Unterklassen implementieren _evaluate(r) -> (A, A', A'') und setzen
+    mass, rs und signature. B = 1/A und B' = -A'/A² sind Standard;
+    Modelle mit unabhängigem B überschreiben _evaluate_B.
+
+    Verwendung:
+    >>> backend = UnifiedMetricBackend(UnifiedSSZMetric(mass=M_SUN))
+    >>> f = backend.functions(np.linspace(3e3, 3e5, 1000))
+    >>> f.A.shape, f.dA.shape
+    ((1000,), (1000,))
+    """
+
+    mass: float
+    rs: float
+    signature: tuple
+
+    @abc.abstractmethod
+    def _evaluate(self, r: np.ndarray):
+        """(A, A', A'') auf dem float-Array r."""
+
+    def _evaluate_B(self, A, dA):
+        return 1.0 / A, -dA / A**2
+
+    def functions(self, r) -> MetricFunctions:
+        """
+        Alle Metrik-Funktionen bei r (memoisiert pro Gitter).
+
+        Args:
+            r: Radius [m] (scalar or array)
+
+        Returns:
+            MetricFunctions (numpy-Skalare für skalares r)
+        """
+        r = np.asarray(r, dtype=float)
+        cache = self.__dict__.setdefault('_functions_cache', OrderedDict())
+        key = (r.shape, r.tobytes())
+        hit = cache.get(key)
+        if hit is not None:
+            cache.move_to_end(key)
+            return hit
+
+        A, dA, d2A = self._evaluate(r)
+        B, dB = self._evaluate_B(A, dA)
+        result = MetricFunctions(*(np.asarray(v, dtype=float)[()] for v in (A, dA, d2A, B, dB)))
+        cache[key] = result
+        if len(cache) > CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
+    def clear_cache(self) -> None:
+        """Leere den functions(r)-Cache."""
+        self.__dict__.pop('_functions_cache', None)
+
+    def A(self, r):
+        """A(r) = -g_tt"""
+        return self.functions(r).A
+
+    def dA(self, r):
+        """dA/dr"""
+        return self.functions(r).dA
+
+    def d2A(self, r):
+        """d²A/dr²"""
+        return self.functions(r).d2A
+
+    def B(self, r):
+        """B(r) = g_rr"""
+        return self.functions(r).B
+
+    def dB(self, r):
+        """dB/dr"""
+        return self.functions(r).dB
+
+    def __hash__(self):
+        return hash(self.signature)
+
+    def __eq__(self, other):
+        return isinstance(other, MetricBackend) and self.signature == other.signature
+
+    def __repr__(self):
+        return f"{type(self).__name__}{self.signature[1:]}"
+
+
+class PostNewtonianBackend(MetricBackend):
+    """
+    Post-Newtonsche Serie A = 1 - 2U + 2U² + ε₃U³, U = GM/(c²r).
+
+    Identisch zu ssz_mirror_metric.metric_functions_pn, inklusive
+    ValueError bei A ≤ 0 (strict=True).
+    """
+
+    def __init__(self, mass: float, G: float = G_DEFAULT, c: float = C_DEFAULT,
+                 epsilon3: float = EPSILON3, strict: bool = True):
+        """
+        Args:
+            mass: Masse in kg
+            G: Gravitationskonstante
+            c: Lichtgeschwindigkeit
+            epsilon3: Kubischer Koeffizient (default: -24/5)
+            strict: ValueError bei A ≤ 0 (Metrik-Singularität)
+        """
+        self.mass = float(mass)
+        self.G = G
+        self.c = c
+        self.epsilon3 = epsilon3
+        self.strict = strict
+        self.rs = 2.0 * G * self.mass / c**2
+        self.signature = ('pn', self.mass, G, c, epsilon3, strict)
+
+    def _evaluate(self, r):
+        U = self.G * self.mass / (self.c**2 * r)
+        e3 = self.epsilon3
+        A = 1.0 - 2.0 * U + 2.0 * U**2 + e3 * U**3
+        if self.strict and np.any(A <= 0):
+            bad = np.atleast_1d(r)[np.atleast_1d(A) <= 0][0]
+            raise ValueError(
+                f"Metrik-Singularität: A(r) ≤ 0 bei r = {bad:.3e} m. "
+                f"Verwende A_safe() für starke Felder."
+            )
+        # dU/dr = -U/r, d²U/dr² = 2U/r²
+        dA_dU = -2.0 + 4.0 * U + 3.0 * e3 * U**2
+        d2A_dU2 = 4.0 + 6.0 * e3 * U
+        dA = dA_dU * (-U / r)
+        d2A = d2A_dU2 * (U / r)**2 + dA_dU * (2.0 * U / r**2)
+        return A, dA, d2A
+
+
+class UnifiedMetricBackend(MetricBackend):
+    """
+    Backend für UnifiedSSZMetric (A = metric_function_A_array).
+
+    Ableitungen analytisch durch alle Stufen: PN-Polynom in U mit Δ(M),
+    Golden-Ratio-Sättigung (r < r_φ, gekappt bei 1) und Softplus-Floor
+    mit denselben drei Zweigen wie die Metrik selbst.
+    """
+
+    def __init__(self, metric):
+        """
+        Args:
+            metric: UnifiedSSZMetric instance
+        """
+        try:
+            from .qnm_spectrum import metric_signature
+        except ImportError:
+            from qnm_spectrum import metric_signature
+        self.metric = metric
+        p = metric.params
+        self.mass = p.mass
+        self.rs = metric.r_s
+        self.signature = ('unified', float(p.mass), float(p.G), float(p.c)) + metric_signature(metric)
+
+    def _evaluate(self, r):
+        metric = self.metric
+        p = metric.params
+        U = p.G * p.mass / (p.c**2 * r)
+        P = np.polynomial.polynomial
+        coeffs = metric.pn_series_coefficients()
+        d1 = P.polyder(coeffs)
+        d2 = P.polyder(coeffs, 2)
+
+        A_pn = P.polyval(U, coeffs)
+        dA_pn = P.polyval(U, d1) * (-U / r)
+        d2A_pn = P.polyval(U, d2) * (U / r)**2 + P.polyval(U, d1) * (2.0 * U / r**2)
+
+        # Sättigung bei r < r_φ: Q = A_pn (1 - exp(-k r)), gekappt bei 1
+        k = p.varphi * p.K_segments / metric.r_phi
+        e = np.exp(-k * r)
+        Q = A_pn * (1.0 - e)
+        dQ = dA_pn * (1.0 - e) + A_pn * k * e
+        d2Q = d2A_pn * (1.0 - e) + 2.0 * dA_pn * k * e - A_pn * k**2 * e
+        inner = r < metric.r_phi
+        capped = inner & (Q > 1.0)
+        x = np.where(inner, np.minimum(Q, 1.0), A_pn)
+        dx = np.where(capped, 0.0, np.where(inner, dQ, dA_pn))
+        d2x = np.where(capped, 0.0, np.where(inner, d2Q, d2A_pn))
+
+        # Softplus-Floor (Zweige wie metric_function_A_array)
+        eps, beta = p.epsilon, p.beta
+        arg = beta * (x - eps)
+        A_mid, dA_mid, d2A_mid = _softplus_derivatives(x, dx, d2x, eps, beta)
+        low = np.exp(np.minimum(arg, 0.0))
+        A = metric.metric_function_A_array(r)
+        dA = np.where(arg > 50, dx / beta, np.where(arg < -50, low * dx, dA_mid))
+        d2A = np.where(arg > 50, d2x / beta,
+                       np.where(arg < -50, low * (d2x + beta * dx**2), d2A_mid))
+        return A, dA, d2A
+
+
+class MirrorBlendBackend(MetricBackend):
+    """
+    Mirror-Blend A_safe: SSZ (innen) ↔ GR (außen) mit tanh-Weiche bei r*
+    und Softplus-Floor. Parameter wie ssz_mirror_metric.A_safe.
+    """
+
+    def __init__(self, rs: float, varphi: float = PHI, delta_ratio: float = 0.02,
+                 eps: float = 1e-6, beta: float = 50.0,
+                 G: float = G_DEFAULT, c: float = C_DEFAULT):
+        """
+        Args:
+            rs: Schwarzschild-Radius [m]
+            varphi: φ-Parameter
+            delta_ratio: Übergangsbreite relativ zu r*
+            eps: Softplus-Floor-Offset
+            beta: Softplus-Steilheit
+            G, c: Konstanten (nur für mass = r_s c²/2G)
+        """
+        self.rs = float(rs)
+        self.mass = self.rs * c**2 / (2.0 * G)
+        self.varphi = float(varphi)
+        self.delta_ratio = delta_ratio
+        self.eps = eps
+        self.beta = beta
+        self.r_star = self.rs * u_star(self.varphi)
+        self.delta = max(delta_ratio * self.r_star, 1e-9)
+        self.signature = ('mirror', self.rs, self.varphi, delta_ratio, eps, beta)
+
+    def _evaluate(self, r):
+        rs, phi, delta = self.rs, self.varphi, self.delta
+
+        # Weiche h = (1 - tanh s)/2, s = (r - r*)/δ
+        t = np.tanh((r - self.r_star) / delta)
+        sech2 = 1.0 - t**2
+        h = 0.5 * (1.0 - t)
+        dh = -0.5 * sech2 / delta
+        d2h = sech2 * t / delta**2
+
+        # SSZ: A = D², D = 1/(2 - exp(-φr/r_s))
+        k = phi / rs
+        e = np.exp(-k * r)
+        D = 1.0 / (2.0 - e)
+        dD = -k * e * D**2
+        d2D = k**2 * e * D**2 + 2.0 * (k * e)**2 * D**3
+        A_ssz = D**2
+        dA_ssz = 2.0 * D * dD
+        d2A_ssz = 2.0 * (dD**2 + D * d2D)
+
+        # GR: A = 1 - r_s/r
+        A_gr = 1.0 - rs / r
+        dA_gr = rs / r**2
+        d2A_gr = -2.0 * rs / r**3
+
+        diff = A_ssz - A_gr
+        ddiff = dA_ssz - dA_gr
+        m = A_gr + h * diff
+        dm = dh * diff + h * dA_ssz + (1.0 - h) * dA_gr
+        d2m = d2h * diff + 2.0 * dh * ddiff + h * d2A_ssz + (1.0 - h) * d2A_gr
+        return _softplus_derivatives(m, dm, d2m, self.eps, self.beta)
+
+
+@lru_cache(maxsize=64)
+def post_newtonian_backend(mass: float) -> PostNewtonianBackend:
+    """Geteilte PN-Backends pro Masse (Cache bleibt über Aufrufe erhalten)."""
+    return PostNewtonianBackend(mass)
+
+
+def as_backend(obj) -> MetricBackend:
+    """
+    Wandle ein Metrik-Objekt in ein Backend um.
+
+    Args:
+        obj: MetricBackend, UnifiedSSZMetric (oder Objekt mit
+             metric_function_A_array) oder Masse in kg (→ PN-Serie)
+
+    Returns:
+        MetricBackend
+    """
+    if isinstance(obj, MetricBackend):
+        return obj
+    if hasattr(obj, 'metric_function_A_array'):
+        cache = getattr(obj, '_cache', None)
+        if isinstance(cache, dict):
+            backend = cache.get('metric_backend')
+            if backend is None:
+                backend = cache['metric_backend'] = UnifiedMetricBackend(obj)
+            return backend
+        return UnifiedMetricBackend(obj)
+    return post_newtonian_backend(float(obj))
+
+
+def resolve_backend(mass=None, backend=None) -> MetricBackend:
+    """
+    Backend für die funktionalen Module: explizites backend, sonst die
+    PN-Serie für mass (bisheriges Verhalten).
+
+    Args:
+        mass: Masse in kg (oder bereits ein Backend/eine Metrik)
+        backend: MetricBackend, UnifiedSSZMetric oder None
+
+    Returns:
+        MetricBackend
+    """
+    if backend is not None:
+        return as_backend(backend)
+    if mass is None:
+        raise ValueError("either mass or backend is required")
+    return as_backend(mass)
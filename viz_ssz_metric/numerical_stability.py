@@ -5,14 +5,67 @@ Numerical Stability Functions - Konsolidierte numerische Stabilität
 Basierend auf: ssz_theory_segmented.py aus Vorlage-Repo
 Konsolidiert: Alle Overflow-Schutz und Sättigungs-Funktionen
 
+Gemeinsame Kernel für ScalarActionTheory und ssz_theory_segmented (TOV-RHS):
+Python-Floats laufen über einen skalaren math-Schnellpfad, Arrays über
+NumPy-ufuncs (optional in einen out=-Puffer).
+
 © 2025 Carmen Wrede & Lino Casu
 Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
 """
+from __future__ import annotations
+import math
 import numpy as np
 from typing import Union
 
 
-def exp_clip(x: Union[float, np.ndarray], bound: float = 80.0) -> Union[float, np.ndarray]:
+# Skalarer Schnellpfad (math) für Python-/NumPy-Floats und ints ohne out-Puffer
+_SCALAR_TYPES = (float, int)
+
+
+# Skalare Kernel (nur math, keine Objekte) - auch nopython-kompilierbar (jit_kernels)
+
+def exp_clip_scalar(x: float, bound: float = 80.0) -> float:
+    """exp(x) mit |x| ≤ bound (skalar)."""
+    if x > bound:
+        x = bound
+    elif x < -bound:
+        x = -bound
+    return math.exp(x)
+
+
+def sech2_scalar(z: float) -> float:
+    """sech²(z) (skalar): 1/cosh²(z) für |z| < 20, sonst 4×exp(-2|z|)."""
+    a = abs(z)
+    if a < 20.0:
+        c = math.cosh(z)
+        return 1.0 / (c * c)
+    return 4.0 * math.exp(-2.0 * a)
+
+
+def sat_tanh_scalar(x: float, cap: float) -> float:
+    """cap × tanh(x/cap) (skalar, cap ≤ 0 = keine Sättigung)."""
+    if cap <= 0:
+        return x
+    return cap * math.tanh(x / cap)
+
+
+def sat_pos_scalar(y: float, cap: float) -> float:
+    """sat_tanh_scalar(max(y, 0), cap)."""
+    return sat_tanh_scalar(y if y > 0.0 else 0.0, cap)
+
+
+def _buffer(x, out: np.ndarray | None) -> np.ndarray:
+    """Array-Pfad: Ausgabe-Puffer (out oder neues float-Array in Form von x)."""
+    return out if out is not None else np.empty(np.shape(x), dtype=float)
+
+
+def _finish(result: np.ndarray, out: np.ndarray | None):
+    """Array-Pfad: out zurückgeben bzw. 0-d Ergebnis als Skalar."""
+    return out if out is not None else result[()]
+
+
+def exp_clip(x: Union[float, np.ndarray], bound: float = 80.0,
+             out: np.ndarray | None = None) -> Union[float, np.ndarray]:
     """
     Overflow-safe exponential.
     
@@ -23,6 +76,7 @@ def exp_clip(x: Union[float, np.ndarray], bound: float = 80.0) -> Union[float, n
     Args:
         x: Input value(s)
         bound: Maximum absolute value (default: 80.0)
+        out: Optionaler Ausgabe-Puffer (Array-Pfad)
     
     Returns:
         exp(clip(x, -bound, bound))
@@ -33,21 +87,28 @@ def exp_clip(x: Union[float, np.ndarray], bound: float = 80.0) -> Union[float, n
         >>> exp_clip(-100)  # Sicher: exp(-80)
         1.804851e-35
     """
-    x_safe = np.clip(x, -bound, bound)
-    return np.exp(x_safe)
+    if out is None and isinstance(x, _SCALAR_TYPES):
+        return exp_clip_scalar(x, bound)
+    
+    buf = _buffer(x, out)
+    np.clip(x, -bound, bound, out=buf)
+    np.exp(buf, out=buf)
+    return _finish(buf, out)
 
 
-def sech2_stable(z: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def sech2_stable(z: Union[float, np.ndarray],
+                 out: np.ndarray | None = None) -> Union[float, np.ndarray]:
     """
     Overflow-safe sech²(z) = 1/cosh²(z).
     
     Für große |z|: cosh(z) ~ 0.5×exp(|z|) → Overflow!
     
-    Asymptotische Form für |z| ≥ 20:
-    sech²(z) ~ 4×exp(-2|z|)
+    Skalar: 1/cosh²(z) für |z| < 20, sonst asymptotisch sech²(z) ~ 4×exp(-2|z|).
+    Array: mit e = exp(-2|z|) ≤ 1 exakt sech²(z) = 4e/(1+e)² (ohne Maske).
     
     Args:
         z: Input value(s)
+        out: Optionaler Ausgabe-Puffer (Array-Pfad)
     
     Returns:
         sech²(z) without overflow
@@ -58,28 +119,21 @@ def sech2_stable(z: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         >>> sech2_stable(50)  # Kein Overflow!
         1.819...e-44
     """
-    a = np.abs(z)
-    
-    # Für kleine |z|: Exakte Berechnung
-    mask_small = a < 20.0
-    
-    result = np.zeros_like(a)
-    
-    if np.isscalar(z):
-        if a < 20.0:
-            c = np.cosh(z)
-            return 1.0 / (c * c)
-        else:
-            return 4.0 * np.exp(-2.0 * a)
-    else:
-        # Array-Fall
-        c = np.cosh(z[mask_small])
-        result[mask_small] = 1.0 / (c * c)
-        result[~mask_small] = 4.0 * np.exp(-2.0 * a[~mask_small])
-        return result
+    if out is None and isinstance(z, _SCALAR_TYPES):
+        return sech2_scalar(z)
+    
+    e = _buffer(z, out)
+    np.abs(z, out=e)
+    np.multiply(e, -2.0, out=e)
+    np.exp(e, out=e)
+    denom = (1.0 + e)**2
+    np.multiply(e, 4.0, out=e)
+    np.divide(e, denom, out=e)
+    return _finish(e, out)
 
 
-def sat_tanh(x: Union[float, np.ndarray], cap: float | None) -> Union[float, np.ndarray]:
+def sat_tanh(x: Union[float, np.ndarray], cap: float | None,
+             out: np.ndarray | None = None) -> Union[float, np.ndarray]:
     """
     Glatte Sättigung via tanh.
     
@@ -93,6 +147,7 @@ def sat_tanh(x: Union[float, np.ndarray], cap: float | None) -> Union[float, np.
     Args:
         x: Input value(s)
         cap: Saturation limit (None or ≤0 = no saturation)
+        out: Optionaler Ausgabe-Puffer (Array-Pfad)
     
     Returns:
         Saturated value
@@ -104,11 +159,22 @@ def sat_tanh(x: Union[float, np.ndarray], cap: float | None) -> Union[float, np.
         1.0  # Saturiert bei cap
     """
     if cap is None or cap <= 0:
-        return x
-    return cap * np.tanh(x / cap)
+        if out is None:
+            return x
+        np.copyto(out, x)
+        return out
+    if out is None and isinstance(x, _SCALAR_TYPES):
+        return sat_tanh_scalar(x, cap)
+    
+    buf = _buffer(x, out)
+    np.divide(x, cap, out=buf)
+    np.tanh(buf, out=buf)
+    np.multiply(buf, cap, out=buf)
+    return _finish(buf, out)
 
 
-def sat_pos_tanh(y: Union[float, np.ndarray], cap: float | None) -> Union[float, np.ndarray]:
+def sat_pos_tanh(y: Union[float, np.ndarray], cap: float | None,
+                 out: np.ndarray | None = None) -> Union[float, np.ndarray]:
     """
     Glatte Sättigung für y ≥ 0.
     
@@ -117,6 +183,7 @@ def sat_pos_tanh(y: Union[float, np.ndarray], cap: float | None) -> Union[float,
     Args:
         y: Input value(s)
         cap: Saturation limit (None or ≤0 = no saturation)
+        out: Optionaler Ausgabe-Puffer (Array-Pfad)
     
     Returns:
         Saturated positive value
@@ -127,15 +194,14 @@ def sat_pos_tanh(y: Union[float, np.ndarray], cap: float | None) -> Union[float,
         >>> sat_pos_tanh(10, cap=1)
         0.999...  # Saturiert
     """
-    if np.isscalar(y):
-        y_pos = max(y, 0.0)
-    else:
-        y_pos = np.maximum(y, 0.0)
-    
-    if cap is None or cap <= 0:
-        return y_pos
-    
-    return cap * np.tanh(y_pos / cap)
+    if out is None and isinstance(y, _SCALAR_TYPES):
+        return sat_pos_scalar(y, 0.0 if cap is None else cap)
+    
+    y_pos = _buffer(y, out)
+    np.maximum(y, 0.0, out=y_pos)
+    if cap is not None and cap > 0:
+        sat_tanh(y_pos, cap, out=y_pos)
+    return _finish(y_pos, out)
 
 
 def sigmoid_saturation(x: Union[float, np.ndarray], x_max: float) -> Union[float, np.ndarray]:
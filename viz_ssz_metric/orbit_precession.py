@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+Exakte Periapsis-Präzession aus dem Bahnintegral (Gauss-Chebyshev)
+
+Für die statische SSZ-Metrik mit B = 1/A und u = GM/(c² r):
+
+    Δφ = 2 ∫_{u_a}^{u_p} L du / sqrt(W(u)) - 2π
+    W(u) = E² - A(u)(1 + L²u²) = (u_p - u)(u - u_a) Q(u)
+
+Mit u = c + h·t hebt sich die Wurzel-Singularität an den Umkehrpunkten
+exakt heraus; Gauss-Chebyshev (1. Art) integriert den glatten Rest:
+
+    Δφ = (2π/N) Σ_k [sqrt(L²/Q(u_k)) - 1]
+
+Schwachfeld (r_p ≥ r_φ, Softplus = Identität): A ist das PN-Polynom
+Σ c_k u^k, und L², Q, L² - Q folgen exakt aus dividierten Differenzen
+(vollständig homogene Polynome h_m) - ohne Auslöschung, daher auch für
+Merkur (Δφ ~ 5e-7 rad) auf Maschinengenauigkeit.
+Starkfeld: direkte Auswertung von metric_function_A_array.
+
+Fehlerkontrolle: N und 2N Knoten vergleichen, Knoten verdoppeln bis
+|Δφ_2N - Δφ_N| ≤ rtol|Δφ| + atol. Knoten-Sätze werden gecacht.
+
+© 2025 Carmen Wrede & Lino Casu
+Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
+"""
+from __future__ import annotations
+import numpy as np
+from typing import Dict, List
+
+try:
+    from .circular_orbits import asymptotic_rs
+except ImportError:
+    from circular_orbits import asymptotic_rs
+
+
+# Cache: N -> Chebyshev-Knoten t_k = cos((2k-1)π/(2N))
+_NODE_CACHE: Dict[int, np.ndarray] = {}
+
+# Bahnen pro Block (Zwischen-Arrays bleiben im Cache)
+_CHUNK = 1 << 14
+
+# Softplus-Abweichung exp(-β(A-ε))/β unter Maschinengenauigkeit
+_SOFTPLUS_IDENTITY_ARG = 40.0
+
+
+def chebyshev_nodes(n: int) -> np.ndarray:
+    """Gauss-Chebyshev-Knoten (1. Art), gecacht."""
+    nodes = _NODE_CACHE.get(n)
+    if nodes is None:
+        nodes = np.cos((2.0 * np.arange(1, n + 1) - 1.0) * np.pi / (2.0 * n))
+        _NODE_CACHE[n] = nodes
+    return nodes
+
+
+def _homogeneous_2(x, y, m_max: int) -> List[np.ndarray]:
+    """h_m(x, y) = Σ_j x^j y^(m-j) für m = 0..m_max."""
+    h = [np.ones_like(x)]
+    y_pow = np.ones_like(y)
+    for _ in range(m_max):
+        y_pow = y_pow * y
+        h.append(x * h[-1] + y_pow)
+    return h
+
+
+def _sum_sqrt_pn(coeffs: np.ndarray, u_p: np.ndarray, u_a: np.ndarray,
+                 n: int) -> np.ndarray:
+    """Σ_k [sqrt(L²/Q) - 1] / N für das PN-Polynom (auslöschungsfrei)."""
+    c = coeffs
+    K = len(c) - 1
+    h = _homogeneous_2(u_p, u_a, K + 1)
+    D_a = sum(c[k] * h[k - 1] for k in range(1, K + 1))
+    D_g = sum(c[k] * h[k + 1] for k in range(1, K + 1))
+    L2 = -D_a / (u_p + u_a + D_g)
+
+    # h_m(u_p, u, u_a) = Σ_j u^j h_(m-j)(u_p, u_a)  →  L² - Q = -Σ_j d_j u^j
+    # mit d_j = Σ_k c_k [h_(k-2-j) + L² h_(k-j)] (pro Bahn, dann Horner in u)
+    d = []
+    for j in range(K + 1):
+        low = sum(c[k] * h[k - 2 - j] for k in range(j + 2, K + 1))
+        high = sum(c[k] * h[k - j] for k in range(max(j, 1), K + 1))
+        d.append(low + L2 * high)
+
+    t = chebyshev_nodes(n)
+    u = 0.5 * (u_p + u_a)[:, None] + 0.5 * (u_p - u_a)[:, None] * t[None, :]
+    P = d[K][:, None] * np.ones_like(u)
+    for j in range(K - 1, -1, -1):
+        P = P * u + d[j][:, None]
+    delta = -P / (L2[:, None] + P)
+    return np.mean(delta / (1.0 + np.sqrt(1.0 + delta)), axis=1)
+
+
+def _sum_sqrt_generic(A_of_u, u_p: np.ndarray, u_a: np.ndarray, n: int) -> np.ndarray:
+    """Σ_k [sqrt(L²/Q) - 1] / N mit direkter A-Auswertung (Starkfeld)."""
+    A_p, A_a = A_of_u(u_p), A_of_u(u_a)
+    L2 = (A_a - A_p) / (A_p * u_p**2 - A_a * u_a**2)
+    E2 = A_p * (1.0 + L2 * u_p**2)
+
+    t = chebyshev_nodes(n)
+    mid, half = 0.5 * (u_p + u_a), 0.5 * (u_p - u_a)
+    u = mid[:, None] + half[:, None] * t[None, :]
+    W = E2[:, None] - A_of_u(u) * (1.0 + L2[:, None] * u**2)
+    Q = W / (half[:, None]**2 * (1.0 - t[None, :]**2))
+    # Q ≤ 0: keine gebundene Bahn zwischen den Umkehrpunkten
+    ratio = np.where(Q > 0, L2[:, None] / np.where(Q > 0, Q, 1.0), np.nan)
+    with np.errstate(invalid='ignore'):
+        return np.mean(np.sqrt(ratio) - 1.0, axis=1)
+
+
+def periapsis_shift(metric, semi_major_axis, eccentricity, rtol: float = 1e-10,
+                    atol: float = 1e-16, n_start: int = 4,
+                    max_nodes: int = 512) -> np.ndarray:
+    """
+    Exakte Periapsis-Verschiebung pro Umlauf, vektorisiert über (a, e).
+
+    Die Bahn ist durch ihre Umkehrpunkte r_p = a(1-e), r_a = a(1+e)
+    in Schwarzschild-Koordinaten definiert.
+
+    Args:
+        metric: UnifiedSSZMetric instance
+        semi_major_axis: a [m] (scalar or array)
+        eccentricity: e, 0 ≤ e < 1 (broadcast mit a)
+        rtol, atol: Fehlertoleranz für Δφ [rad]
+        n_start: Anfangszahl der Knoten
+        max_nodes: Maximale Knotenzahl (danach NaN, falls nicht konvergiert)
+
+    Returns:
+        Δφ [rad] pro Umlauf (NaN für ungebundene/eingefangene Bahnen)
+    """
+    a, e = np.broadcast_arrays(np.asarray(semi_major_axis, float),
+                               np.asarray(eccentricity, float))
+    shape = a.shape
+    a, e = a.ravel(), e.ravel()
+    if np.any((e < 0) | (e >= 1)):
+        raise ValueError("eccentricity must satisfy 0 <= e < 1")
+
+    p = metric.params
+    M_geom = p.G * p.mass / p.c**2
+    u_p = M_geom / (a * (1.0 - e))
+    u_a = M_geom / (a * (1.0 + e))
+    coeffs = metric.pn_series_coefficients()
+
+    # PN-Pfad: außerhalb r_φ und Softplus-Floor wirkungslos
+    A_p_pn = np.polynomial.polynomial.polyval(u_p, coeffs)
+    weak = ((M_geom / u_p) >= metric.r_phi) & \
+           (p.beta * (A_p_pn - p.epsilon) > _SOFTPLUS_IDENTITY_ARG)
+
+    def A_of_u(u):
+        return metric.metric_function_A_array(M_geom / u)
+
+    def evaluate(idx, n):
+        if idx.size > _CHUNK:
+            return np.concatenate([evaluate(idx[i:i + _CHUNK], n)
+                                   for i in range(0, idx.size, _CHUNK)])
+        out = np.empty(idx.size)
+        w = weak[idx]
+        if np.any(w):
+            out[w] = _sum_sqrt_pn(coeffs, u_p[idx][w], u_a[idx][w], n)
+        if np.any(~w):
+            # Kreisbahn-Grenzfall im Starkfeld: minimale Exzentrizität
+            up, ua = u_p[idx][~w], u_a[idx][~w]
+            ua = np.minimum(ua, up * (1.0 - 1e-6))
+            out[~w] = _sum_sqrt_generic(A_of_u, up, ua, n)
+        return 2.0 * np.pi * out
+
+    result = np.full(a.size, np.nan)
+    pending = np.arange(a.size)
+    n = n_start
+    coarse = evaluate(pending, n)
+    while pending.size and n <= max_nodes:
+        fine = evaluate(pending, 2 * n)
+        done = np.abs(fine - coarse) <= rtol * np.abs(fine) + atol
+        done |= ~np.isfinite(fine)
+        result[pending[done]] = fine[done]
+        pending, coarse = pending[~done], fine[~done]
+        n *= 2
+    return result.reshape(shape)
+
+
+def periapsis_shift_for_masses(masses, semi_major_axis, eccentricity,
+                               metric_factory=None, **kwargs) -> np.ndarray:
+    """
+    Δφ für viele (M, a, e); Massen mit gleicher Metrik-Signatur gruppiert.
+
+    Args:
+        masses: Massen [kg]
+        semi_major_axis: a [m]
+        eccentricity: e
+        metric_factory: Callable mass -> Metrik (default: UnifiedSSZMetric)
+        **kwargs: Weiter an periapsis_shift
+
+    Returns:
+        Δφ [rad] pro Umlauf (Broadcast-Form der Eingaben)
+    """
+    if metric_factory is None:
+        try:
+            from .unified_metric import UnifiedSSZMetric
+        except ImportError:
+            from unified_metric import UnifiedSSZMetric
+        metric_factory = lambda m: UnifiedSSZMetric(mass=float(m))
+
+    M, a, e = np.broadcast_arrays(np.asarray(masses, float),
+                                  np.asarray(semi_major_axis, float),
+                                  np.asarray(eccentricity, float))
+    shape = M.shape
+    M, a, e = M.ravel(), a.ravel(), e.ravel()
+    out = np.full(M.size, np.nan)
+
+    reference = metric_factory(M.max())
+    G, c = reference.params.G, reference.params.c
+    r_s = 2.0 * G * M / c**2
+    asymptotic = r_s > asymptotic_rs(reference)
+    if np.any(asymptotic):
+        # Skalierung: Δφ hängt nur von a/(GM/c²) und e ab
+        scale = reference.params.mass / M[asymptotic]
+        out[asymptotic] = periapsis_shift(reference, a[asymptotic] * scale,
+                                          e[asymptotic], **kwargs)
+    for m in np.unique(M[~asymptotic]):
+        sel = (M == m)
+        out[sel] = periapsis_shift(metric_factory(m), a[sel], e[sel], **kwargs)
+    return out.reshape(shape)
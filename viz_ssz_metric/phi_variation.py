@@ -12,7 +12,8 @@ from __future__ import annotations
 import numpy as np
 from typing import Callable, Tuple
 from .ssz_mirror_metric import (
-    schwarzschild_radius, D_SSZ, A_SSZ, solve_r_star, PHI, G_DEFAULT, C_DEFAULT
+    schwarzschild_radius, D_SSZ, A_SSZ, solve_r_star, intersection_time_dilation,
+    PHI, G_DEFAULT, C_DEFAULT
 )
 
 
@@ -140,6 +141,9 @@ def phi_landscape(mass: float, phi_range: Tuple[float, float] = (0.5, 3.0),
                   num: int = 100):
     """Berechne Metrik-Landschaft für verschiedene φ-Werte.
     
+    u*(φ) hängt nicht von der Masse ab (r* = u* · r_s); die Masse
+    bleibt für die Aufruf-Kompatibilität Teil der Signatur.
+    
     Args:
         mass: Masse in kg
         phi_range: (φ_min, φ_max)
@@ -148,32 +152,18 @@ def phi_landscape(mass: float, phi_range: Tuple[float, float] = (0.5, 3.0),
     Returns:
         dict mit Keys: 'phi', 'r_star', 'D_star', 'epsilon_3'
     """
-    rs = schwarzschild_radius(mass)
     phi_arr = np.linspace(phi_range[0], phi_range[1], num)
     
-    r_star_arr = []
-    D_star_arr = []
-    eps3_arr = []
-    
-    for varphi in phi_arr:
-        try:
-            rstar = solve_r_star(rs, varphi)
-            D_star = D_SSZ(rstar, rs, varphi)
-            eps3 = epsilon_3_phi(varphi)
-            
-            r_star_arr.append(rstar/rs)
-            D_star_arr.append(D_star)
-            eps3_arr.append(eps3)
-        except:
-            r_star_arr.append(np.nan)
-            D_star_arr.append(np.nan)
-            eps3_arr.append(np.nan)
+    # Alle φ gleichzeitig (NaN, wo kein Schnittpunkt existiert)
+    result = intersection_time_dilation(phi_arr)
+    with np.errstate(invalid='ignore'):
+        eps3_arr = np.where(np.isfinite(result['u']), epsilon_3_phi(phi_arr), np.nan)
     
     return {
         'phi': phi_arr,
-        'u_star': np.array(r_star_arr),
-        'D_star': np.array(D_star_arr),
-        'epsilon_3': np.array(eps3_arr)
+        'u_star': result['u'],
+        'D_star': result['D'],
+        'epsilon_3': eps3_arr
     }
 
 
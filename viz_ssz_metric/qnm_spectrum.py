@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+Quasi-Normal-Moden Spektrum für das SSZ-Potential (WKB 3. Ordnung)
+
+Ersetzt die hart kodierten Schwarzschild-Werte durch eine echte
+Berechnung aus der Metrik-Funktion A(r) der UnifiedSSZMetric:
+
+1. Effektives Potential V_s(r) für Spin s ∈ {0, 1, 2} aus A(r)
+2. Spektrale (Chebyshev-) Darstellung von A und V um das Potential-Maximum
+3. Ableitungen d^k V / dr*^k (k ≤ 6) in der Schildkröten-Koordinate
+4. Iyer-Will WKB-Formel 3. Ordnung für viele (l, n) auf einmal
+
+ω·M ist masseninvariant bis auf Δ(M) → Cache pro dimensionsloser
+Metrik-Signatur (Δ(M), r_φ/M, φ, PN-Koeffizienten, Sättigung).
+
+Referenzen:
+    Schutz & Will (1985), ApJ 291, L33
+    Iyer & Will (1987), Phys. Rev. D 35, 3621
+
+© 2025 Carmen Wrede & Lino Casu
+Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
+"""
+from __future__ import annotations
+import numpy as np
+from numpy.polynomial import chebyshev as C
+from typing import Dict, Tuple
+
+
+# Cache: (Metrik-Signatur, spin, l) -> [V0, V0', ..., V0^(6)] am Maximum
+_DERIVATIVE_CACHE: Dict[tuple, np.ndarray] = {}
+
+
+def clear_cache() -> None:
+    """Leere den QNM-Ableitungs-Cache (z.B. nach Parameteränderung)."""
+    _DERIVATIVE_CACHE.clear()
+
+
+def metric_signature(metric) -> tuple:
+    """
+    Dimensionslose Signatur der Metrik A(x) mit x = r/(GM/c²).
+
+    Zwei Metriken mit gleicher Signatur haben identische ω·M
+    (Masse geht nur über Δ(M) und r_φ/M ein).
+
+    Args:
+        metric: UnifiedSSZMetric instance
+
+    Returns:
+        Hashbares Tupel
+    """
+    p = metric.params
+    M_geom = p.G * p.mass / p.c**2
+    return (
+        round(float(metric.delta_M_correction()), 12),
+        round(float(metric.r_phi / M_geom), 12),
+        float(p.varphi), int(p.pn_order), int(p.K_segments),
+        float(p.epsilon), float(p.beta),
+        tuple(float(e) for e in p.pn_epsilons),
+    )
+
+
+def wkb_iyer_will(V: np.ndarray, n) -> np.ndarray:
+    """
+    Iyer-Will WKB-Formel 3. Ordnung.
+
+    ω² = [V0 + (-2V0'')^½ Λ] - i α (-2V0'')^½ (1 + Ω),   α = n + ½
+
+    Args:
+        V: [V0, V0', ..., V0^(6)] - Ableitungen nach r* am Maximum
+        n: Overtone number(s) (scalar or array)
+
+    Returns:
+        Komplexe ω (Re > 0, Im < 0), gleiche Form wie n;
+        NaN, wo die WKB-Lösung nicht gedämpft ist (Im ω ≥ 0)
+    """
+    V0, _, V2, V3, V4, V5, V6 = V
+    alpha = np.asarray(n, dtype=float) + 0.5
+    a2 = alpha**2
+    s = np.sqrt(-2.0 * V2)
+
+    Lam = (1.0 / s) * (
+        (1.0 / 8.0) * (V4 / V2) * (0.25 + a2)
+        - (1.0 / 288.0) * (V3 / V2)**2 * (7.0 + 60.0 * a2)
+    )
+    Omega = (1.0 / (-2.0 * V2)) * (
+        (5.0 / 6912.0) * (V3 / V2)**4 * (77.0 + 188.0 * a2)
+        - (1.0 / 384.0) * (V3**2 * V4 / V2**3) * (51.0 + 100.0 * a2)
+        + (1.0 / 2304.0) * (V4 / V2)**2 * (67.0 + 68.0 * a2)
+        + (1.0 / 288.0) * (V3 * V5 / V2**2) * (19.0 + 28.0 * a2)
+        - (1.0 / 288.0) * (V6 / V2) * (5.0 + 4.0 * a2)
+    )
+
+    omega2 = (V0 + s * Lam) - 1j * alpha * s * (1.0 + Omega)
+    omega = np.sqrt(omega2.astype(complex))
+    # Konvention: Re ω > 0, Im ω < 0 (gedämpft)
+    omega = np.where(omega.real < 0, -omega, omega)
+    # Wachsende "Moden" liegen außerhalb der WKB-Gültigkeit
+    return np.where(omega.imag < 0, omega, complex(np.nan, np.nan))
+
+
+class QNMSpectrumSolver:
+    """
+    QNM-Spektrum des SSZ-Potentials via WKB 3. Ordnung.
+
+    Alle Größen dimensionslos in Einheiten von M = GM/c²:
+    x = r/M, ω·M = ω × GM/c³.
+
+    Verwendung:
+    >>> solver = QNMSpectrumSolver(metric, spin=2)
+    >>> omega = solver.modes(l_values=[2, 3, 4], n_values=[0, 1, 2])
+    >>> omega.shape
+    (3, 3)
+    """
+
+    def __init__(self, metric, spin: int = 2, degree: int = 24,
+                 half_width: float = 0.5, x_search: Tuple[float, float] = (2.2, 20.0)):
+        """
+        Initialize solver.
+
+        Args:
+            metric: UnifiedSSZMetric instance (braucht metric_function_A_array)
+            spin: Feld-Spin s (0 = Skalar, 1 = EM, 2 = axial-gravitativ)
+            degree: Chebyshev-Grad der lokalen Darstellung
+            half_width: Halbe Fensterbreite um das Maximum (in M)
+            x_search: Suchbereich für das Potential-Maximum (in M);
+                      Untergrenze 2.2 M = 1.1 r_s wie photon_sphere_radius
+        """
+        if spin not in (0, 1, 2):
+            raise ValueError(f"spin must be 0, 1 or 2, got {spin}")
+        self.metric = metric
+        self.spin = spin
+        self.degree = degree
+        self.half_width = half_width
+        self.x_search = x_search
+        p = metric.params
+        self.M_geom = p.G * p.mass / p.c**2
+        self.time_scale = p.G * p.mass / p.c**3
+        self.signature = metric_signature(metric)
+
+    def f(self, x) -> np.ndarray:
+        """A(x) mit x = r/M (vektorisiert)."""
+        return self.metric.metric_function_A_array(np.asarray(x, float) * self.M_geom)
+
+    def _potential_from_fit(self, f_cheb: np.ndarray, l: int, domain) -> np.ndarray:
+        """Chebyshev-Koeffizienten von V_s(x) aus denen von f(x)."""
+        lo, hi = domain
+        # x auf [-1, 1] abgebildet: x = mid + half * t
+        mid, half = 0.5 * (lo + hi), 0.5 * (hi - lo)
+        L = l * (l + 1)
+        t = C.chebpts2(self.degree + 1)
+        x = mid + half * t
+        fx = C.chebval(t, f_cheb)
+        df = C.chebval(t, C.chebder(f_cheb)) / half
+        if self.spin == 0:
+            V = fx * (L / x**2 + df / x)
+        elif self.spin == 1:
+            V = fx * L / x**2
+        else:
+            # Axial-gravitativ mit m(r) = r(1-f)/2 (reguläre BH-Literatur):
+            # V = f [l(l+1)/r² - 6m/r³ + 2m'/r²]
+            m = 0.5 * x * (1.0 - fx)
+            dm = 0.5 * (1.0 - fx) - 0.5 * x * df
+            V = fx * (L / x**2 - 6.0 * m / x**3 + 2.0 * dm / x**2)
+        return C.chebfit(t, V, self.degree)
+
+    def _locate_peak(self, l: int) -> float:
+        """Grobe Lage des Potential-Maximums auf einem dichten Raster."""
+        x = np.linspace(self.x_search[0], self.x_search[1], 4000)
+        fx = self.f(x)
+        dfx = np.gradient(fx, x)
+        L = l * (l + 1)
+        if self.spin == 0:
+            V = fx * (L / x**2 + dfx / x)
+        elif self.spin == 1:
+            V = fx * L / x**2
+        else:
+            m = 0.5 * x * (1.0 - fx)
+            dm = np.gradient(m, x)
+            V = fx * (L / x**2 - 6.0 * m / x**3 + 2.0 * dm / x**2)
+        return float(x[np.argmax(V)])
+
+    def tortoise_derivatives(self, l: int) -> np.ndarray:
+        """
+        Ableitungen d^k V/dr*^k (k = 0..6) am Maximum, mit Cache.
+
+        d/dr* = f(x) d/dx, exakt als Chebyshev-Operationen.
+
+        Args:
+            l: Angular quantum number
+
+        Returns:
+            np.ndarray [V0, V0', ..., V0^(6)] (dimensionslos)
+        """
+        key = (self.signature, self.spin, int(l), self.degree, self.half_width)
+        cached = _DERIVATIVE_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        x_peak = self._locate_peak(l)
+        lo = max(x_peak - self.half_width, self.x_search[0] - self.half_width)
+        hi = x_peak + self.half_width
+        mid, half = 0.5 * (lo + hi), 0.5 * (hi - lo)
+
+        t = C.chebpts2(self.degree + 1)
+        f_cheb = C.chebfit(t, self.f(mid + half * t), self.degree)
+        V_cheb = self._potential_from_fit(f_cheb, l, (lo, hi))
+
+        # Maximum: Nullstelle von V' im Fenster (nächste zu x_peak)
+        roots = C.chebroots(C.chebder(V_cheb))
+        roots = roots[np.isreal(roots)].real
+        roots = roots[np.abs(roots) <= 1.0]
+        t_peak = (x_peak - mid) / half
+        if len(roots) > 0:
+            t_peak = roots[np.argmin(np.abs(roots - t_peak))]
+
+        # Wiederholte Anwendung von D = f d/dx (d/dx = (1/half) d/dt)
+        derivs = [C.chebval(t_peak, V_cheb)]
+        term = V_cheb
+        for _ in range(6):
+            term = C.chebmul(f_cheb, C.chebder(term)) / half
+            term = term[: 2 * self.degree + 1]
+            derivs.append(C.chebval(t_peak, term))
+
+        result = np.array(derivs, dtype=float)
+        _DERIVATIVE_CACHE[key] = result
+        return result
+
+    def modes(self, l_values, n_values) -> np.ndarray:
+        """
+        Dimensionslose QNM-Frequenzen ω·M für alle (l, n).
+
+        WKB gilt nur für n ≤ l; Einträge mit n > l oder ohne Dämpfung
+        (Im ω ≥ 0) sind NaN. Alle endlichen Einträge haben Im ω < 0.
+
+        Args:
+            l_values: Angular quantum numbers (iterable or scalar)
+            n_values: Overtone numbers (iterable or scalar)
+
+        Returns:
+            Complex array, shape (len(l_values), len(n_values))
+        """
+        l_arr = np.atleast_1d(np.asarray(l_values, dtype=int))
+        n_arr = np.atleast_1d(np.asarray(n_values, dtype=float))
+        out = np.empty((len(l_arr), len(n_arr)), dtype=complex)
+        for i, l in enumerate(l_arr):
+            if l < max(self.spin, 1):
+                raise ValueError(f"l={l} not allowed for spin {self.spin}")
+            out[i] = wkb_iyer_will(self.tortoise_derivatives(int(l)), n_arr)
+            out[i, n_arr > l] = complex(np.nan, np.nan)
+        return out
+
+    def modes_physical(self, l_values, n_values) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Physikalische Frequenzen und Dämpfungszeiten.
+
+        Args:
+            l_values: Angular quantum numbers
+            n_values: Overtone numbers
+
+        Returns:
+            (f_hz, tau_s) arrays, shape (len(l_values), len(n_values));
+            NaN außerhalb des WKB-Bereichs (siehe modes)
+        """
+        omega = self.modes(l_values, n_values) / self.time_scale
+        return omega.real / (2.0 * np.pi), -1.0 / omega.imag
+
+
+def qnm_spectrum(metric, l_values, n_values, spin: int = 2) -> np.ndarray:
+    """
+    Kurzform: ω·M für alle (l, n) der gegebenen Metrik.
+
+    Args:
+        metric: UnifiedSSZMetric instance
+        l_values: Angular quantum numbers
+        n_values: Overtone numbers
+        spin: Feld-Spin (default: 2)
+
+    Returns:
+        Complex array, shape (len(l_values), len(n_values))
+    """
+    return QNMSpectrumSolver(metric, spin=spin).modes(l_values, n_values)
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+Radiale Profile - alle Krümmungs- und Energie-Größen auf einem r-Gitter
+
+RadialProfile wertet A, A', A'', B, B' einmal vektorisiert über das
+ganze Gitter aus (Metrik-Backend) und leitet daraus bei Bedarf ab:
+
+- Christoffel-Symbole
+- Ricci- und Einstein-Tensor (kovariant und gemischt), Ricci-Skalar
+- Effektiver T_μν, Flüssigkeits-Zerlegung, Energie-Bedingungen
+- Kretschmann, Weyl C², R_μν R^μν
+- Gezeiten-Eigenwerte, Zeitdilatation, Raychaudhuri dθ/dλ
+
+Jede Größe wird beim ersten Zugriff berechnet und gespeichert.
+
+Verwendung:
+>>> profile = RadialProfile.in_rs(UnifiedSSZMetric(mass=M_SUN), 0.5, 50.0, num=2000)
+>>> profile.fluid['rho'].shape
+(2000,)
+>>> profile.energy_conditions['NEC'].mean()
+
+© 2025 Carmen Wrede & Lino Casu
+Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
+"""
+from __future__ import annotations
+import math
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+try:
+    from .metric_backend import resolve_backend, MetricFunctions
+    from .ssz_mirror_metric import G_DEFAULT, C_DEFAULT
+    from .christoffel_symbols import christoffel_nonzero
+    from .ricci_curvature import curvature_components
+    from .energy_momentum_tensor import fluid_decomposition_from_curvature
+    from .energy_conditions import energy_conditions_from_fluid
+    from .kretschmann_weyl import riemann_invariants, tidal_tensor_eigenvalues
+    from .raychaudhuri import raychaudhuri_equation
+except ImportError:
+    from metric_backend import resolve_backend, MetricFunctions
+    from ssz_mirror_metric import G_DEFAULT, C_DEFAULT
+    from christoffel_symbols import christoffel_nonzero
+    from ricci_curvature import curvature_components
+    from energy_momentum_tensor import fluid_decomposition_from_curvature
+    from energy_conditions import energy_conditions_from_fluid
+    from kretschmann_weyl import riemann_invariants, tidal_tensor_eigenvalues
+    from raychaudhuri import raychaudhuri_equation
+
+
+class RadialProfile:
+    """
+    Lazy, memoisiertes Radialprofil einer statischen, sphärisch-symmetrischen Metrik.
+
+    Alle Größen sind Arrays in der Form von r (θ broadcastet mit r).
+    """
+
+    def __init__(self, r, backend=None, mass: Optional[float] = None,
+                 theta: float = np.pi / 2):
+        """
+        Initialize profile.
+
+        Args:
+            r: Radien in m (Array)
+            backend: MetricBackend oder UnifiedSSZMetric (default: PN-Serie für mass)
+            mass: Masse in kg (nur ohne backend nötig)
+            theta: Polwinkel
+        """
+        self.backend = resolve_backend(mass, backend)
+        self.mass = self.backend.mass
+        self.rs = self.backend.rs
+        self.r = np.asarray(r, dtype=float)
+        self.theta = theta
+        self.functions: MetricFunctions = self.backend.functions(self.r)
+        self._cache = {}
+
+    @classmethod
+    def in_rs(cls, backend=None, r_min: float = 1.5, r_max: float = 50.0,
+              num: int = 500, log: bool = True, mass: Optional[float] = None,
+              theta: float = np.pi / 2) -> 'RadialProfile':
+        """
+        Profil auf einem Gitter in Einheiten von r_s.
+
+        Args:
+            backend: MetricBackend oder UnifiedSSZMetric
+            r_min, r_max: Gittergrenzen in r_s
+            num: Anzahl Punkte
+            log: Logarithmisches (True) oder lineares Gitter
+            mass: Masse in kg (nur ohne backend nötig)
+            theta: Polwinkel
+
+        Returns:
+            RadialProfile
+        """
+        rs = resolve_backend(mass, backend).rs
+        grid = np.geomspace(r_min, r_max, num) if log else np.linspace(r_min, r_max, num)
+        return cls(grid * rs, backend=backend, mass=mass, theta=theta)
+
+    def _memo(self, key, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def __len__(self) -> int:
+        return self.r.size
+
+    def __repr__(self):
+        return (f"RadialProfile({self.backend!r}, {self.r.size} points, "
+                f"r/r_s ∈ [{self.r.min() / self.rs:.3g}, {self.r.max() / self.rs:.3g}])")
+
+    # Metrik
+
+    @property
+    def A(self) -> np.ndarray:
+        return self.functions.A
+
+    @property
+    def B(self) -> np.ndarray:
+        return self.functions.B
+
+    @property
+    def time_dilation(self) -> np.ndarray:
+        """D = √|g_tt| = √A."""
+        return self._memo('time_dilation', lambda: np.sqrt(np.abs(self.A)))
+
+    @property
+    def redshift(self) -> np.ndarray:
+        """Gravitationsrotverschiebung z = 1/D - 1 (nach ∞)."""
+        return self._memo('redshift', lambda: 1.0 / self.time_dilation - 1.0)
+
+    # Krümmung
+
+    @property
+    def christoffel(self) -> Dict[str, np.ndarray]:
+        """Nicht-triviale Christoffel-Symbole (Keys wie christoffel_nonzero)."""
+        return self._memo('christoffel', lambda: christoffel_nonzero(
+            self.mass, self.r, self.theta, self.backend))
+
+    @property
+    def curvature(self) -> Dict[str, np.ndarray]:
+        """Ricci- und Einstein-Komponenten (dict wie curvature_components)."""
+        return self._memo('curvature', lambda: curvature_components(
+            self.mass, self.r, self.theta, self.backend))
+
+    @property
+    def ricci(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(R_tt, R_rr, R_θθ, R_φφ)."""
+        c = self.curvature
+        return c['R_tt'], c['R_rr'], c['R_thth'], c['R_phph']
+
+    @property
+    def ricci_scalar(self) -> np.ndarray:
+        return self.curvature['R']
+
+    @property
+    def einstein(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(G_tt, G_rr, G_θθ, G_φφ)."""
+        c = self.curvature
+        return c['G_tt'], c['G_rr'], c['G_thth'], c['G_phph']
+
+    @property
+    def invariants(self) -> Dict[str, np.ndarray]:
+        """Kretschmann, Weyl C², R_μν R^μν und R (riemann_invariants)."""
+        f = self.functions
+        return self._memo('invariants', lambda: riemann_invariants(
+            self.r, f.A, f.dA, f.d2A, f.B, f.dB))
+
+    @property
+    def tidal_eigenvalues(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(λ_r, λ_θ, λ_φ) wie kretschmann_weyl.tidal_tensor_eigenvalues."""
+        return self._memo('tidal', lambda: tidal_tensor_eigenvalues(
+            self.mass, self.r, self.theta, self.backend))
+
+    # Materie-Seite
+
+    @property
+    def stress_energy(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Effektiver T_μν = (c⁴/8πG) G_μν."""
+        def compute():
+            coupling = (C_DEFAULT**4) / (8 * math.pi * G_DEFAULT)
+            return tuple(coupling * G for G in self.einstein)
+        return self._memo('stress_energy', compute)
+
+    @property
+    def fluid(self) -> Dict[str, np.ndarray]:
+        """ρ, p_r, p_t, Anisotropie (wie perfect_fluid_decomposition)."""
+        return self._memo('fluid', lambda: fluid_decomposition_from_curvature(self.curvature))
+
+    @property
+    def energy_conditions(self) -> Dict[str, np.ndarray]:
+        """WEC, NEC, DEC, SEC, ANEC, AWEC als bool-Arrays."""
+        return self._memo('energy_conditions', lambda: energy_conditions_from_fluid(self.fluid))
+
+    def raychaudhuri(self, v_r, u_t: float = 1.0) -> np.ndarray:
+        """
+        dθ/dλ für radiale Kongruenzen (raychaudhuri_equation).
+
+        Args:
+            v_r: Radiale Geschwindigkeit (Skalar oder Array wie r)
+            u_t: Zeitliche 4-Geschwindigkeit
+
+        Returns:
+            dθ/dλ
+        """
+        v = np.asarray(v_r, dtype=float)
+        key = ('raychaudhuri', v.shape, v.tobytes(), float(u_t))
+        return self._memo(key, lambda: raychaudhuri_equation(
+            self.mass, self.r, self.theta, v, u_t, backend=self.backend))
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """
+        Alle skalaren Größen pro Radius als flaches dict
+        (z.B. für np.savez oder DataFrame).
+        """
+        c = self.curvature
+        out = {'r': self.r, 'r_over_rs': self.r / self.rs}
+        out.update({name: getattr(self.functions, name) for name in MetricFunctions._fields})
+        out['D'] = self.time_dilation
+        out.update({key: c[key] for key in ('R', 'G^t_t', 'G^r_r', 'G^th_th')})
+        out.update(self.invariants)
+        out.update(self.fluid)
+        out.update(self.energy_conditions)
+        return out
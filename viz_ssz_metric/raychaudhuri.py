@@ -22,9 +22,10 @@ import numpy as np
 from typing import Tuple
 from .ricci_curvature import ricci_tensor_diagonal
 from .ssz_mirror_metric import metric_functions_pn, schwarzschild_radius
+from .metric_backend import resolve_backend
 
 
-def expansion_scalar(mass: float, r: float, v_r: float) -> float:
+def expansion_scalar(mass: float, r: float, v_r: float, backend=None) -> float:
     """Expansions-Skalar θ = ∇_a u^a für radiale Geodäte.
     
     Für radial einfallende Materie (u^r ≠ 0, u^θ = u^φ = 0):
@@ -34,14 +35,13 @@ def expansion_scalar(mass: float, r: float, v_r: float) -> float:
         mass: Masse in kg
         r: Radius in m
         v_r: Radiale Geschwindigkeit (m/s)
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         θ (Expansion in 1/s)
     """
-    from .christoffel_symbols import dB_dr_numerical
-    
-    A, B = metric_functions_pn(mass, r)
-    dB = dB_dr_numerical(mass, r)
+    f = resolve_backend(mass, backend).functions(r)
+    B, dB = f.B, f.dB
     
     # Expansion für radiale Bewegung
     theta = (2.0 / r) + (1.0 / (2*np.sqrt(B))) * dB * v_r / np.sqrt(B)
@@ -86,7 +86,7 @@ def rotation_scalar(mass: float, r: float) -> float:
     return 0.0
 
 
-def ricci_focusing_term(mass: float, r: float, theta: float, u_t: float, u_r: float) -> float:
+def ricci_focusing_term(mass: float, r: float, theta: float, u_t: float, u_r: float, backend=None) -> float:
     """Ricci-Fokussierungs-Term R_ab u^a u^b.
     
     Dies ist der Materie-Beitrag zur Fokussierung.
@@ -100,14 +100,16 @@ def ricci_focusing_term(mass: float, r: float, theta: float, u_t: float, u_r: fl
         theta: Polwinkel
         u_t: Zeitliche 4-Geschwindigkeit
         u_r: Radiale 4-Geschwindigkeit
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         R_ab u^a u^b
     """
-    R_tt, R_rr, _, _ = ricci_tensor_diagonal(mass, r, theta)
+    R_tt, R_rr, _, _ = ricci_tensor_diagonal(mass, r, theta, backend)
     
     # Normierung: u_a u^a = -1 (zeitartig)
-    A, B = metric_functions_pn(mass, r)
+    f = resolve_backend(mass, backend).functions(r)
+    A, B = f.A, f.B
     
     # Ricci-Fokussierung
     R_focus = (-A * R_tt * (u_t**2)) + (B * R_rr * (u_r**2))
@@ -116,7 +118,7 @@ def ricci_focusing_term(mass: float, r: float, theta: float, u_t: float, u_r: fl
 
 
 def raychaudhuri_equation(mass: float, r: float, theta: float, 
-                          v_r: float, u_t: float = 1.0) -> float:
+                          v_r: float, u_t: float = 1.0, backend=None) -> float:
     """Berechne Raychaudhuri-Gleichung dθ/dλ.
     
     dθ/dλ = -(1/3)θ² - σ² + ω² - R_ab u^a u^b
@@ -129,20 +131,21 @@ def raychaudhuri_equation(mass: float, r: float, theta: float,
         theta: Polwinkel
         v_r: Radiale Geschwindigkeit (m/s)
         u_t: Zeitliche 4-Geschwindigkeit (normalisiert)
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         dθ/dλ (Änderungsrate der Expansion)
     """
     # Komponenten
-    theta_exp = expansion_scalar(mass, r, v_r)
+    theta_exp = expansion_scalar(mass, r, v_r, backend)
     sigma_sq = shear_scalar(mass, r, v_r)
     omega_sq = rotation_scalar(mass, r)
     
     # 4-Geschwindigkeit (normalisiert für u_a u^a = -1)
-    A, _ = metric_functions_pn(mass, r)
+    A = resolve_backend(mass, backend).A(r)
     u_r = v_r / np.sqrt(A)  # Approximation
     
-    R_focus = ricci_focusing_term(mass, r, theta, u_t, u_r)
+    R_focus = ricci_focusing_term(mass, r, theta, u_t, u_r, backend)
     
     # Raychaudhuri-Gleichung
     dtheta_dlambda = -(1.0/3.0) * (theta_exp**2) - sigma_sq + omega_sq - R_focus
@@ -150,7 +153,7 @@ def raychaudhuri_equation(mass: float, r: float, theta: float,
     return dtheta_dlambda
 
 
-def focusing_theorem_check(mass: float, r: float, theta: float, v_r: float) -> dict:
+def focusing_theorem_check(mass: float, r: float, theta: float, v_r: float, backend=None) -> dict:
     """Prüfe Fokussierungs-Theorem (Penrose-Hawking).
     
     Bedingung: Wenn R_ab u^a u^b ≥ 0 (Energie-Bedingung)
@@ -162,17 +165,18 @@ def focusing_theorem_check(mass: float, r: float, theta: float, v_r: float) -> d
         r: Radius in m
         theta: Polwinkel
         v_r: Radiale Geschwindigkeit
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         dict mit Analyse-Ergebnissen
     """
-    theta_exp = expansion_scalar(mass, r, v_r)
-    dtheta = raychaudhuri_equation(mass, r, theta, v_r)
+    theta_exp = expansion_scalar(mass, r, v_r, backend)
+    dtheta = raychaudhuri_equation(mass, r, theta, v_r, backend=backend)
     
-    A, _ = metric_functions_pn(mass, r)
+    A = resolve_backend(mass, backend).A(r)
     u_t = 1.0
     u_r = v_r / np.sqrt(A)
-    R_focus = ricci_focusing_term(mass, r, theta, u_t, u_r)
+    R_focus = ricci_focusing_term(mass, r, theta, u_t, u_r, backend)
     
     # Prüfe Bedingungen
     energy_condition_satisfied = R_focus >= 0
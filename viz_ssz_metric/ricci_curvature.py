@@ -13,63 +13,117 @@ Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
 from __future__ import annotations
 import numpy as np
 import math
-from typing import Tuple
-from .ssz_mirror_metric import metric_functions_pn, schwarzschild_radius
-from .christoffel_symbols import dA_dr_numerical, dB_dr_numerical
+from typing import Dict, Tuple
+from .ssz_mirror_metric import schwarzschild_radius
+from .metric_backend import resolve_backend
 
 
-def ricci_tensor_diagonal(mass: float, r: float, theta: float) -> Tuple[float, float, float, float]:
+def diagonal_curvature(r, theta, A, dA, d2A, B, dB) -> Dict[str, np.ndarray]:
+    """Ricci- und Einstein-Tensor von diag(-A, B, r², r²sin²θ) in geschlossener Form.
+    
+    Mit X = A'/A + B'/B und Y = A'/A - B'/B:
+    
+    R_tt = A''/(2B) - A' X/(4B) + A'/(rB)
+    R_rr = -A''/(2A) + A' X/(4A) + B'/(rB)
+    R_θθ = 1 - 1/B - r Y/(2B)
+    R_φφ = sin²θ · R_θθ
+    R    = -A''/(AB) + A' X/(2AB) - 2Y/(rB) + 2(1 - 1/B)/r²
+    
+    G^t_t = -(1 - 1/B)/r² - B'/(rB²)
+    G^r_r = -(1 - 1/B)/r² + A'/(rAB)
+    G^θ_θ = G^φ_φ = (A''/A - A'²/(2A²) - A'B'/(2AB) + Y/r) / (2B)
+    
+    Schwarzschild (AB = 1, A = 1 - r_s/r) ergibt R_μν = G_μν = 0.
+    
+    Args:
+        r: Radius in m (Array)
+        theta: Polwinkel (broadcast mit r)
+        A, dA, d2A, B, dB: Metrik-Funktionen und Ableitungen bei r
+    
+    Returns:
+        dict mit Keys 'R_tt', 'R_rr', 'R_thth', 'R_phph', 'R',
+        'R^t_t', 'R^r_r', 'R^th_th', 'R^ph_ph',
+        'G_tt', 'G_rr', 'G_thth', 'G_phph',
+        'G^t_t', 'G^r_r', 'G^th_th', 'G^ph_ph'
+    """
+    r = np.asarray(r, dtype=float)
+    sin2 = np.sin(theta)**2
+    
+    a = dA / A            # A'/A
+    b = dB / B            # B'/B
+    X = a + b
+    Y = a - b
+    m = (1.0 - 1.0 / B) / r**2
+    
+    # Ricci (gemischt)
+    Rt = -(d2A / (2*A*B) - a * X / (4*B) + a / (r*B))   # R^t_t = -R_tt/A
+    Rr = (-d2A / (2*A*B) + a * X / (4*B) + b / (r*B))   # R^r_r = R_rr/B
+    Rth = m - Y / (2*r*B)                                 # R^θ_θ = R_θθ/r²
+    R = Rt + Rr + 2*Rth
+    
+    # Einstein (gemischt)
+    Gt = -m - b / (r*B)
+    Gr = -m + a / (r*B)
+    Gth = (d2A / A - a**2 / 2 - a * b / 2 + Y / r) / (2*B)
+    
+    g_thth = r**2
+    g_phph = r**2 * sin2
+    return {
+        'R_tt': -A * Rt, 'R_rr': B * Rr, 'R_thth': g_thth * Rth, 'R_phph': g_phph * Rth,
+        'R': R,
+        'R^t_t': Rt, 'R^r_r': Rr, 'R^th_th': Rth, 'R^ph_ph': Rth,
+        'G_tt': -A * Gt, 'G_rr': B * Gr, 'G_thth': g_thth * Gth, 'G_phph': g_phph * Gth,
+        'G^t_t': Gt, 'G^r_r': Gr, 'G^th_th': Gth, 'G^ph_ph': Gth,
+    }
+
+
+def curvature_components(mass: float, r, theta, backend=None) -> Dict[str, np.ndarray]:
+    """Alle Ricci- und Einstein-Komponenten in einem Aufruf.
+    
+    A, A', A'', B, B' kommen analytisch aus dem Metrik-Backend; die
+    abhängigen Module (Einstein-Tensor, T_μν, Energie-Bedingungen)
+    werten damit die Metrik nur einmal aus.
+    
+    Args:
+        mass: Masse in kg
+        r: Radius in m (Skalar oder Array)
+        theta: Polwinkel (broadcast mit r)
+        backend: Metrik-Backend (default: PN-Serie für mass)
+    
+    Returns:
+        dict wie diagonal_curvature
+    """
+    f = resolve_backend(mass, backend).functions(r)
+    return diagonal_curvature(r, theta, f.A, f.dA, f.d2A, f.B, f.dB)
+
+
+def ricci_tensor_diagonal(mass: float, r: float, theta: float,
+                          backend=None) -> Tuple[float, float, float, float]:
     """Berechne diagonale Komponenten des Ricci-Tensors.
     
     Für sphärische Symmetrie ist R_μν diagonal:
     R_μν = diag(R_tt, R_rr, R_θθ, R_φφ)
     
     Formeln (aus Christoffel-Symbolen):
-    R_tt = -A'' / (2B) + A' / (4B) (A'/A + B'/B) + A' / (rB)
-    R_rr = -A'' / (2A) + A' / (4A) (A'/A + B'/B) - B' / (rB)
-    R_θθ = 1 - (1/B) + r/(2B) (A'/A - B'/B)
+    R_tt = A'' / (2B) - A' / (4B) (A'/A + B'/B) + A' / (rB)
+    R_rr = -A'' / (2A) + A' / (4A) (A'/A + B'/B) + B' / (rB)
+    R_θθ = 1 - (1/B) - r/(2B) (A'/A - B'/B)
     R_φφ = sin²θ · R_θθ
     
     Args:
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         Tuple (R_tt, R_rr, R_θθ, R_φφ)
     """
-    A, B = metric_functions_pn(mass, r)
-    
-    # Erste Ableitungen
-    dr = 1e-3
-    A_prime = dA_dr_numerical(mass, r, dr)
-    B_prime = dB_dr_numerical(mass, r, dr)
-    
-    # Zweite Ableitungen (numerisch)
-    A_prime_plus = dA_dr_numerical(mass, r + dr, dr)
-    A_prime_minus = dA_dr_numerical(mass, r - dr, dr)
-    A_double_prime = (A_prime_plus - A_prime_minus) / (2 * dr)
-    
-    # R_tt
-    R_tt = (-A_double_prime / (2*B) + 
-            (A_prime / (4*B)) * (A_prime/A + B_prime/B) + 
-            A_prime / (r*B))
-    
-    # R_rr
-    R_rr = (-A_double_prime / (2*A) + 
-            (A_prime / (4*A)) * (A_prime/A + B_prime/B) - 
-            B_prime / (r*B))
-    
-    # R_θθ
-    R_thth = 1.0 - (1.0/B) + (r / (2*B)) * (A_prime/A - B_prime/B)
-    
-    # R_φφ = sin²θ · R_θθ
-    R_phph = (math.sin(theta)**2) * R_thth
-    
-    return R_tt, R_rr, R_thth, R_phph
+    c = curvature_components(mass, r, theta, backend)
+    return c['R_tt'], c['R_rr'], c['R_thth'], c['R_phph']
 
 
-def ricci_scalar(mass: float, r: float, theta: float) -> float:
+def ricci_scalar(mass: float, r: float, theta: float, backend=None) -> float:
     """Berechne Ricci-Skalar R = g^μν R_μν.
     
     R = g^tt R_tt + g^rr R_rr + g^θθ R_θθ + g^φφ R_φφ
@@ -79,29 +133,15 @@ def ricci_scalar(mass: float, r: float, theta: float) -> float:
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         R (Ricci-Skalar)
     """
-    A, B = metric_functions_pn(mass, r)
-    R_tt, R_rr, R_thth, R_phph = ricci_tensor_diagonal(mass, r, theta)
-    
-    # Inverse Metrik
-    g_inv_tt = -1.0 / A
-    g_inv_rr = 1.0 / B
-    g_inv_thth = 1.0 / (r**2)
-    g_inv_phph = 1.0 / (r**2 * math.sin(theta)**2)
-    
-    # Kontraktion
-    R = (g_inv_tt * R_tt + 
-         g_inv_rr * R_rr + 
-         g_inv_thth * R_thth + 
-         g_inv_phph * R_phph)
-    
-    return R
+    return curvature_components(mass, r, theta, backend)['R']
 
 
-def vacuum_deviation(mass: float, r: float, theta: float) -> float:
+def vacuum_deviation(mass: float, r: float, theta: float, backend=None) -> float:
     """Abweichung von Vakuum-Lösung (R_μν - (1/2)g_μν R).
     
     In Vakuum (GR): R_μν = 0 → R = 0
@@ -113,23 +153,16 @@ def vacuum_deviation(mass: float, r: float, theta: float) -> float:
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         ||R_μν - (1/2)g_μν R||² (Frobenius-Norm²)
     """
-    R = ricci_scalar(mass, r, theta)
-    R_tt, R_rr, R_thth, R_phph = ricci_tensor_diagonal(mass, r, theta)
-    A, B = metric_functions_pn(mass, r)
-    
-    # Einstein-Tensor Komponenten G_μν = R_μν - (1/2)g_μν R
-    G_tt = R_tt - (1.0/2.0) * (-A) * R
-    G_rr = R_rr - (1.0/2.0) * B * R
-    G_thth = R_thth - (1.0/2.0) * (r**2) * R
-    G_phph = R_phph - (1.0/2.0) * (r**2 * math.sin(theta)**2) * R
+    c = curvature_components(mass, r, theta, backend)
     
     # Norm² (summiere |G_μμ|²)
-    norm_sq = (abs(G_tt)**2 + abs(G_rr)**2 + 
-               abs(G_thth)**2 + abs(G_phph)**2)
+    norm_sq = (np.abs(c['G_tt'])**2 + np.abs(c['G_rr'])**2 + 
+               np.abs(c['G_thth'])**2 + np.abs(c['G_phph'])**2)
     
     return norm_sq
 
@@ -15,12 +15,14 @@ from __future__ import annotations
 import numpy as np
 import math
 from typing import Tuple
-from .christoffel_symbols import christoffel_nonzero, dA_dr_numerical, dB_dr_numerical
-from .ssz_mirror_metric import metric_functions_pn, schwarzschild_radius
+from .christoffel_symbols import christoffel_nonzero
+from .ssz_mirror_metric import schwarzschild_radius
+from .metric_backend import resolve_backend
+from .kretschmann_weyl import curvature_invariants
 
 
 def d_Gamma_dr(mass: float, r: float, theta: float, 
-               symbol_name: str, dr: float = 1e-3) -> float:
+               symbol_name: str, dr: float = 1e-3, backend=None) -> float:
     """Numerische Ableitung eines Christoffel-Symbols nach r.
     
     Args:
@@ -29,17 +31,18 @@ def d_Gamma_dr(mass: float, r: float, theta: float,
         theta: Polwinkel
         symbol_name: Name des Symbols (z.B. 'Gamma^t_tr')
         dr: Finite-difference Schritt
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         ∂Γ/∂r
     """
-    gamma_plus = christoffel_nonzero(mass, r + dr, theta)
-    gamma_minus = christoffel_nonzero(mass, r - dr, theta)
+    gamma_plus = christoffel_nonzero(mass, r + dr, theta, backend)
+    gamma_minus = christoffel_nonzero(mass, r - dr, theta, backend)
     
     return (gamma_plus[symbol_name] - gamma_minus[symbol_name]) / (2 * dr)
 
 
-def riemann_nonzero_components(mass: float, r: float, theta: float) -> dict:
+def riemann_nonzero_components(mass: float, r: float, theta: float, backend=None) -> dict:
     """Berechne nicht-triviale Komponenten des Riemann-Tensors.
     
     Für statische, sphärisch-symmetrische Metrik sind wichtigste:
@@ -53,26 +56,21 @@ def riemann_nonzero_components(mass: float, r: float, theta: float) -> dict:
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         dict mit nicht-trivialen Riemann-Komponenten
     """
-    A, B = metric_functions_pn(mass, r)
-    dA = dA_dr_numerical(mass, r)
-    dB = dB_dr_numerical(mass, r)
-    
-    # Zweite Ableitungen (numerisch)
-    dr_step = 1e-3
-    d2A = (dA_dr_numerical(mass, r + dr_step) - dA_dr_numerical(mass, r - dr_step)) / (2 * dr_step)
-    
-    gamma = christoffel_nonzero(mass, r, theta)
+    f = resolve_backend(mass, backend).functions(r)
+    gamma = christoffel_nonzero(mass, r, theta, backend)
     
     # R^r_trt (wichtigste Komponente - Zeitdilatationsgrad)
     # R^r_trt = ∂_r Γ^r_tt - ∂_t Γ^r_tr + Γ^r_λr Γ^λ_tt - Γ^r_λt Γ^λ_tr
     # Da statisch: ∂_t = 0
     # Vereinfacht: R^r_trt ≈ ∂_r(A'/2B) + (A'/2A)²
     
-    d_Gamma_r_tt = d_Gamma_dr(mass, r, theta, 'Gamma^r_tt', dr_step)
+    # ∂_r Γ^r_tt = ∂_r(A'/2B) = A''/(2B) - A'B'/(2B²)
+    d_Gamma_r_tt = f.d2A / (2 * f.B) - f.dA * f.dB / (2 * f.B**2)
     
     R_r_trt = d_Gamma_r_tt + (gamma['Gamma^t_tr'])**2
     
@@ -86,7 +84,7 @@ def riemann_nonzero_components(mass: float, r: float, theta: float) -> dict:
     
     # R^φ_θφθ (polar-azimuthal)
     # R^φ_θφθ ≈ sin²θ / r²
-    R_ph_thphth = (math.sin(theta)**2) / (r**2)
+    R_ph_thphth = (np.sin(theta)**2) / (r**2)
     
     return {
         'R^r_trt': R_r_trt,
@@ -96,7 +94,7 @@ def riemann_nonzero_components(mass: float, r: float, theta: float) -> dict:
     }
 
 
-def ricci_scalar_approximation(mass: float, r: float) -> float:
+def ricci_scalar_approximation(mass: float, r: float, backend=None) -> float:
     """Ricci-Skalar R = g^μν R_μν (Approximation).
     
     Für schwaches Feld:
@@ -107,53 +105,41 @@ def ricci_scalar_approximation(mass: float, r: float) -> float:
     Args:
         mass: Masse in kg
         r: Radius in m
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         R (Ricci-Skalar, approximativ)
     """
-    A, _ = metric_functions_pn(mass, r)
-    
-    # Zweite radiale Ableitung
-    dr = 1e-3
-    d2A = (dA_dr_numerical(mass, r + dr) - dA_dr_numerical(mass, r - dr)) / (2 * dr)
+    f = resolve_backend(mass, backend).functions(r)
     
     # Approximation: R ≈ -d²A/dr² / A
-    return -d2A / A
+    return -f.d2A / f.A
 
 
-def kretschmann_scalar(mass: float, r: float, theta: float) -> float:
+def kretschmann_scalar(mass: float, r: float, theta: float, backend=None) -> float:
     """Kretschmann-Skalar K = R_μνρσ R^μνρσ.
     
     Invariante Krümmungsgröße (unabhängig von Koordinaten).
     
     Für Schwarzschild: K = 48(GM)²/(c⁴r⁶) = 12r_s²/r⁶
     
-    SSZ-Korrektur wird hier approximiert.
+    SSZ: exakt aus allen Riemann-Komponenten
+    (kretschmann_weyl.riemann_invariants).
     
     Args:
         mass: Masse in kg
         r: Radius in m
         theta: Polwinkel
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         K (Kretschmann-Skalar)
     """
-    rs = schwarzschild_radius(mass)
-    
-    # GR-Wert (Baseline)
-    K_GR = 12 * (rs**2) / (r**6)
-    
-    # SSZ-Korrektur (aus Riemann-Komponenten)
-    riemann = riemann_nonzero_components(mass, r, theta)
-    
-    # Approximative Beiträge (vollständig: summiere alle R_μνρσ R^μνρσ)
-    K_correction = abs(riemann['R^r_trt'])**2 + abs(riemann['R^th_rthr'])**2
-    
-    return K_GR + K_correction
+    return curvature_invariants(mass, r, backend)['kretschmann']
 
 
 def tidal_force_tensor(mass: float, r: float, theta: float, 
-                       separation: float = 1.0) -> Tuple[float, float, float]:
+                       separation: float = 1.0, backend=None) -> Tuple[float, float, float]:
     """Gezeitenkraft-Tensor (Tidal Force) aus Riemann-Tensor.
     
     F_tidal^i = -R^i_t0t · separation
@@ -163,11 +149,12 @@ def tidal_force_tensor(mass: float, r: float, theta: float,
         r: Radius in m
         theta: Polwinkel
         separation: Trennung der Testmassen (m)
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         Tuple (F_r, F_theta, F_phi) Gezeitenkräfte
     """
-    riemann = riemann_nonzero_components(mass, r, theta)
+    riemann = riemann_nonzero_components(mass, r, theta, backend)
     
     # Radiale Gezeitenkraft
     F_r = -riemann['R^r_trt'] * separation
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Ringdown Template Bank - Gedämpfte Sinuswellen aus dem SSZ-QNM-Spektrum
+
+h(t) = A · exp(-t/τ) · cos(2π f t + φ0)
+
+mit f, τ aus QNMSpectrumSolver für jeden Gitterpunkt
+(Masse, Feld-Spin, l, n, Amplitude, Phase).
+
+- ω·M einmal pro (Metrik-Signatur, Spin, l, n), dann Skalierung mit 1/M
+- Wellenformen vektorisiert, blockweise (chunks) als float32
+- Große Banken direkt in ein .npy auf Platte (np.memmap, Pfad erforderlich)
+- Streaming-Matched-Filter gegen Daten, ohne die Bank komplett zu laden
+
+© 2025 Carmen Wrede & Lino Casu
+Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
+"""
+from __future__ import annotations
+import numpy as np
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+try:
+    from .unified_metric import UnifiedSSZMetric
+except ImportError:
+    from unified_metric import UnifiedSSZMetric
+
+
+# Banken oberhalb dieser Größe werden nur als memmap (mit path) geschrieben
+MEMMAP_THRESHOLD_BYTES = 512 * 1024**2
+
+GRID_FIELDS = ('mass', 'spin', 'l', 'n', 'amplitude', 'phase')
+
+
+class RingdownTemplateBank:
+    """
+    Dichte Template-Bank für SSZ-Ringdown-Signale.
+
+    Das Gitter ist das kartesische Produkt aller Parameter-Achsen;
+    Template i hat die Parameter self.grid[...][i].
+
+    Verwendung:
+    >>> bank = RingdownTemplateBank(masses=[10*M_SUN, 30*M_SUN], l_values=[2, 3],
+    ...                             sample_rate=4096, duration=0.1)
+    >>> H = bank.generate()            # (n_templates, n_samples) float32
+    >>> for start, block in bank.iter_chunks(1024):
+    ...     pass
+    """
+
+    def __init__(self, masses: Sequence[float],
+                 l_values: Sequence[int] = (2,),
+                 n_values: Sequence[int] = (0,),
+                 spins: Sequence[int] = (2,),
+                 amplitudes: Sequence[float] = (1.0,),
+                 phases: Sequence[float] = (0.0,),
+                 sample_rate: float = 4096.0,
+                 duration: Optional[float] = None,
+                 n_samples: Optional[int] = None,
+                 dtype=np.float32):
+        """
+        Initialize template bank.
+
+        Args:
+            masses: Black hole masses [kg]
+            l_values: Angular quantum numbers
+            n_values: Overtone numbers (n ≤ l, sonst ValueError)
+            spins: Feld-Spins s der Störung (0, 1, 2); die SSZ-Metrik ist statisch
+            amplitudes: Amplituden A
+            phases: Anfangsphasen φ0 [rad]
+            sample_rate: Abtastrate [Hz]
+            duration: Länge [s] (alternativ n_samples)
+            n_samples: Anzahl Samples (default: 10 τ der längsten Mode)
+            dtype: Ausgabe-Datentyp (default: float32)
+        """
+        if sample_rate <= 0:
+            raise ValueError(f"sample_rate must be positive, got {sample_rate}")
+        self.sample_rate = float(sample_rate)
+        self.dtype = np.dtype(dtype)
+
+        axes = [np.asarray(masses, dtype=float), np.asarray(spins, dtype=int),
+                np.asarray(l_values, dtype=int), np.asarray(n_values, dtype=int),
+                np.asarray(amplitudes, dtype=float), np.asarray(phases, dtype=float)]
+        mesh = np.meshgrid(*axes, indexing='ij')
+        self.grid: Dict[str, np.ndarray] = {
+            name: m.ravel() for name, m in zip(GRID_FIELDS, mesh)
+        }
+        self.n_templates = self.grid['mass'].size
+
+        self.f_hz, self.tau = self._qnm_table(axes[0], axes[1], axes[2], axes[3])
+
+        if n_samples is None:
+            if duration is None:
+                duration = 10.0 * float(np.max(self.tau))
+            n_samples = int(np.ceil(duration * self.sample_rate))
+        if n_samples <= 0:
+            raise ValueError(f"n_samples must be positive, got {n_samples}")
+        self.n_samples = int(n_samples)
+        self.t = np.arange(self.n_samples) / self.sample_rate
+
+    def _qnm_table(self, masses, spins, l_values, n_values) -> Tuple[np.ndarray, np.ndarray]:
+        """f [Hz] und τ [s] für jedes Template (ein Spektrum pro Masse und Spin)."""
+        shape = (len(masses), len(spins), len(l_values), len(n_values))
+        f = np.empty(shape)
+        tau = np.empty(shape)
+        for i, mass in enumerate(masses):
+            metric = UnifiedSSZMetric(mass=float(mass))
+            time_scale = metric.params.G * metric.params.mass / metric.params.c**3
+            for j, s in enumerate(spins):
+                omega = metric.qnm_spectrum(l_values, n_values, spin=int(s)) / time_scale
+                f[i, j] = omega.real / (2.0 * np.pi)
+                tau[i, j] = -1.0 / omega.imag
+        # Nur gedämpfte Moden (qnm_spectrum: NaN außerhalb des WKB-Bereichs)
+        bad = ~(np.isfinite(f) & np.isfinite(tau) & (tau > 0))
+        if np.any(bad):
+            pairs = sorted({(int(l_values[k]), int(n_values[m]))
+                            for k, m in zip(*np.nonzero(bad)[2:])})
+            raise ValueError(f"no damped QNM for (l, n) = {pairs} (WKB requires n <= l)")
+        # Amplitude/Phase hängen nicht von f, τ ab → broadcast auf volles Gitter
+        n_rest = self.n_templates // f.size
+        return np.repeat(f.ravel(), n_rest), np.repeat(tau.ravel(), n_rest)
+
+    @property
+    def nbytes(self) -> int:
+        """Größe der vollständigen Bank in Bytes."""
+        return self.n_templates * self.n_samples * self.dtype.itemsize
+
+    def waveforms(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """
+        Wellenformen der Templates [start, stop), vektorisiert.
+
+        Args:
+            start: Erster Template-Index
+            stop: Letzter Index (exklusiv), default: n_templates
+
+        Returns:
+            Array (stop - start, n_samples) im Bank-dtype
+        """
+        stop = self.n_templates if stop is None else min(stop, self.n_templates)
+        sl = slice(start, stop)
+        t = self.t[None, :]
+        f = self.f_hz[sl, None]
+        tau = self.tau[sl, None]
+        A = self.grid['amplitude'][sl, None]
+        phi0 = self.grid['phase'][sl, None]
+        h = A * np.exp(-t / tau) * np.cos(2.0 * np.pi * f * t + phi0)
+        return h.astype(self.dtype, copy=False)
+
+    def iter_chunks(self, chunk_size: int = 1024) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Streamt die Bank blockweise.
+
+        Args:
+            chunk_size: Templates pro Block
+
+        Yields:
+            (start_index, block) mit block.shape = (≤chunk_size, n_samples)
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        for start in range(0, self.n_templates, chunk_size):
+            yield start, self.waveforms(start, start + chunk_size)
+
+    def generate(self, path: Optional[str] = None, chunk_size: int = 1024) -> np.ndarray:
+        """
+        Erzeugt die vollständige Bank als zusammenhängendes Array.
+
+        Ohne path im RAM; mit path als .npy-memmap, blockweise geschrieben.
+        Oberhalb MEMMAP_THRESHOLD_BYTES ist path erforderlich.
+
+        Args:
+            path: Zieldatei (.npy) für memmap
+            chunk_size: Templates pro Block
+
+        Returns:
+            np.ndarray oder np.memmap, shape (n_templates, n_samples)
+
+        Raises:
+            MemoryError: Bank > MEMMAP_THRESHOLD_BYTES ohne path
+        """
+        if path is None and self.nbytes > MEMMAP_THRESHOLD_BYTES:
+            raise MemoryError(
+                f"Bank needs {self.nbytes / 1024**3:.2f} GiB; pass path= for a memmap"
+            )
+        shape = (self.n_templates, self.n_samples)
+        if path is None:
+            out = np.empty(shape, dtype=self.dtype)
+        else:
+            out = np.lib.format.open_memmap(path, mode='w+', dtype=self.dtype, shape=shape)
+        for start, block in self.iter_chunks(chunk_size):
+            out[start:start + len(block)] = block
+        if path is not None:
+            out.flush()
+        return out
+
+    def match(self, data: np.ndarray, chunk_size: int = 1024,
+              bank: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Normierte Überlappung <d, h> / (|d| |h|) für jedes Template.
+
+        Streamt über die Bank (oder ein vorhandenes memmap-Array),
+        nur ein Block liegt gleichzeitig im Speicher.
+
+        Args:
+            data: Zeitreihe, Länge ≥ n_samples (wird abgeschnitten)
+            chunk_size: Templates pro Block
+            bank: Optional bereits erzeugte Bank (z.B. np.load(..., mmap_mode='r'))
+
+        Returns:
+            Array (n_templates,) mit Werten in [-1, 1]
+        """
+        d = np.asarray(data, dtype=float)[:self.n_samples]
+        if d.size < self.n_samples:
+            raise ValueError(f"data has {d.size} samples, need {self.n_samples}")
+        d_norm = np.linalg.norm(d)
+        out = np.zeros(self.n_templates)
+        if d_norm == 0:
+            return out
+        if bank is None:
+            chunks = self.iter_chunks(chunk_size)
+        else:
+            chunks = ((s, bank[s:s + chunk_size]) for s in range(0, self.n_templates, chunk_size))
+        for start, block in chunks:
+            block = np.asarray(block, dtype=float)
+            h_norm = np.linalg.norm(block, axis=1)
+            overlap = block @ d
+            out[start:start + len(block)] = np.where(h_norm > 0, overlap / (h_norm * d_norm), 0.0)
+        return out
+
+    def parameters(self, index: int) -> Dict[str, float]:
+        """Parameter und QNM-Werte eines Templates."""
+        params = {name: self.grid[name][index].item() for name in GRID_FIELDS}
+        params['f_hz'] = float(self.f_hz[index])
+        params['tau'] = float(self.tau[index])
+        return params
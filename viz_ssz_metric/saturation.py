@@ -23,6 +23,7 @@ import math
 from typing import Tuple
 from .ssz_mirror_metric import schwarzschild_radius, PHI, G_DEFAULT, C_DEFAULT
 from .mass_corrections import delta_M
+from .bomb_dynamics import log_energy_at
 
 
 # ============================= FUNDAMENTALE GRENZEN =============================
@@ -361,18 +362,12 @@ def energy_evolution_ssz(E_current: float, lambda_A: float, K: int,
             f"Instabile Kopplung! λ_A={lambda_A:.6f} ≥ λ_crit={1/K**2:.6f}"
         )
     
-    # Evolution
-    E = E_current
+    # Evolution in geschlossener Form (bomb_dynamics), Golden Ratio Sättigung
     growth_factor = 1.0 + lambda_A - (lambda_A**2) * (K**2)
+    E_max = E_current * (1.0 - np.exp(-PHI * K))
+    log_E = log_energy_at(time_steps, np.log(E_current), np.log(growth_factor), np.log(E_max))
     
-    for _ in range(time_steps):
-        E = E * growth_factor
-        
-        # Golden Ratio Sättigung
-        E_max = E_current * (1.0 - np.exp(-PHI * K))
-        E = min(E, E_max)
-    
-    return E
+    return float(np.exp(log_E))
 
 
 def demo():
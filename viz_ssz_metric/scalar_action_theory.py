@@ -5,14 +5,24 @@ Scalar Action Theory - Wirkungsbasierte SSZ-Theorie
 Basierend auf: ssz_theory_segmented.py aus dem Vorlage-Repo
 Implementiert: Anisotrope Kinetik Z_parallel(φ) und Skalar-Potential U(φ)
 
+Alle Methoden akzeptieren Skalare und Arrays (verzweigungsfrei, broadcastend).
+Für Gitter: stress_energy_arrays(φ, φ', 1-2m/r) → (ρ, p_r, p_t, Δ) als Arrays.
+
 © 2025 Carmen Wrede & Lino Casu
 Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
 """
 from __future__ import annotations
 import numpy as np
-from typing import Tuple
+from typing import Tuple, Union
 from dataclasses import dataclass
 
+try:
+    from .numerical_stability import sat_tanh, sech2_stable
+except ImportError:
+    from numerical_stability import sat_tanh, sech2_stable
+
+ArrayLike = Union[float, np.ndarray]
+
 
 # Golden Ratio
 PHI = (1.0 + np.sqrt(5.0)) / 2.0  # ≈ 1.618
@@ -61,7 +71,7 @@ class ScalarActionTheory:
         """
         self.params = params if params is not None else ScalarParams()
     
-    def sat_tanh(self, x: float, cap: float | None) -> float:
+    def sat_tanh(self, x: ArrayLike, cap: float | None) -> ArrayLike:
         """
         Glatte Sättigung via tanh.
         
@@ -74,31 +84,21 @@ class ScalarActionTheory:
         Returns:
             Saturated value
         """
-        if cap is None or cap <= 0:
-            return x
-        return cap * np.tanh(x / cap)
+        return sat_tanh(x, cap)
     
-    def sech2_stable(self, z: float) -> float:
+    def sech2_stable(self, z: ArrayLike) -> ArrayLike:
         """
         sech²(z) = 1/cosh²(z) - Overflow-sicher!
         
-        Für |z| > 20: cosh(z) ~ 0.5×exp(|z|)
-        => sech²(z) ~ 4×exp(-2|z|)
-        
         Args:
-            z: Input value
+            z: Input value (scalar or array)
         
         Returns:
             sech²(z) without overflow
         """
-        a = abs(z)
-        if a < 20.0:
-            c = np.cosh(z)
-            return 1.0 / (c * c)
-        else:
-            return 4.0 * np.exp(-2.0 * a)
+        return sech2_stable(z)
     
-    def Z_parallel_raw(self, phi_eff: float) -> float:
+    def Z_parallel_raw(self, phi_eff: ArrayLike) -> ArrayLike:
         """
         Ungeklammerte Z_parallel(φ_eff).
         
@@ -113,7 +113,7 @@ class ScalarActionTheory:
         p = self.params
         return p.Z0 * (1.0 + p.alpha * phi_eff + p.beta * phi_eff * phi_eff)
     
-    def Z_parallel(self, phi: float) -> float:
+    def Z_parallel(self, phi: ArrayLike) -> ArrayLike:
         """
         Anisotrope Kinetik Z_parallel(φ).
         
@@ -136,9 +136,9 @@ class ScalarActionTheory:
         # Bound
         Z = np.clip(Z, p.Zmin, p.Zmax)
         
-        return Z
+        return Z[()]
     
-    def dZ_dphi(self, phi: float) -> float:
+    def dZ_dphi(self, phi: ArrayLike) -> ArrayLike:
         """
         Ableitung d/dφ Z_parallel(φ) mit gesättigtem φ.
         
@@ -156,23 +156,21 @@ class ScalarActionTheory:
         
         if p.phi_cap is None or p.phi_cap <= 0:
             # Ohne Caps
-            Z = self.Z_parallel_raw(phi)
-            if Z <= p.Zmin or Z >= p.Zmax:
-                return 0.0
-            return p.Z0 * (p.alpha + 2.0 * p.beta * phi)
+            phi_sat = phi
+            dphi_sat = 1.0
+        else:
+            # Mit Caps (Kettenregel)
+            phi_sat = self.sat_tanh(phi, p.phi_cap)
+            dphi_sat = self.sech2_stable(phi / p.phi_cap)
         
-        # Mit Caps
-        phi_sat = self.sat_tanh(phi, p.phi_cap)
+        # 0 außerhalb der offenen Klammer (Zmin, Zmax)
         Z = self.Z_parallel_raw(phi_sat)
+        inside = (Z > p.Zmin) & (Z < p.Zmax)
+        dZ = np.where(inside, p.Z0 * (p.alpha + 2.0 * p.beta * phi_sat) * dphi_sat, 0.0)
         
-        if Z <= p.Zmin or Z >= p.Zmax:
-            return 0.0
-        
-        # Kettenregel
-        dphi_sat = self.sech2_stable(phi / p.phi_cap)
-        return p.Z0 * (p.alpha + 2.0 * p.beta * phi_sat) * dphi_sat
+        return dZ[()]
     
-    def U_potential(self, phi: float) -> float:
+    def U_potential(self, phi: ArrayLike) -> ArrayLike:
         """
         Skalar-Potential U(φ).
         
@@ -196,7 +194,7 @@ class ScalarActionTheory:
         
         return U
     
-    def dU_dphi(self, phi: float) -> float:
+    def dU_dphi(self, phi: ArrayLike) -> ArrayLike:
         """
         Ableitung dU/dφ mit Kettenregel (sat).
         
@@ -220,8 +218,8 @@ class ScalarActionTheory:
         
         return dU
     
-    def stress_energy_tensor(self, phi: float, phi_prime: float, 
-                           one_minus_2m_r: float) -> Tuple[float, float, float, float]:
+    def stress_energy_tensor(self, phi: ArrayLike, phi_prime: ArrayLike,
+                           one_minus_2m_r: ArrayLike) -> Tuple[ArrayLike, ArrayLike, ArrayLike, ArrayLike]:
         """
         Energie-Impuls-Tensor T_μν aus der Wirkung.
         
@@ -244,26 +242,47 @@ class ScalarActionTheory:
         Returns:
             (rho_phi, p_r_phi, p_t_phi, Delta_phi)
         """
-        # Saturiere φ'
-        phi_p_sat = self.sat_tanh(phi_prime, self.params.phi_prime_cap)
+        return tuple(T[()] for T in self.stress_energy_arrays(phi, phi_prime, one_minus_2m_r))
+    
+    def stress_energy_arrays(self, phi: ArrayLike, phi_prime: ArrayLike,
+                             one_minus_2m_r: ArrayLike) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Fusionierte Auswertung von (ρ_φ, p_r,φ, p_t,φ, Δ_φ) auf Gittern.
         
-        # Kinetischer Term
-        X = one_minus_2m_r * (phi_p_sat**2)
+        Sättigt φ und φ' je einmal und teilt sat(φ) zwischen Z_parallel
+        und U(φ); die Eingaben werden gegeneinander gebroadcastet.
+        
+        Args:
+            phi: Scalar field φ (array)
+            phi_prime: Radial derivative φ' (array)
+            one_minus_2m_r: Metric factor (1 - 2m/r) (array)
+        
+        Returns:
+            (rho_phi, p_r_phi, p_t_phi, Delta_phi) als Arrays
+        """
+        p = self.params
+        phi, phi_prime, one_minus_2m_r = np.broadcast_arrays(
+            *(np.asarray(v, dtype=float) for v in (phi, phi_prime, one_minus_2m_r)))
+        
+        # Sättigungen (je einmal)
+        phi_sat = np.asarray(self.sat_tanh(phi, p.phi_cap))
+        phi_p_sat = self.sat_tanh(phi_prime, p.phi_prime_cap)
         
-        # Z und U
-        Z_par = self.Z_parallel(phi)
-        U = self.U_potential(phi)
+        # Kinetischer Term X = (1-2m/r) φ'², Z_parallel und U aus sat(φ)
+        ZX = np.clip(self.Z_parallel_raw(phi_sat), p.Zmin, p.Zmax) * (one_minus_2m_r * phi_p_sat**2)
+        phi_sat2 = phi_sat * phi_sat
+        U = phi_sat2 * (0.5 * p.m_phi**2 + p.lambda_ * phi_sat2)
         
         # Komponenten
-        rho_phi = 0.5 * Z_par * X + U
-        p_r_phi = 0.5 * Z_par * X - U
-        p_t_phi = -0.5 * Z_par * X - U
+        rho_phi = 0.5 * ZX + U
+        p_r_phi = 0.5 * ZX - U
+        p_t_phi = -0.5 * ZX - U
         Delta_phi = p_t_phi - p_r_phi  # = -Z_par × X
         
         return rho_phi, p_r_phi, p_t_phi, Delta_phi
     
-    def scalar_eom_source(self, phi: float, phi_prime: float, 
-                         one_minus_2m_r: float) -> float:
+    def scalar_eom_source(self, phi: ArrayLike, phi_prime: ArrayLike,
+                         one_minus_2m_r: ArrayLike) -> ArrayLike:
         """
         Quellterm für Skalar-Feldgleichung.
         
@@ -292,7 +311,7 @@ class ScalarActionTheory:
         # Quellterm
         source = dU + 0.5 * dZ * X
         
-        return source
+        return np.asarray(source, dtype=float)[()]
 
 
 def demo():
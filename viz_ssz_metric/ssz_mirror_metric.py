@@ -21,9 +21,10 @@ Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
 """
 from __future__ import annotations
 import math
+from functools import lru_cache
 from typing import Tuple, Optional
 import numpy as np
-from scipy.optimize import brentq
+from numpy.polynomial import chebyshev as C
 
 try:
     import mpmath as mp
@@ -35,6 +36,7 @@ except ImportError:
 G_DEFAULT = 6.67430e-11  # m³/(kg·s²)
 C_DEFAULT = 299_792_458.0  # m/s
 PHI = (1 + np.sqrt(5)) / 2  # Golden Ratio ≈ 1.618033988749...
+EPSILON3 = -24.0 / 5.0  # Kubischer PN-Koeffizient ε₃
 
 
 def schwarzschild_radius(M: float, G: float = G_DEFAULT, c: float = C_DEFAULT) -> float:
@@ -87,32 +89,121 @@ def A_GR(r, rs):
     return 1.0 - (rs / r)
 
 
-def solve_r_star(rs: float, varphi: float = PHI) -> float:
+# Tabellierter φ-Bereich des u*(φ)-Interpolanten (Chebyshev in ln φ)
+U_STAR_PHI_RANGE = (0.2, 5.0)
+U_STAR_DEGREE = 48
+
+_U_STAR_CHEB: Optional[np.ndarray] = None
+
+
+def _solve_u_star(varphi, xtol: float = 1e-15, max_iter: int = 100) -> np.ndarray:
+    """Vektorisierte Schnittpunkt-Suche u*(φ) für beliebig viele φ.
+    
+    f(u) = 1/(2 - exp(-φu)) - sqrt(1 - 1/u) ist für φ > 0 streng
+    monoton fallend mit f(1⁺) > 0 und f(∞) = -1/2, die Wurzel also
+    eindeutig. Alle Elemente laufen gleichzeitig: Newton-Schritt mit
+    Bisektion als Rückfall, sobald er die Klammer [lo, hi] verlässt.
+    
+    Args:
+        varphi: φ-Werte (Array)
+        xtol: Relative Toleranz in u
+        max_iter: Maximale Iterationen
+    
+    Returns:
+        u*-Array gleicher Form, NaN für φ ≤ 0 (kein Schnittpunkt)
+    """
+    varphi = np.asarray(varphi, float)
+    valid = varphi > 0
+    phi = np.where(valid, varphi, 1.0)
+
+    def f(u):
+        return 1.0 / (2.0 - np.exp(-phi * u)) - np.sqrt(1.0 - 1.0 / u)
+
+    # Klammer: f(1⁺) > 0; obere Grenze verdoppeln bis f(hi) < 0
+    lo = np.full(phi.shape, 1.0)
+    hi = np.full(phi.shape, 3.0)
+    while np.any(f(hi) >= 0):
+        hi = np.where(f(hi) >= 0, 2.0 * hi, hi)
+
+    u = 0.5 * (lo + hi)
+    for _ in range(max_iter):
+        e = np.exp(-phi * u)
+        fu = 1.0 / (2.0 - e) - np.sqrt(1.0 - 1.0 / u)
+        dfu = -phi * e / (2.0 - e)**2 - 0.5 / (u * u * np.sqrt(1.0 - 1.0 / u))
+        lo = np.where(fu > 0, u, lo)
+        hi = np.where(fu > 0, hi, u)
+        newton = u - fu / dfu
+        u_new = np.where((newton > lo) & (newton < hi), newton, 0.5 * (lo + hi))
+        done = np.abs(u_new - u) <= xtol * u
+        u = u_new
+        if np.all(done):
+            break
+    return np.where(valid, u, np.nan)
+
+
+@lru_cache(maxsize=4096)
+def _u_star_root(varphi: float) -> float:
+    """Exakter Schnittpunkt u*(φ) (memoisiert)."""
+    if not varphi > 0:
+        raise ValueError(f"no SSZ-GR intersection for varphi={varphi} (need varphi > 0)")
+    return float(_solve_u_star(np.array([varphi]))[0])
+
+
+def _u_star_chebyshev() -> np.ndarray:
+    """Chebyshev-Koeffizienten von u*(φ) über ln φ (einmalig aufgebaut)."""
+    global _U_STAR_CHEB
+    if _U_STAR_CHEB is None:
+        lo, hi = np.log(U_STAR_PHI_RANGE[0]), np.log(U_STAR_PHI_RANGE[1])
+        t = C.chebpts2(U_STAR_DEGREE + 1)
+        nodes = np.exp(0.5 * (lo + hi) + 0.5 * (hi - lo) * t)
+        _U_STAR_CHEB = C.chebfit(t, [_u_star_root(float(v)) for v in nodes], U_STAR_DEGREE)
+    return _U_STAR_CHEB
+
+
+def u_star(varphi=PHI):
+    """Dimensionsloser Schnittpunkt u* = r*/r_s als Funktion von φ.
+    
+    u* hängt nur von φ ab (r* = u* · r_s). Skalare φ werden exakt
+    gelöst und memoisiert (LRU); Arrays werden innerhalb von
+    U_STAR_PHI_RANGE über einen vorberechneten Chebyshev-Interpolanten
+    ausgewertet (|Fehler| < 1e-13), außerhalb mit dem vektorisierten
+    Newton-Löser (NaN für φ ≤ 0).
+    
+    Args:
+        varphi: φ-Parameter (scalar or array)
+    
+    Returns:
+        u* (float bzw. Array gleicher Form)
+    """
+    if np.ndim(varphi) == 0:
+        return _u_star_root(float(varphi))
+    varphi = np.asarray(varphi, float)
+    lo, hi = np.log(U_STAR_PHI_RANGE[0]), np.log(U_STAR_PHI_RANGE[1])
+    inside = (varphi >= U_STAR_PHI_RANGE[0]) & (varphi <= U_STAR_PHI_RANGE[1])
+    out = np.empty(varphi.shape)
+    t = (np.log(varphi[inside]) - 0.5 * (lo + hi)) / (0.5 * (hi - lo))
+    out[inside] = C.chebval(t, _u_star_chebyshev())
+    out[~inside] = _solve_u_star(varphi[~inside])
+    return out
+
+
+def solve_r_star(rs: float, varphi=PHI):
     """Löse SSZ = GR Schnittpunkt numerisch.
     
     Findet r* wo: D_SSZ(r*) = D_GR(r*)
     Äquivalent: sqrt(1 - r_s/r*) = 1/(1 + Ξ(r*))
     
+    Die Gleichung hängt nur von u = r/r_s ab, daher r* = r_s · u*(φ)
+    mit memoisiertem u*(φ).
+    
     Args:
         rs: Schwarzschild-Radius
-        varphi: φ-Parameter
+        varphi: φ-Parameter (scalar or array)
     
     Returns:
-        r_star: Schnittpunkt-Radius
+        r_star: Schnittpunkt-Radius (float bzw. Array)
     """
-    def equation(r):
-        D_ssz = D_SSZ(r, rs, varphi)
-        D_gr = np.sqrt(1 - rs/r)
-        return D_ssz - D_gr
-    
-    try:
-        # Brentq für robuste root-finding
-        r_star = brentq(equation, rs * 1.01, rs * 2.5)
-        return r_star
-    except ValueError:
-        # Fallback: Bisection mit größerem Intervall
-        r_star = brentq(equation, rs * 1.001, rs * 3.0)
-        return r_star
+    return rs * u_star(varphi)
 
 
 def A_safe(r, rs, varphi: float = PHI, delta_ratio: float = 0.02,
@@ -136,7 +227,7 @@ def A_safe(r, rs, varphi: float = PHI, delta_ratio: float = 0.02,
     """
     r = np.asarray(r, float)
     
-    # 1. Schnittpunkt berechnen
+    # 1. Schnittpunkt (memoisiert, kein Root-Finding pro Aufruf)
     r_star = solve_r_star(rs, varphi)
     
     # 2. Übergangsbreite
@@ -209,7 +300,7 @@ def weak_field_parameter(mass: float, r: float, G: float = G_DEFAULT, c: float =
 def metric_functions_pn(mass: float, r: float, 
                         G: float = G_DEFAULT, 
                         c: float = C_DEFAULT,
-                        epsilon3: float = -24.0/5.0) -> Tuple[float, float]:
+                        epsilon3: float = EPSILON3) -> Tuple[float, float]:
     """Post-Newtonsche Serie A(r) und B(r) = 1/A(r).
     
     SSZ-Metrik (schwaches Feld):
@@ -323,22 +414,37 @@ def proper_time_dilation(mass: float, r: float,
 # INTERSECTION POINT (high-precision mit mpmath)
 # ============================================================================
 
-def intersection_time_dilation(varphi: float = PHI, 
-                               tol: float = 1e-12) -> dict:
-    """Berechne Schnittpunkt u* und D* zwischen GR und SSZ (high precision).
+def _intersection_mpmath(varphi: float, dps: int = 30) -> float:
+    """u*(φ) mit mpmath bei dps Stellen (Verifikation)."""
+    with mp.workdps(dps):
+        def f(u):
+            return mp.sqrt(1 - 1 / u) - 1 / (2 - mp.e ** (-mp.mpf(varphi) * u))
+        
+        # Startwert aus dem float-Löser
+        root = mp.findroot(f, mp.mpf(float(_solve_u_star(varphi))))
+        return float(mp.re(root))
+
+
+def intersection_time_dilation(varphi=PHI, tol: float = 1e-15,
+                               high_precision: bool = False) -> dict:
+    """Berechne Schnittpunkt u* und D* zwischen GR und SSZ.
     
     Löst: sqrt(1 - 1/u) = 1/(2 - exp(-φ·u))
     
-    wobei u = r/r_s (dimensionslos).
+    wobei u = r/r_s (dimensionslos). Arrays von φ (z.B. 10^5 Werte)
+    werden in einem Aufruf simultan gelöst (Newton mit Bisektions-
+    Absicherung); mpmath nur auf Anfrage zur Verifikation.
     
     Args:
-        varphi: φ-Parameter (default: Golden Ratio)
-        tol: Relative Toleranz für Root-Finding (default: 1e-12)
+        varphi: φ-Parameter (scalar or array, default: Golden Ratio)
+        tol: Relative Toleranz in u (default: 1e-15)
+        high_precision: Wurzel mit mpmath (30 Stellen) nachrechnen
     
     Returns:
         dict mit Keys:
             - 'u': Dimensionsloser Schnittpunkt u* = r*/r_s
             - 'D': Gemeinsame Zeitdilatation D* = D_GR(r*) = D_SSZ(r*)
+        (floats für skalares φ, sonst Arrays; NaN für φ ≤ 0)
     
     Beispiel:
         >>> result = intersection_time_dilation(varphi=1.0)
@@ -346,48 +452,19 @@ def intersection_time_dilation(varphi: float = PHI,
         u* = 1.4689714056, D* = 0.5650234996
     
     Raises:
-        RuntimeError: wenn keine Konvergenz erreicht wird
-        ImportError: wenn mpmath nicht verfügbar (Fallback zu scipy)
+        RuntimeError: wenn high_precision ohne mpmath angefordert wird
+        ValueError: skalares φ ≤ 0 (kein Schnittpunkt)
     """
-    if HAS_MPMATH:
-        # High-precision mit mpmath
-        def f(u):
-            return mp.sqrt(1.0 - 1.0 / u) - 1.0 / (2.0 - mp.e ** (-varphi * u))
-        
-        # Versuche mehrere Startpunkte
-        guesses = [1.2, 1.3, 1.4, 1.5, 2.0]
-        root = None
-        
-        for guess in guesses:
-            try:
-                root = mp.findroot(f, guess)
-                u = float(mp.re(root))
-                if u > 1.0:
-                    break
-            except Exception:
-                continue
-        
-        if root is None or u <= 1.0:
-            raise RuntimeError(
-                f"mpmath findroot failed for varphi={varphi}. "
-                f"Try different initial guesses."
-            )
-        
-        # Berechne D* bei u*
-        D_val = math.sqrt(1.0 - 1.0 / u)
-        
-        return {"u": u, "D": D_val}
-    
+    if high_precision:
+        if not HAS_MPMATH:
+            raise RuntimeError("high_precision=True requires mpmath")
+        u = np.vectorize(_intersection_mpmath, otypes=[float])(varphi)
     else:
-        # Fallback zu scipy (niedrigere Präzision)
-        def equation(u):
-            return math.sqrt(1.0 - 1.0 / u) - 1.0 / (2.0 - math.exp(-varphi * u))
-        
-        try:
-            u = brentq(equation, 1.01, 3.0, xtol=tol)
-            D_val = math.sqrt(1.0 - 1.0 / u)
-            return {"u": u, "D": D_val}
-        except ValueError as e:
-            raise RuntimeError(
-                f"scipy brentq failed for varphi={varphi}: {e}"
-            )
+        u = _solve_u_star(varphi, xtol=tol)
+
+    if np.ndim(varphi) == 0:
+        u = float(u)
+        if math.isnan(u):
+            raise ValueError(f"no SSZ-GR intersection for varphi={varphi} (need varphi > 0)")
+        return {"u": u, "D": math.sqrt(1.0 - 1.0 / u)}
+    return {"u": u, "D": np.sqrt(1.0 - 1.0 / u)}
@@ -10,6 +10,7 @@ SSZ — Wirkungsbasiert (Skalar mit anisotroper Kinetik) — stabil (v2)
 - Physik-Modi: exterior (Vakuum + m0=r_s/2) | interior (Fluid)
 """
 
+from __future__ import annotations
 import math
 import argparse
 from dataclasses import dataclass
@@ -30,32 +31,22 @@ def mass_to_length_geom(M_kg: float) -> float:
 
 # --------------------------- Numerische Hilfsfunktionen -------------------------
 
-def sech2_stable(z: float) -> float:
-    """sech^2(z) stabil, vermeidet Overflow in cosh."""
-    a = abs(z)
-    if a < 20.0:
-        c = math.cosh(z)
-        return 1.0 / (c * c)
-    # cosh(z) ~ 0.5 e^{|z|}  =>  sech^2 ~ 4 e^{-2|z|}
-    return 4.0 * math.exp(-2.0 * a)
-
-def exp_clip(x: float, bound: float = 80.0) -> float:
-    """Geklipptes Exponential: exp(x) mit |x|≤bound."""
-    if x >  bound: x =  bound
-    if x < -bound: x = -bound
-    return math.exp(x)
-
-def sat(x: float, cap: float | None) -> float:
-    """Glatte Sättigung ±cap via tanh."""
-    if cap is None or cap <= 0:
-        return x
-    return cap * math.tanh(x / cap)
-
-def sat_pos(y: float, cap: float | None) -> float:
-    """Glatte Sättigung y≥0 gegen cap via tanh."""
-    if cap is None or cap <= 0:
-        return max(y, 0.0)
-    return cap * math.tanh(max(y, 0.0) / cap)
+# Gemeinsame Kernel (numerical_stability): math-Schnellpfad für floats, ufunc-Pfad für Arrays
+try:
+    from . import numerical_stability as _ns
+except ImportError:
+    import numerical_stability as _ns
+
+# Öffentliche Namen dieses Moduls (wie bisher), Implementierung in numerical_stability
+sech2_stable = _ns.sech2_stable
+exp_clip = _ns.exp_clip
+sat = _ns.sat_tanh
+sat_pos = _ns.sat_pos_tanh
+
+try:
+    from .jit_kernels import scalar_sector_kernel, tov_rhs_kernel
+except ImportError:
+    from jit_kernels import scalar_sector_kernel, tov_rhs_kernel
 
 # --------------------------- Modellfunktionen: Z_parallel & U -------------------
 
@@ -105,6 +96,13 @@ def dU_dphi(phi: float, mphi: float, lam: float, phi_cap: float) -> float:
     dph = sech2_stable(phi / phi_cap)
     return ((mphi**2) * ph + 4.0 * lam * (ph**3)) * dph
 
+def scalar_sector(phi: float, p: "Params") -> Tuple[float, float, float, float]:
+    """
+    (Zpar, U, dZpar/dφ, dU/dφ) in einem Durchgang: sat(φ) und sech²(φ/φ_cap)
+    werden je einmal ausgewertet (identisch zu den Einzelfunktionen).
+    """
+    return scalar_sector_kernel(phi, *p.kernel_args()[:8])
+
 # --------------------------- Parameter & RHS ------------------------------------
 
 @dataclass
@@ -128,76 +126,28 @@ class Params:
     abort_on_horizon: bool
     horizon_margin: float
 
+    def kernel_args(self) -> Tuple[float, ...]:
+        """Float-Tupel für jit_kernels.tov_rhs_kernel (Cap None → 0 = keine Sättigung)."""
+        return (self.Z0, self.alpha, self.beta, self.Zmin, self.Zmax, self.mphi, self.lam,
+                0.0 if self.phi_cap is None else self.phi_cap,
+                0.0 if self.phip_cap is None else self.phip_cap,
+                self.cs2, self.rho0)
+
 class HorizonError(RuntimeError):
     pass
 
 def rhs_dr(r: float, y: np.ndarray, p: Params) -> np.ndarray:
     """
     dy/dr = f(r,y). y = [m, Phi, pr_fluid, phi, phip]
-    """
-    m, Phi, pr_fl, phi, phip = (float(y[0]), float(y[1]), float(y[2]), float(y[3]), float(y[4]))
-
-    r_safe = max(r, 1e-30)
-    one_minus = 1.0 - 2.0 * m / r_safe
-    if p.abort_on_horizon and (one_minus <= p.horizon_margin):
-        raise HorizonError(f"Horizontwächter: 1-2m/r={one_minus:.3e} < margin={p.horizon_margin:.1e} bei r={r:.6e} m.")
-
-    # weich clippen (bleibe >0 für numerische Stabilität, physik. Bewertung via Guard)
-    if one_minus < 1e-16:
-        one_minus = 1e-16
-
-    Lam = -0.5 * math.log(one_minus)   # e^{2Λ} = 1/(1-2m/r),  e^{-2Λ} = 1-2m/r
-    inv_e2L = one_minus
-
-    # Skalar-Sektor
-    Zp    = Zpar(phi, p.Z0, p.alpha, p.beta, p.phi_cap, p.Zmin, p.Zmax)
-    Up    = U(phi, p.mphi, p.lam, p.phi_cap)
-    phip_s = sat(phip, p.phip_cap)
-    X     = inv_e2L * (phip_s**2)
 
-    rho_phi =  0.5 * Zp * X + Up
-    pr_phi  =  0.5 * Zp * X - Up
-    pt_phi  = -0.5 * Zp * X - Up
-    Delta_phi = pt_phi - pr_phi               # = -Zp * X
-
-    # Fluid (isotrop)
-    cs2 = max(p.cs2, 1e-16)
-    rho_fl = (pr_fl / cs2) + p.rho0
-    pt_fl  = pr_fl
-
-    # Summen
-    rho_tot = rho_fl + rho_phi
-    pr_tot  = pr_fl + pr_phi
-
-    # TOV
-    denom = r_safe * (r_safe - 2.0 * m)
-    if abs(denom) < 1e-18 * r_safe * r_safe:
-        denom = math.copysign(1e-18 * r_safe * r_safe, denom)
-
-    dPhidr = (m + 4.0 * math.pi * (r_safe**3) * pr_tot) / denom
-    dmdr   = 4.0 * math.pi * (r_safe**2) * rho_tot
-
-    # Fluiddruck
-    dpr_dr = -(rho_fl + pr_fl) * dPhidr + (2.0 / r_safe) * (pt_fl - pr_fl + Delta_phi)
-
-    # Skalar-EOM explizit:
-    Zphi   = dZpar_dphi(phi, p.Z0, p.alpha, p.beta, p.phi_cap, p.Zmin, p.Zmax)
-    source = dU_dphi(phi, p.mphi, p.lam, p.phi_cap) + 0.5 * Zphi * X
-
-    ePhi_m_L = exp_clip(Phi - Lam, 80.0)
-    ePhi_p_L = exp_clip(Phi + Lam, 80.0)
-
-    A = ePhi_m_L * (r_safe**2) * max(Zp, 1e-16)
-    B = ePhi_p_L * (r_safe**2) * source
-
-    # Λ' = (m + 4π r^3 ρ_tot)/(r(r-2m))
-    dLdr = (m + 4.0 * math.pi * (r_safe**3) * rho_tot) / denom
-    # A' = A*(Φ' - Λ' + 2/r) + e^{Φ-Λ} r^2 Z_{,φ} φ'_sat
-    Aprime = A * (dPhidr - dLdr + 2.0 / r_safe) + ePhi_m_L * (r_safe**2) * Zphi * phip_s
-
-    dphipdr = (B - Aprime * phip) / max(A, 1e-30)
+    Horizontwächter hier, Rest in jit_kernels.tov_rhs_kernel (mit numba kompiliert).
+    """
+    if p.abort_on_horizon:
+        one_minus = 1.0 - 2.0 * float(y[0]) / max(r, 1e-30)
+        if one_minus <= p.horizon_margin:
+            raise HorizonError(f"Horizontwächter: 1-2m/r={one_minus:.3e} < margin={p.horizon_margin:.1e} bei r={r:.6e} m.")
 
-    return np.array([dmdr, dPhidr, dpr_dr, phip, dphipdr], dtype=float)
+    return tov_rhs_kernel(r, np.asarray(y, dtype=float), p.kernel_args())
 
 # --------------------------- Integration & Export -------------------------------
 
@@ -2,18 +2,26 @@
 """
 SSZ Metric Visualization CLI
 
-Generates plots and animated GIFs for the SSZ mirror metric.
+Generates plots and animations (GIF, APNG, MP4/WebM) for the SSZ mirror metric.
 
 © 2025 Carmen Wrede & Lino Casu
 Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
 """
+import abc
 import argparse
 import io
 import os
+import shutil
+import struct
+import subprocess
 import sys
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-import matplotlib.pyplot as plt
-from PIL import Image
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import GifImagePlugin, Image
 from .ssz_mirror_metric import (
     A_GR, A_SSZ, A_safe, D_from_A, redshift_from_A, curvature_proxy, solve_r_star, PHI
 )
@@ -34,13 +42,223 @@ OUTDIR = os.path.join(os.path.dirname(__file__), "out")
 os.makedirs(OUTDIR, exist_ok=True)
 
 
-def _save_gif(frames, path, duration=130):
-    """Save list of PIL images as animated GIF."""
-    frames[0].save(
-        path, save_all=True, append_images=frames[1:], 
-        optimize=True, duration=duration, loop=0
-    )
-    print(f"✅ GIF saved: {path}")
+# ======================== ANIMATION WRITERS ========================
+#
+# Streaming-Writer: Frames werden einzeln geschrieben, der Speicherbedarf
+# hängt nicht von der Frame-Anzahl ab. GIF und APNG teilen eine feste
+# Palette, die aus dem ersten Frame bestimmt wird; alle weiteren Frames
+# werden nur noch auf diese Palette abgebildet (keine Quantisierung pro
+# Frame). MP4/WebM laufen über ein lokales ffmpeg (stdin-Pipe, rgb24).
+
+FFMPEG = shutil.which("ffmpeg")
+
+FORMAT_EXTENSIONS = {"gif": ".gif", "apng": ".png", "mp4": ".mp4", "webm": ".webm"}
+
+_FFMPEG_CODECS = {
+    ".mp4": ["-c:v", "libx264", "-pix_fmt", "yuv420p"],
+    ".webm": ["-c:v", "libvpx-vp9", "-pix_fmt", "yuv420p", "-b:v", "0", "-crf", "32"],
+}
+
+
+def _rgb_array(frame) -> np.ndarray:
+    """Frame (PIL-Bild oder Array) als zusammenhängendes uint8-RGB-Array."""
+    if isinstance(frame, Image.Image):
+        frame = frame.convert("RGB")
+    arr = np.asarray(frame, dtype=np.uint8)
+    return np.ascontiguousarray(arr[..., :3])
+
+
+class AnimationWriter(abc.ABC):
+    """
+    Abstrakte Basis für Streaming-Writer (Kontextmanager).
+
+    Unterklassen implementieren _open (erster Frame), _write und close.
+
+    Verwendung:
+    >>> with open_writer("out.gif", duration=120) as writer:
+    ...     for frame in frames:
+    ...         writer.append(frame)
+    """
+
+    def __init__(self, path: str, duration: int = 130):
+        """
+        Args:
+            path: Zieldatei
+            duration: Frame-Dauer in ms
+        """
+        self.path = path
+        self.duration = int(duration)
+        self.n_frames = 0
+        self.size = None
+
+    def append(self, frame) -> None:
+        """Einen Frame (H×W×3/4 uint8 oder PIL-Bild) schreiben."""
+        rgb = _rgb_array(frame)
+        size = (rgb.shape[1], rgb.shape[0])
+        if self.size is None:
+            self.size = size
+            self._open(rgb)
+        elif size != self.size:
+            raise ValueError(f"frame size {size} differs from {self.size}")
+        self._write(rgb)
+        self.n_frames += 1
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Datei abschließen."""
+
+    @abc.abstractmethod
+    def _open(self, rgb: np.ndarray) -> None:
+        """Datei öffnen; rgb ist der erste Frame (self.size ist gesetzt)."""
+
+    @abc.abstractmethod
+    def _write(self, rgb: np.ndarray) -> None:
+        """Einen Frame schreiben."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class _PaletteWriter(AnimationWriter):
+    """Feste 256-Farben-Palette aus dem ersten Frame."""
+
+    def _open(self, rgb):
+        self.palette = Image.fromarray(rgb).quantize(colors=256, dither=Image.Dither.NONE)
+
+    def _indexed(self, rgb) -> Image.Image:
+        return Image.fromarray(rgb).quantize(palette=self.palette, dither=Image.Dither.NONE)
+
+    def _palette_bytes(self) -> bytes:
+        return bytes(self.palette.getpalette()[:768]).ljust(768, b"\0")
+
+
+class GifWriter(_PaletteWriter):
+    """Animiertes GIF89a mit globaler Palette und Endlosschleife."""
+
+    def _open(self, rgb):
+        super()._open(rgb)
+        width, height = self.size
+        self._fp = open(self.path, "wb")
+        self._fp.write(b"GIF89a" + struct.pack("<HHBBB", width, height, 0xF7, 0, 0))
+        self._fp.write(self._palette_bytes())
+        self._fp.write(b"!\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00")  # loop = 0
+
+    def _write(self, rgb):
+        im = self._indexed(rgb)
+        # Öffentliche API reicht nicht: Image.save(save_all=True) sammelt alle
+        # Frames (Differenzbildung) und quantisiert neu. getdata kodiert genau
+        # einen Frame (Graphic Control + Image Descriptor + LZW); dokumentierte
+        # "Legacy"-Funktion, unverändert von Pillow 9 (requirements) bis 12.
+        for chunk in GifImagePlugin.getdata(im, duration=self.duration):
+            self._fp.write(chunk)
+
+    def close(self):
+        if self.size is not None:
+            self._fp.write(b";")
+            self._fp.close()
+
+
+def _png_chunk(tag: bytes, data: bytes) -> bytes:
+    return (struct.pack(">I", len(data)) + tag + data
+            + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+
+class ApngWriter(_PaletteWriter):
+    """
+    Animiertes PNG (APNG, indiziert mit fester Palette).
+
+    Die Frame-Anzahl in acTL wird beim Schließen nachgetragen.
+    """
+
+    def _open(self, rgb):
+        super()._open(rgb)
+        width, height = self.size
+        self._seq = 0
+        self._fp = open(self.path, "wb")
+        self._fp.write(b"\x89PNG\r\n\x1a\n")
+        self._fp.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0)))
+        self._fp.write(_png_chunk(b"PLTE", self._palette_bytes()))
+        self._actl_offset = self._fp.tell()
+        self._fp.write(_png_chunk(b"acTL", struct.pack(">II", 0, 0)))
+
+    def _write(self, rgb):
+        width, height = self.size
+        index = np.asarray(self._indexed(rgb), dtype=np.uint8)
+        raw = np.empty((height, width + 1), dtype=np.uint8)
+        raw[:, 0] = 0  # Filter "None" pro Zeile
+        raw[:, 1:] = index
+        data = zlib.compress(raw.tobytes(), 6)
+
+        self._fp.write(_png_chunk(b"fcTL", struct.pack(
+            ">IIIIIHHBB", self._seq, width, height, 0, 0, self.duration, 1000, 0, 0)))
+        self._seq += 1
+        if self.n_frames == 0:
+            self._fp.write(_png_chunk(b"IDAT", data))
+        else:
+            self._fp.write(_png_chunk(b"fdAT", struct.pack(">I", self._seq) + data))
+            self._seq += 1
+
+    def close(self):
+        if self.size is None:
+            return
+        self._fp.write(_png_chunk(b"IEND", b""))
+        self._fp.seek(self._actl_offset)
+        self._fp.write(_png_chunk(b"acTL", struct.pack(">II", self.n_frames, 0)))
+        self._fp.close()
+
+
+class FFmpegWriter(AnimationWriter):
+    """MP4 (H.264) / WebM (VP9) über ein lokales ffmpeg-Binary."""
+
+    def __init__(self, path: str, duration: int = 130):
+        super().__init__(path, duration)
+        ext = os.path.splitext(path)[1].lower()
+        if ext not in _FFMPEG_CODECS:
+            raise ValueError(f"unsupported video format: {ext}")
+        if FFMPEG is None:
+            raise RuntimeError("ffmpeg binary not found - MP4/WebM output unavailable")
+        self._codec = _FFMPEG_CODECS[ext]
+
+    def _open(self, rgb):
+        width, height = self.size
+        cmd = [FFMPEG, "-y", "-loglevel", "error",
+               "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}",
+               "-framerate", f"{1000.0 / self.duration:.6g}", "-i", "-",
+               "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", *self._codec, self.path]
+        self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+
+    def _write(self, rgb):
+        self._proc.stdin.write(rgb.tobytes())
+
+    def close(self):
+        if self.size is None:
+            return
+        self._proc.stdin.close()
+        if self._proc.wait() != 0:
+            raise RuntimeError(f"ffmpeg failed writing {self.path}")
+
+
+def open_writer(path: str, duration: int = 130) -> AnimationWriter:
+    """
+    Streaming-Writer passend zur Dateiendung.
+
+    Args:
+        path: .gif, .png/.apng, .mp4 oder .webm
+        duration: Frame-Dauer in ms
+
+    Returns:
+        AnimationWriter
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".gif":
+        return GifWriter(path, duration)
+    if ext in (".png", ".apng"):
+        return ApngWriter(path, duration)
+    return FFmpegWriter(path, duration)
 
 
 def cmd_check(rs: float, varphis):
@@ -51,14 +269,15 @@ def cmd_check(rs: float, varphis):
     print("SSZ-GR INTERSECTION CHECK")
     print("="*80)
     
-    for v in varphis:
-        rstar = solve_r_star(rs, v)
+    # Alle φ in einem Aufruf
+    varphis = np.asarray(varphis, float)
+    rstars = solve_r_star(rs, varphis)
+    D_sszs = D_SSZ(rstars, rs, varphis)
+    D_grs = np.sqrt(1 - rs/rstars)
+    
+    for v, rstar, D_ssz, D_gr in zip(varphis, rstars, D_sszs, D_grs):
         u_star = rstar / rs
         
-        # Calculate D at intersection
-        D_ssz = D_SSZ(rstar, rs, v)
-        D_gr = np.sqrt(1 - rs/rstar)
-        
         print(f"\nφ = {v:.10f}")
         print(f"  u* = r*/r_s = {u_star:.10f}")
         print(f"  r* = {rstar:.6e} (in units of r_s)")
@@ -69,246 +288,441 @@ def cmd_check(rs: float, varphis):
     print("\n" + "="*80)
 
 
-def gif_time_dilation(rs: float, varphi: float, outname="time_dilation_mirror_phi.gif"):
-    """Animate time dilation D(r) with φ-sweep."""
+# ======================== FRAME RENDERING ========================
+#
+# Jede Animation ist eine "Szene": setup baut Figure/Achsen/Artists einmal
+# (pro Worker), update(arg) setzt nur die Daten eines Frames (set_data,
+# set_offsets, set_text). Frames werden in Blöcken auf einen Prozess-Pool
+# verteilt (Agg-Canvas, kein pyplot-Zustand) und in Reihenfolge montiert.
+
+def _new_figure(figsize, nrows=1, sharex=False, subplot_kw=None):
+    """Figure mit eigenem Agg-Canvas (nicht-interaktiv, prozesssicher)."""
+    fig = Figure(figsize=figsize, dpi=120)
+    FigureCanvasAgg(fig)
+    ax = fig.subplots(nrows, 1, sharex=sharex, subplot_kw=subplot_kw)
+    return fig, ax
+
+
+def _frame_array(fig) -> np.ndarray:
+    """Aktuellen Zustand der Figure als RGB-Array (H×W×3, uint8)."""
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba())[..., :3].copy()
+
+
+def _scene_time(rs, varphi):
+    """Time dilation D(r) - Frame-Argument: φ."""
     r = np.linspace(1.05*rs, 6.0*rs, 600)
-    frames = []
-    
-    # Sweep φ from 0.8*φ to 1.25*φ
-    phi_values = np.linspace(varphi*0.8, varphi*1.25, 22)
-    
-    for v in phi_values:
-        Agr = A_GR(r, rs)
-        Assz = A_SSZ(r, rs, v)
+    fig, ax = _new_figure((6.4, 3.9))
+    ax.plot(r/rs, D_from_A(A_GR(r, rs)), label="GR", lw=2, color='#1f77b4')
+    ssz, = ax.plot(r/rs, np.zeros_like(r), label="SSZ", lw=2, ls="--", color='#ff7f0e')
+    safe, = ax.plot(r/rs, np.zeros_like(r), label="Mirror (safe)", lw=2.5, color='#2ca02c')
+    marker = ax.axvline(1.05, ls=":", lw=1.6, color='red', alpha=0.7)
+    label = ax.text(1.07, 0.1, r"$r^\ast$", fontsize=10)
+    ax.set(xlabel=r"$r/r_s$", ylabel=r"$D(r)$", xlim=(1.05, 6.0), ylim=(0, 1.05))
+    ax.grid(alpha=0.25)
+    ax.legend(loc="lower right", fontsize=8)
+
+    def update(v):
         Asafe, rstar = A_safe(r, rs, varphi=v)
-        
-        fig, ax = plt.subplots(figsize=(6.4, 3.9), dpi=120)
-        ax.plot(r/rs, D_from_A(Agr),  label="GR", lw=2, color='#1f77b4')
-        ax.plot(r/rs, D_from_A(Assz), label="SSZ", lw=2, ls="--", color='#ff7f0e')
-        ax.plot(r/rs, D_from_A(Asafe), label="Mirror (safe)", lw=2.5, color='#2ca02c')
-        ax.axvline(rstar/rs, ls=":", lw=1.6, color='red', alpha=0.7)
-        ax.text(rstar/rs + 0.02, 0.1, r"$r^\ast$", fontsize=10)
-        
-        ax.set(xlabel=r"$r/r_s$", ylabel=r"$D(r)$", 
-               xlim=(1.05, 6.0), ylim=(0, 1.05),
-               title=f"Time Dilation — φ = {v:.3f}")
-        ax.grid(alpha=0.25)
-        ax.legend(loc="lower right", fontsize=8)
-        
-        buf = io.BytesIO()
-        plt.tight_layout()
-        fig.savefig(buf, format="png")
-        plt.close(fig)
-        buf.seek(0)
-        frames.append(Image.open(buf).convert("P"))
-    
-    _save_gif(frames, os.path.join(OUTDIR, outname), duration=140)
+        ssz.set_ydata(D_from_A(A_SSZ(r, rs, v)))
+        safe.set_ydata(D_from_A(Asafe))
+        marker.set_xdata([rstar/rs, rstar/rs])
+        label.set_x(rstar/rs + 0.02)
+        ax.set_title(f"Time Dilation — φ = {v:.3f}")
 
+    return fig, update
 
-def gif_A_compare(rs: float, varphi=PHI, outname="A_safe_comparison.gif"):
-    """Animate A(r) comparison with moving marker."""
-    r = np.linspace(1.05*rs, 4.0*rs, 500)
-    Agr  = A_GR(r, rs)
+
+def _frames_time(rs, varphi):
+    # Sweep φ from 0.8*φ to 1.25*φ
+    return list(np.linspace(varphi*0.8, varphi*1.25, 22))
+
+
+# Radialgitter der Marker-Szenen (Frame-Argument = Index in dieses Gitter)
+N_R_A = 500
+N_R_K = 700
+
+
+def _scene_A(rs, varphi):
+    """A(r) comparison - Frame-Argument: Marker-Index."""
+    r = np.linspace(1.05*rs, 4.0*rs, N_R_A)
+    Agr = A_GR(r, rs)
     Assz = A_SSZ(r, rs, varphi)
     Asafe, rstar = A_safe(r, rs, varphi=varphi)
-    
     ymin = min(Agr.min(), Assz.min(), Asafe.min()) * 1.1
-    frames = []
-    
-    indices = np.linspace(0, len(r)-1, 36, dtype=int)
-    
-    for i in indices:
-        fig, ax = plt.subplots(figsize=(6.4, 3.9), dpi=120)
-        ax.plot(r/rs, Agr,  label=r"$A_{GR}$", lw=2, color='#1f77b4')
-        ax.plot(r/rs, Assz, label=r"$A_{SSZ}$", lw=2, ls="--", color='#ff7f0e')
-        ax.plot(r/rs, Asafe, label=r"$A_{safe}$ (mirror)", lw=2.5, color='#2ca02c')
-        ax.scatter([r[i]/rs], [Asafe[i]], s=80, c='red', zorder=5, edgecolors='darkred', linewidths=2)
-        ax.axvline(rstar/rs, ls=":", lw=1.6, color='gray', alpha=0.7)
-        
-        ax.set(xlabel=r"$r/r_s$", ylabel=r"$A(r)$", 
-               xlim=(1.05, 4.0), ylim=(ymin, 1.02),
-               title=f"Metric Coefficient A(r) — marker @ r = {r[i]/rs:.2f}$r_s$")
-        ax.grid(alpha=0.25)
-        ax.legend(loc="lower right", fontsize=8)
-        
-        buf = io.BytesIO()
-        plt.tight_layout()
-        fig.savefig(buf, format="png")
-        plt.close(fig)
-        buf.seek(0)
-        frames.append(Image.open(buf).convert("P"))
-    
-    _save_gif(frames, os.path.join(OUTDIR, outname), duration=120)
 
+    fig, ax = _new_figure((6.4, 3.9))
+    ax.plot(r/rs, Agr, label=r"$A_{GR}$", lw=2, color='#1f77b4')
+    ax.plot(r/rs, Assz, label=r"$A_{SSZ}$", lw=2, ls="--", color='#ff7f0e')
+    ax.plot(r/rs, Asafe, label=r"$A_{safe}$ (mirror)", lw=2.5, color='#2ca02c')
+    dot = ax.scatter([r[0]/rs], [Asafe[0]], s=80, c='red', zorder=5,
+                     edgecolors='darkred', linewidths=2)
+    ax.axvline(rstar/rs, ls=":", lw=1.6, color='gray', alpha=0.7)
+    ax.set(xlabel=r"$r/r_s$", ylabel=r"$A(r)$", xlim=(1.05, 4.0), ylim=(ymin, 1.02))
+    ax.grid(alpha=0.25)
+    ax.legend(loc="lower right", fontsize=8)
 
-def gif_curvature_proxy(rs: float, varphi=PHI, outname="curvature_proxy_scan.gif"):
-    """Animate curvature proxy scan."""
-    r = np.linspace(1.05*rs, 6.0*rs, 700)
+    def update(i):
+        dot.set_offsets([[r[i]/rs, Asafe[i]]])
+        ax.set_title(f"Metric Coefficient A(r) — marker @ r = {r[i]/rs:.2f}$r_s$")
+
+    return fig, update
+
+
+def _frames_A(rs, varphi):
+    return list(np.linspace(0, N_R_A - 1, 36, dtype=int))
+
+
+def _scene_K(rs, varphi):
+    """Curvature proxy scan - Frame-Argument: Marker-Index."""
+    r = np.linspace(1.05*rs, 6.0*rs, N_R_K)
     Asafe, rstar = A_safe(r, rs, varphi=varphi)
     K = curvature_proxy(r, Asafe)
     K = K / (K.max() if K.max() > 0 else 1.0)  # Normalize
-    
-    frames = []
-    indices = np.linspace(0, len(r)-1, 50, dtype=int)
-    
-    for i in indices:
-        fig, ax = plt.subplots(2, 1, figsize=(6.4, 5.0), dpi=120, sharex=True)
-        
-        # Top: A_safe
-        ax[0].plot(r/rs, Asafe, lw=2.5, color='#2ca02c')
-        ax[0].scatter([r[i]/rs], [Asafe[i]], s=60, c='red', zorder=5, edgecolors='darkred', linewidths=1.5)
-        ax[0].axvline(rstar/rs, ls=":", lw=1.6, color='gray', alpha=0.7)
-        ax[0].set(xlim=(1.05, 6.0), ylim=(Asafe.min()*0.95, 1.02), 
-                  ylabel=r"$A_{safe}$",
-                  title="Mirror Metric — Curvature Proxy")
-        ax[0].grid(alpha=0.25)
-        
-        # Bottom: Curvature proxy
-        ax[1].plot(r/rs, K, lw=2, color='#d62728')
-        ax[1].scatter([r[i]/rs], [K[i]], s=60, c='red', zorder=5, edgecolors='darkred', linewidths=1.5)
-        ax[1].set(xlabel=r"$r/r_s$", ylabel="K (normalized)", 
-                  xlim=(1.05, 6.0), ylim=(-0.02, 1.05))
-        ax[1].grid(alpha=0.25)
-        
-        buf = io.BytesIO()
-        plt.tight_layout()
-        fig.savefig(buf, format="png")
-        plt.close(fig)
-        buf.seek(0)
-        frames.append(Image.open(buf).convert("P"))
-    
-    _save_gif(frames, os.path.join(OUTDIR, outname), duration=120)
 
+    fig, ax = _new_figure((6.4, 5.0), nrows=2, sharex=True)
 
-def gif_lens(rs: float, varphi=PHI, outname="lensing_paths.gif"):
+    # Top: A_safe
+    ax[0].plot(r/rs, Asafe, lw=2.5, color='#2ca02c')
+    dot_A = ax[0].scatter([r[0]/rs], [Asafe[0]], s=60, c='red', zorder=5,
+                          edgecolors='darkred', linewidths=1.5)
+    ax[0].axvline(rstar/rs, ls=":", lw=1.6, color='gray', alpha=0.7)
+    ax[0].set(xlim=(1.05, 6.0), ylim=(Asafe.min()*0.95, 1.02),
+              ylabel=r"$A_{safe}$", title="Mirror Metric — Curvature Proxy")
+    ax[0].grid(alpha=0.25)
+
+    # Bottom: Curvature proxy
+    ax[1].plot(r/rs, K, lw=2, color='#d62728')
+    dot_K = ax[1].scatter([r[0]/rs], [K[0]], s=60, c='red', zorder=5,
+                          edgecolors='darkred', linewidths=1.5)
+    ax[1].set(xlabel=r"$r/r_s$", ylabel="K (normalized)",
+              xlim=(1.05, 6.0), ylim=(-0.02, 1.05))
+    ax[1].grid(alpha=0.25)
+
+    def update(i):
+        dot_A.set_offsets([[r[i]/rs, Asafe[i]]])
+        dot_K.set_offsets([[r[i]/rs, K[i]]])
+
+    return fig, update
+
+
+def _frames_K(rs, varphi):
+    return list(np.linspace(0, N_R_K - 1, 50, dtype=int))
+
+
+def _scene_lens(rs, varphi):
     """
-    Animate light rays (null geodesics) through the SSZ metric.
-    Shows gravitational lensing with different impact parameters.
+    Light rays through the SSZ metric (gravitational lensing with
+    different impact parameters) - Frame-Argument: hervorgehobenes b.
     """
-    from .geodesics import GeodesicIntegrator
-    from .unified_metric import UnifiedSSZMetric
-    
-    # Create metric (use standard mass for visualization)
-    M_test = 2e30  # ~1 solar mass
-    metric = UnifiedSSZMetric(mass=M_test)
-    metric.r_s = rs  # Override for visualization
-    integrator = GeodesicIntegrator(metric)
-    
-    # Different impact parameters
     b_values = np.linspace(1.5*rs, 5*rs, 8)
-    
-    frames = []
-    
-    # Animate by highlighting different rays
-    for b_highlight in b_values:
-        fig, ax = plt.subplots(figsize=(6, 6), dpi=120, subplot_kw=dict(projection='polar'))
-        
-        for b in b_values:
-            # Initial conditions for photon at r0 = 50rs
-            r0 = 50 * rs
-            # Approximation: photon with impact parameter b
-            # v_phi ≈ b / r0
-            v_phi = b / r0
-            
-            # Simplified null geodesic (just for visualization)
-            # In reality would integrate full geodesic equations
-            phi_vals = np.linspace(0, np.pi, 200)
-            r_vals = b / np.sin(phi_vals + 1e-3)  # Simplified trajectory
-            r_vals = np.clip(r_vals, 1.01*rs, 100*rs)
-            
-            # Plot styling
-            alpha = 1.0 if abs(b - b_highlight) < 0.1*rs else 0.3
-            lw = 2.5 if abs(b - b_highlight) < 0.1*rs else 1.0
-            color = 'red' if abs(b - b_highlight) < 0.1*rs else 'blue'
-            
-            ax.plot(phi_vals, r_vals/rs, alpha=alpha, lw=lw, color=color)
-        
-        # Add horizon circle
-        circle_phi = np.linspace(0, 2*np.pi, 100)
-        circle_r = np.ones_like(circle_phi)
-        ax.plot(circle_phi, circle_r, 'k--', lw=2, label='Horizon')
-        
-        ax.set(ylim=(0, 10), 
-               title=f"Gravitational Lensing — b = {b_highlight/rs:.2f} $r_s$")
-        ax.grid(alpha=0.3)
-        
-        buf = io.BytesIO()
-        plt.tight_layout()
-        fig.savefig(buf, format="png")
-        plt.close(fig)
-        buf.seek(0)
-        frames.append(Image.open(buf).convert("P"))
-    
-    _save_gif(frames, os.path.join(OUTDIR, outname), duration=150)
+    fig, ax = _new_figure((6, 6), subplot_kw=dict(projection='polar'))
+
+    rays = []
+    for b in b_values:
+        # Simplified null geodesic (just for visualization)
+        # In reality would integrate full geodesic equations
+        phi_vals = np.linspace(0, np.pi, 200)
+        r_vals = b / np.sin(phi_vals + 1e-3)  # Simplified trajectory
+        r_vals = np.clip(r_vals, 1.01*rs, 100*rs)
+        line, = ax.plot(phi_vals, r_vals/rs, alpha=0.3, lw=1.0, color='blue')
+        rays.append((b, line))
+
+    # Add horizon circle
+    circle_phi = np.linspace(0, 2*np.pi, 100)
+    ax.plot(circle_phi, np.ones_like(circle_phi), 'k--', lw=2, label='Horizon')
+    ax.set(ylim=(0, 10))
+    ax.grid(alpha=0.3)
 
+    def update(b_highlight):
+        for b, line in rays:
+            hit = abs(b - b_highlight) < 0.1*rs
+            line.set_alpha(1.0 if hit else 0.3)
+            line.set_linewidth(2.5 if hit else 1.0)
+            line.set_color('red' if hit else 'blue')
+        ax.set_title(f"Gravitational Lensing — b = {b_highlight/rs:.2f} $r_s$")
 
-def gif_wave(rs: float, varphi=PHI, outname="wave_packet.gif"):
+    return fig, update
+
+
+def _frames_lens(rs, varphi):
+    return list(np.linspace(1.5*rs, 5*rs, 8))
+
+
+# Wellenpaket: Gitter, Laufzeit (in r_s/c) und Frame-Anzahl
+WAVE_POINTS = 2000
+WAVE_T_MAX = 12.0
+WAVE_FRAMES = 40
+
+
+def _wave_setup(rs, varphi, n_points=WAVE_POINTS):
+    """Gitter und lokale Lichtgeschwindigkeit c(x) = sqrt(A(r))."""
+    x = np.linspace(1.05*rs, 20*rs, n_points)
+    Asafe, rstar = A_safe(x, rs, varphi=varphi)
+    c_local = np.sqrt(np.maximum(Asafe, 0.01))  # Local speed of light
+    return x, c_local, rstar
+
+
+def advect_lax_wendroff(psi, velocity, dx: float, dt: float, steps: int):
     """
-    Animate 1D wave packet propagation with c(x) = sqrt(A(r)).
-    Shows wave propagation speed varying with spacetime curvature.
+    Lax-Wendroff für ∂ψ/∂t + v(x) ∂ψ/∂x = 0 (vektorisiert, 2. Ordnung).
+
+    ψ^{n+1} = ψ - (Δt/2Δx) v (ψ_{i+1} - ψ_{i-1})
+                + (Δt²/2Δx²) v [v_{i+½}(ψ_{i+1} - ψ_i) - v_{i-½}(ψ_i - ψ_{i-1})]
+
+    Stabil für max|v| Δt/Δx ≤ 1. Einström-Rand (stromaufwärts) ψ = 0,
+    Ausström-Rand linear extrapoliert.
+
+    Args:
+        psi: Anfangswerte (komplex oder reell)
+        velocity: v(x) auf demselben Gitter (einheitliches Vorzeichen)
+        dx: Gitterabstand
+        dt: Zeitschritt
+        steps: Anzahl Schritte
+
+    Returns:
+        ψ nach steps Schritten
+    """
+    psi = np.array(psi, dtype=complex if np.iscomplexobj(psi) else float)
+    v = np.asarray(velocity, float)
+    a = 0.5 * dt / dx
+    b = 0.5 * (dt / dx)**2
+    v_c = v[1:-1]
+    v_face = 0.5 * (v[1:] + v[:-1])
+    inflow_left = v.mean() > 0
+    for _ in range(steps):
+        grad = psi[1:] - psi[:-1]
+        flux = v_face * grad
+        psi[1:-1] += -a * v_c * (grad[1:] + grad[:-1]) + b * v_c * (flux[1:] - flux[:-1])
+        if inflow_left:
+            psi[0] = 0.0
+            psi[-1] = 2.0 * psi[-2] - psi[-3]
+        else:
+            psi[-1] = 0.0
+            psi[0] = 2.0 * psi[1] - psi[2]
+    return psi
+
+
+def simulate_wave_packet(rs: float, varphi: float = PHI, n_points: int = WAVE_POINTS,
+                         t_max: float = WAVE_T_MAX, n_frames: int = WAVE_FRAMES,
+                         cfl: float = 0.9):
+    """
+    Einlaufendes Gauß-Paket mit ∂ψ/∂t = c(x) ∂ψ/∂x, c(x) = sqrt(A(r)).
+
+    Simulation und Ausgabe sind entkoppelt: der Zeitschritt folgt aus der
+    CFL-Bedingung (unabhängig von der Frame-Anzahl), gespeichert wird nur
+    jeder k-te Schritt.
+
+    Args:
+        rs: Schwarzschild radius
+        varphi: φ-Parameter
+        n_points: Gitterpunkte auf [1.05, 20] r_s
+        t_max: Laufzeit in Einheiten r_s/c
+        n_frames: Anzahl gespeicherter Zustände (inkl. t = 0)
+        cfl: Courant-Zahl (≤ 1)
+
+    Returns:
+        Liste von (t [r_s/c], |ψ|²)
     """
-    # Spatial grid
-    x_min, x_max = 1.05*rs, 20*rs
-    N_points = 500
-    x = np.linspace(x_min, x_max, N_points)
+    x, c_local, rstar = _wave_setup(rs, varphi, n_points)
     dx = x[1] - x[0]
-    
-    # Get A(x) for wave speed
-    Asafe, rstar = A_safe(x, rs, varphi=varphi)
-    c_local = np.sqrt(np.maximum(Asafe, 0.01))  # Local speed of light
-    
+
     # Initial Gaussian wave packet
-    x0 = 10 * rs
-    sigma = 2 * rs
+    x0 = 12 * rs
+    sigma = 1.5 * rs
     k0 = 2 * np.pi / rs  # Wave number
-    
-    # Complex wave function
-    psi_init = np.exp(-((x - x0)**2) / (2*sigma**2)) * np.exp(1j * k0 * x)
-    
-    frames = []
-    
-    # Time evolution (simplified advection)
-    dt = 0.5
-    t_max = 30
-    
-    psi = psi_init.copy()
-    
-    for t in np.arange(0, t_max, dt):
-        # Simple advection: ∂ψ/∂t = -c(x) ∂ψ/∂x
-        # Using upwind scheme
-        psi_new = psi.copy()
-        for i in range(1, N_points-1):
-            dpsi_dx = (psi[i+1] - psi[i-1]) / (2*dx)
-            psi_new[i] = psi[i] - dt * c_local[i] * dpsi_dx
-        
-        psi = psi_new
-        
-        # Every few steps, save a frame
-        if int(t/dt) % 2 == 0:
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(8, 6), dpi=120, sharex=True)
-            
-            # Top: Wave packet amplitude
-            ax1.plot(x/rs, np.abs(psi)**2, lw=2, color='blue')
-            ax1.axvline(rstar/rs, ls=':', color='red', alpha=0.6, label='$r^*$')
-            ax1.set(ylabel='$|\\psi|^2$', ylim=(0, 1.1),
-                    title=f"Wave Packet — t = {t:.1f}")
-            ax1.grid(alpha=0.3)
-            ax1.legend()
-            
-            # Bottom: Local speed of light
-            ax2.plot(x/rs, c_local, lw=2, color='green')
-            ax2.axvline(rstar/rs, ls=':', color='red', alpha=0.6)
-            ax2.set(xlabel='r/$r_s$', ylabel='$c_{local}/c$', ylim=(0, 1.1))
-            ax2.grid(alpha=0.3)
-            
-            buf = io.BytesIO()
-            plt.tight_layout()
-            fig.savefig(buf, format="png")
-            plt.close(fig)
-            buf.seek(0)
-            frames.append(Image.open(buf).convert("P"))
-    
-    _save_gif(frames, os.path.join(OUTDIR, outname), duration=100)
+    psi = np.exp(-((x - x0)**2) / (2*sigma**2)) * np.exp(1j * k0 * x)
+
+    # Zeitschritt aus CFL, ganzzahlige Schritte pro Frame
+    dt_frame = t_max * rs / max(n_frames - 1, 1)
+    k = max(1, int(np.ceil(dt_frame * c_local.max() / (cfl * dx))))
+    dt = dt_frame / k
+
+    frames = [(0.0, np.abs(psi)**2)]
+    for n in range(1, n_frames):
+        psi = advect_lax_wendroff(psi, -c_local, dx, dt, k)
+        frames.append((n * dt_frame / rs, np.abs(psi)**2))
+    return frames
+
+
+def _scene_wave(rs, varphi):
+    """1D wave packet with c(x) = sqrt(A(r)) - Frame-Argument: (t, |ψ|²)."""
+    x, c_local, rstar = _wave_setup(rs, varphi)
+    fig, (ax1, ax2) = _new_figure((8, 6), nrows=2, sharex=True)
+
+    # Top: Wave packet amplitude
+    density, = ax1.plot(x/rs, np.zeros_like(x), lw=2, color='blue')
+    ax1.axvline(rstar/rs, ls=':', color='red', alpha=0.6, label='$r^*$')
+    ax1.set(ylabel='$|\\psi|^2$', ylim=(0, 1.1))
+    ax1.grid(alpha=0.3)
+    ax1.legend()
+
+    # Bottom: Local speed of light
+    ax2.plot(x/rs, c_local, lw=2, color='green')
+    ax2.axvline(rstar/rs, ls=':', color='red', alpha=0.6)
+    ax2.set(xlabel='r/$r_s$', ylabel='$c_{local}/c$', ylim=(0, 1.1))
+    ax2.grid(alpha=0.3)
+
+    def update(frame):
+        t, rho = frame
+        density.set_ydata(rho)
+        ax1.set_title(f"Wave Packet — t = {t:.1f} $r_s/c$")
+
+    return fig, update
+
+
+def _frames_wave(rs, varphi):
+    return simulate_wave_packet(rs, varphi)
+
+
+# kind -> (Szene, Frame-Argumente, Dateiname, Frame-Dauer [ms])
+ANIMATIONS = {
+    "time": (_scene_time, _frames_time, "time_dilation_mirror_phi.gif", 140),
+    "A": (_scene_A, _frames_A, "A_safe_comparison.gif", 120),
+    "K": (_scene_K, _frames_K, "curvature_proxy_scan.gif", 120),
+    "lens": (_scene_lens, _frames_lens, "lensing_paths.gif", 150),
+    "wave": (_scene_wave, _frames_wave, "wave_packet.gif", 100),
+}
+
+
+# Frames pro Worker-Auftrag (obere Grenze, hält den Speicher konstant)
+FRAME_CHUNK = 16
+
+
+def _scene_frames(kind, rs, varphi, layout_arg, args):
+    """
+    Frames einer Szene als Generator.
+
+    Figure/Artists werden einmal gebaut und pro Frame nur aktualisiert.
+    Das Layout wird einmal mit dem ersten Frame der Animation festgelegt,
+    damit alle Blöcke identisch aussehen.
+    """
+    scene = ANIMATIONS[kind][0]
+    fig, update = scene(rs, varphi)
+    update(layout_arg)
+    fig.tight_layout()
+    for arg in args:
+        update(arg)
+        yield _frame_array(fig)
+
+
+def _render_chunk(task):
+    """Worker: rendert einen Block aufeinanderfolgender Frames einer Szene."""
+    return list(_scene_frames(*task))
+
+
+def iter_frames(kinds, rs: float, varphi: float = PHI, jobs: int = 1):
+    """
+    Frames einer oder mehrerer Animationen in Reihenfolge (Generator).
+
+    Mit jobs > 1 werden Blöcke von höchstens FRAME_CHUNK Frames auf einen
+    Prozess-Pool verteilt; es sind nie mehr als 2·jobs Blöcke unterwegs,
+    der Speicherbedarf ist daher unabhängig von der Frame-Anzahl.
+
+    Args:
+        kinds: Auswahl aus ANIMATIONS ("time", "A", "K", "lens", "wave")
+        rs: Schwarzschild radius
+        varphi: φ-Parameter
+        jobs: Prozesse (1 = seriell im aktuellen Prozess)
+
+    Yields:
+        (kind, RGB-Array H×W×3)
+    """
+    if jobs <= 1:
+        for kind in kinds:
+            args = ANIMATIONS[kind][1](rs, varphi)
+            for frame in _scene_frames(kind, rs, varphi, args[0], args):
+                yield kind, frame
+        return
+
+    tasks = []
+    for kind in kinds:
+        args = ANIMATIONS[kind][1](rs, varphi)
+        size = max(1, min(FRAME_CHUNK, -(-len(args) // (2 * jobs))))
+        for start in range(0, len(args), size):
+            tasks.append((kind, rs, varphi, args[0], args[start:start + size]))
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append((task[0], pool.submit(_render_chunk, task)))
+            if len(pending) >= 2 * jobs:
+                kind, future = pending.popleft()
+                for frame in future.result():
+                    yield kind, frame
+        while pending:
+            kind, future = pending.popleft()
+            for frame in future.result():
+                yield kind, frame
+
+
+def render_animations(kinds, rs: float, varphi: float = PHI, jobs: int = 1,
+                      outnames=None, fmt: str = "gif"):
+    """
+    Rendert eine oder mehrere Animationen und schreibt sie streamend.
+
+    Args:
+        kinds: Auswahl aus ANIMATIONS ("time", "A", "K", "lens", "wave")
+        rs: Schwarzschild radius
+        varphi: φ-Parameter
+        jobs: Prozesse (1 = seriell im aktuellen Prozess)
+        outnames: Optional dict kind -> Dateiname (Endung bestimmt das Format)
+        fmt: Standardformat: "gif", "apng", "mp4" oder "webm"
+
+    Returns:
+        dict kind -> Pfad der geschriebenen Datei
+    """
+    outnames = outnames or {}
+    paths, writers = {}, {}
+    for kind in kinds:
+        _, _, default_name, duration = ANIMATIONS[kind]
+        name = outnames.get(kind) or os.path.splitext(default_name)[0] + FORMAT_EXTENSIONS[fmt]
+        paths[kind] = os.path.join(OUTDIR, name)
+        writers[kind] = open_writer(paths[kind], duration)
+
+    try:
+        for kind, frame in iter_frames(kinds, rs, varphi, jobs):
+            writers[kind].append(frame)
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    for kind in kinds:
+        print(f"✅ Saved: {paths[kind]} ({writers[kind].n_frames} frames)")
+    return paths
+
+
+def gif_time_dilation(rs: float, varphi: float, outname="time_dilation_mirror_phi.gif",
+                      jobs: int = 1):
+    """Animate time dilation D(r) with φ-sweep."""
+    render_animations(["time"], rs, varphi, jobs, {"time": outname})
+
+
+def gif_A_compare(rs: float, varphi=PHI, outname="A_safe_comparison.gif", jobs: int = 1):
+    """Animate A(r) comparison with moving marker."""
+    render_animations(["A"], rs, varphi, jobs, {"A": outname})
+
+
+def gif_curvature_proxy(rs: float, varphi=PHI, outname="curvature_proxy_scan.gif",
+                        jobs: int = 1):
+    """Animate curvature proxy scan."""
+    render_animations(["K"], rs, varphi, jobs, {"K": outname})
+
+
+def gif_lens(rs: float, varphi=PHI, outname="lensing_paths.gif", jobs: int = 1):
+    """
+    Animate light rays (null geodesics) through the SSZ metric.
+    Shows gravitational lensing with different impact parameters.
+    """
+    render_animations(["lens"], rs, varphi, jobs, {"lens": outname})
+
+
+def gif_wave(rs: float, varphi=PHI, outname="wave_packet.gif", jobs: int = 1):
+    """
+    Animate 1D wave packet propagation with c(x) = sqrt(A(r)).
+    Shows wave propagation speed varying with spacetime curvature.
+    """
+    render_animations(["wave"], rs, varphi, jobs, {"wave": outname})
 
 
 def main():
@@ -321,6 +735,8 @@ Examples:
   python -m viz_ssz_metric.sszviz_cli check --varphis 1.0 1.61803398875
   python -m viz_ssz_metric.sszviz_cli gif --kind all --varphi 1.0
   python -m viz_ssz_metric.sszviz_cli gif --kind time --varphi 1.61803398875
+  python -m viz_ssz_metric.sszviz_cli gif --kind all --jobs 8
+  python -m viz_ssz_metric.sszviz_cli gif --kind wave --format apng
         """
     )
     
@@ -343,6 +759,10 @@ Examples:
                       help="Which GIF(s) to generate")
     pgif.add_argument("--varphi", type=float, default=PHI,
                       help=f"φ-parameter (default: {PHI:.10f})")
+    pgif.add_argument("--jobs", type=int, default=1,
+                      help="Worker processes for frame rendering (default: 1)")
+    pgif.add_argument("--format", choices=list(FORMAT_EXTENSIONS), default="gif",
+                      help="Output format; mp4/webm need a local ffmpeg (default: gif)")
     
     args = ap.parse_args()
     
@@ -352,25 +772,9 @@ Examples:
     elif args.cmd == "gif":
         print(f"\n🎬 Generating GIF(s) with φ = {args.varphi:.6f}, r_s = {args.rs}\n")
         
-        if args.kind in ("time", "all"):
-            print("📊 Creating time dilation animation...")
-            gif_time_dilation(args.rs, args.varphi)
-        
-        if args.kind in ("A", "all"):
-            print("📊 Creating A(r) comparison animation...")
-            gif_A_compare(args.rs, args.varphi)
-        
-        if args.kind in ("K", "all"):
-            print("📊 Creating curvature proxy animation...")
-            gif_curvature_proxy(args.rs, args.varphi)
-        
-        if args.kind in ("lens", "all"):
-            print("📊 Creating gravitational lensing animation...")
-            gif_lens(args.rs, args.varphi)
-        
-        if args.kind in ("wave", "all"):
-            print("📊 Creating wave packet animation...")
-            gif_wave(args.rs, args.varphi)
+        kinds = list(ANIMATIONS) if args.kind == "all" else [args.kind]
+        print(f"📊 Rendering {', '.join(kinds)} ({args.jobs} job(s))...")
+        render_animations(kinds, args.rs, args.varphi, jobs=args.jobs, fmt=args.format)
         
         print(f"\n✅ Done! Check: {OUTDIR}/\n")
 
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+Stabilitäts-Sweep über (λ_A, K, φ) - Black Hole Bomb Phasendiagramm
+
+Für jeden Gitterpunkt die gekappte Rekursion
+E_{t+1} = min(E_t (1 + λ_A - λ_A² K²), E_0 (1 - exp(-φK))):
+
+- Zeitentwicklung in geschlossener Form (bomb_dynamics), vektorisiert
+  über das ganze Teilgitter
+- Frühabbruch: der Sättigungsschritt folgt direkt aus log(E_max/E_0)/log g,
+  gesättigte Punkte werden nicht weiter entwickelt (O(1) pro Punkt)
+- Sharding entlang der λ_A-Achse, optional über einen Prozess-Pool
+- Ergebnis als kompaktes strukturiertes .npy (memmap, von den Workern
+  direkt beschrieben) plus Achsen-Datei <name>_axes.npz
+
+Status-Codes:
+    SATURATED  (0): Kappung vor dem letzten Schritt erreicht
+    GROWING    (1): g > 1, E_max noch nicht erreicht
+    DAMPED     (2): g ≤ 1, Energie fällt ohne Kappung
+    UNPHYSICAL (3): g ≤ 0 (λ_A² K² ≥ 1 + λ_A)
+
+© 2025 Carmen Wrede & Lino Casu
+Licensed under the ANTI-CAPITALIST SOFTWARE LICENSE v1.4
+"""
+from __future__ import annotations
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Sequence, Tuple
+
+try:
+    from .bomb_dynamics import (first_saturation_step, growth_factor_ssz,
+                                log_energy_at, saturation_energy)
+except ImportError:
+    from bomb_dynamics import (first_saturation_step, growth_factor_ssz,
+                               log_energy_at, saturation_energy)
+
+
+SATURATED, GROWING, DAMPED, UNPHYSICAL = 0, 1, 2, 3
+
+# 13 Bytes pro Gitterpunkt
+SWEEP_DTYPE = np.dtype([
+    ('status', 'i1'),
+    ('saturation_step', 'i4'),
+    ('log10_E', 'f4'),          # log10 E am letzten Schritt
+    ('growth_rate', 'f4'),      # g - 1
+])
+
+# Gitterpunkte pro Shard (Richtwert)
+SHARD_POINTS = 1 << 20
+
+
+def _evaluate(lambda_A, K, varphi, steps: int, E_initial: float) -> np.ndarray:
+    """Strukturiertes Ergebnis-Array (len(λ), len(K), len(φ))."""
+    lam = np.asarray(lambda_A, float)[:, None, None]
+    KK = np.asarray(K, float)[None, :, None]
+    phi = np.asarray(varphi, float)[None, None, :]
+    shape = (lam.shape[0], KK.shape[1], phi.shape[2])
+    t_final = steps - 1
+
+    g = growth_factor_ssz(lam, KK)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_g = np.where(g > 0, np.log(np.where(g > 0, g, 1.0)), np.nan)
+        log_E_max = np.log(saturation_energy(E_initial, KK, phi))
+    log_E0 = np.log(E_initial)
+
+    sat_step = np.broadcast_to(first_saturation_step(log_E0, log_g, log_E_max, t_final), shape)
+    log_E = np.broadcast_to(log_energy_at(t_final, log_E0, log_g, log_E_max), shape)
+    g = np.broadcast_to(g, shape)
+
+    out = np.empty(shape, dtype=SWEEP_DTYPE)
+    out['status'] = np.select([g <= 0, sat_step >= 0, g > 1],
+                              [UNPHYSICAL, SATURATED, GROWING], DAMPED)
+    out['saturation_step'] = sat_step
+    out['log10_E'] = log_E / np.log(10.0)
+    out['growth_rate'] = g - 1.0
+    return out
+
+
+def _sweep_shard(task) -> Optional[np.ndarray]:
+    """Worker: ein λ_A-Block; schreibt direkt ins memmap, falls path gesetzt."""
+    start, lam_block, K, varphi, steps, E_initial, path = task
+    block = _evaluate(lam_block, K, varphi, steps, E_initial)
+    if path is None:
+        return block
+    grid = np.load(path, mmap_mode='r+')
+    grid[start:start + len(lam_block)] = block
+    grid.flush()
+    del grid
+    return None
+
+
+class StabilitySweep:
+    """
+    Black-Hole-Bomb-Stabilität auf einem 3D-Gitter (λ_A, K, φ).
+
+    Verwendung:
+    >>> sweep = StabilitySweep(np.logspace(-8, -1, 400), np.arange(1, 501),
+    ...                        np.linspace(1.2, 2.0, 33), steps=10_000)
+    >>> grid = sweep.run('bomb_sweep.npy', jobs=4)
+    >>> grid['status'].shape
+    (400, 500, 33)
+    """
+
+    def __init__(self, lambda_A: Sequence[float], K: Sequence[float],
+                 varphi: Sequence[float], steps: int = 10000, E_initial: float = 1.0):
+        """
+        Initialize sweep.
+
+        Args:
+            lambda_A: Kopplungen (1D)
+            K: Segment-Anzahlen (1D)
+            varphi: Golden-Ratio-Werte φ (1D)
+            steps: Zeitschritte (letzter Schritt steps - 1)
+            E_initial: E_0 > 0
+        """
+        self.lambda_A = np.asarray(lambda_A, float).ravel()
+        self.K = np.asarray(K, float).ravel()
+        self.varphi = np.asarray(varphi, float).ravel()
+        if steps < 1:
+            raise ValueError(f"steps must be >= 1, got {steps}")
+        if E_initial <= 0:
+            raise ValueError(f"E_initial must be positive, got {E_initial}")
+        self.steps = int(steps)
+        self.E_initial = float(E_initial)
+        self.shape = (self.lambda_A.size, self.K.size, self.varphi.size)
+
+    @property
+    def nbytes(self) -> int:
+        """Größe des Ergebnis-Arrays in Bytes."""
+        return int(np.prod(self.shape)) * SWEEP_DTYPE.itemsize
+
+    def shards(self, shard_points: int = SHARD_POINTS):
+        """(start, λ_A-Block) mit ≈ shard_points Gitterpunkten pro Block."""
+        rows = max(1, shard_points // max(self.K.size * self.varphi.size, 1))
+        for start in range(0, self.lambda_A.size, rows):
+            yield start, self.lambda_A[start:start + rows]
+
+    def run(self, path: Optional[str] = None, jobs: int = 1,
+            shard_points: int = SHARD_POINTS) -> np.ndarray:
+        """
+        Führe den Sweep aus.
+
+        Args:
+            path: Ziel-.npy (strukturiert, memmap); Achsen in <name>_axes.npz
+            jobs: Prozesse (1 = seriell)
+            shard_points: Gitterpunkte pro Shard
+
+        Returns:
+            Strukturiertes Array (len(λ), len(K), len(φ)) mit SWEEP_DTYPE
+            (np.memmap, falls path gesetzt)
+        """
+        if path is not None:
+            grid = np.lib.format.open_memmap(path, mode='w+', dtype=SWEEP_DTYPE,
+                                             shape=self.shape)
+            grid.flush()
+            del grid
+            np.savez(axes_path(path), lambda_A=self.lambda_A, K=self.K,
+                     varphi=self.varphi, steps=self.steps, E_initial=self.E_initial)
+        else:
+            grid = np.empty(self.shape, dtype=SWEEP_DTYPE)
+
+        tasks = [(start, block, self.K, self.varphi, self.steps, self.E_initial, path)
+                 for start, block in self.shards(shard_points)]
+        if jobs > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = list(pool.map(_sweep_shard, tasks))
+        else:
+            results = [_sweep_shard(task) for task in tasks]
+
+        if path is not None:
+            return np.load(path, mmap_mode='r')
+        for (start, block, *_), part in zip(tasks, results):
+            grid[start:start + len(block)] = part
+        return grid
+
+    def summary(self, grid: np.ndarray) -> Dict[str, float]:
+        """Anteile der Status-Klassen und der kritisch stabilen Punkte."""
+        status = np.asarray(grid['status'])
+        stable = (self.lambda_A[:, None] < 1.0 / self.K[None, :]**2)[..., None]
+        return {
+            'saturated': float(np.mean(status == SATURATED)),
+            'growing': float(np.mean(status == GROWING)),
+            'damped': float(np.mean(status == DAMPED)),
+            'unphysical': float(np.mean(status == UNPHYSICAL)),
+            'stable_coupling': float(np.mean(np.broadcast_to(stable, status.shape))),
+        }
+
+
+def axes_path(path: str) -> str:
+    """Achsen-Datei zu einem Sweep-.npy."""
+    return os.path.splitext(path)[0] + '_axes.npz'
+
+
+def load_sweep(path: str) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Lade einen gespeicherten Sweep.
+
+    Returns:
+        (grid als memmap, dict mit lambda_A, K, varphi, steps, E_initial)
+    """
+    with np.load(axes_path(path)) as axes:
+        meta = {key: axes[key] for key in axes.files}
+    return np.load(path, mmap_mode='r'), meta
@@ -166,6 +166,33 @@ def test_SSZ_vs_GR_values_at_rstar():
     assert abs(D_ssz - D_gr) < 1e-8, f"SSZ≠GR am Schnittpunkt! Diff={abs(D_ssz-D_gr)}"
 
 
+def test_u_star_cache_and_interpolant():
+    """Test: u*(φ) skaliert mit r_s, Array-Interpolant = exakte Wurzel"""
+    from viz_ssz_metric.ssz_mirror_metric import u_star, _u_star_root, U_STAR_PHI_RANGE
+    
+    # r* = u*(φ) · r_s für beliebige r_s
+    for rs in (1.0, 2953.25, 1.27e10):
+        assert solve_r_star(rs, PHI) / rs == pytest.approx(u_star(PHI), rel=1e-14)
+    
+    # Interpolant (innerhalb) und exakter Fallback (außerhalb des Bereichs)
+    varphis = np.linspace(0.1, 8.0, 300)
+    exact = np.array([_u_star_root(float(v)) for v in varphis])
+    approx = u_star(varphis)
+    
+    print("\n✅ Test u*(φ) Interpolant:")
+    print(f"   Bereich = {U_STAR_PHI_RANGE}, max|Δu*| = {np.abs(approx - exact).max():.2e}")
+    
+    assert approx.shape == varphis.shape
+    assert np.abs(approx - exact).max() < 1e-12
+    
+    # A_safe und B_safe: identisches r*, B = 1/A
+    from viz_ssz_metric.ssz_mirror_metric import B_safe
+    r = np.linspace(1.05, 6.0, 50)
+    A, rstar = A_safe(r, 1.0, varphi=PHI)
+    assert rstar == u_star(PHI)
+    assert np.allclose(B_safe(r, 1.0, varphi=PHI), 1.0 / A, rtol=1e-15)
+
+
 def test_post_newtonian_series():
     """Test: Post-Newtonsche Serie A(r) = 1 - 2U + 2U² + ε₃U³"""
     from viz_ssz_metric.ssz_mirror_metric import (
@@ -267,11 +294,11 @@ def test_intersection_high_precision():
         return
     
     # φ = 1.0
-    result_1 = intersection_time_dilation(varphi=1.0)
+    result_1 = intersection_time_dilation(varphi=1.0, high_precision=True)
     u1, D1 = result_1['u'], result_1['D']
     
     # φ = Golden Ratio
-    result_phi = intersection_time_dilation(varphi=(1+5**0.5)/2)
+    result_phi = intersection_time_dilation(varphi=(1+5**0.5)/2, high_precision=True)
     u_phi, D_phi = result_phi['u'], result_phi['D']
     
     print(f"\n✅ Test Intersection (mpmath high-precision):")
@@ -286,6 +313,38 @@ def test_intersection_high_precision():
     assert 0.52 < D_phi < 0.54, f"D*(φ=φ) = {D_phi} außerhalb erwarteter Range"
 
 
+
+def test_intersection_vectorized():
+    """Test: Schnittpunkte für viele φ in einem Aufruf (Newton + Bisektion)"""
+    from viz_ssz_metric.ssz_mirror_metric import intersection_time_dilation, HAS_MPMATH
+    
+    rng = np.random.default_rng(42)
+    varphis = rng.uniform(0.01, 20.0, 100_000)
+    result = intersection_time_dilation(varphis)
+    u, D = result['u'], result['D']
+    
+    # Residuum der Schnittpunkt-Gleichung und D* = D_SSZ(r*)
+    residual = np.sqrt(1 - 1/u) - 1/(2 - np.exp(-varphis * u))
+    print(f"\n✅ Test vektorisierter Schnittpunkt ({varphis.size} φ-Werte):")
+    print(f"   max|Residuum| = {np.abs(residual).max():.2e}")
+    
+    assert u.shape == varphis.shape
+    assert np.abs(residual).max() < 1e-14
+    assert np.allclose(D, np.sqrt(A_SSZ(u, 1.0, varphis)), rtol=1e-12)
+    
+    # Skalar-Pfad identisch, ungültige φ → NaN
+    assert result['u'][0] == pytest.approx(intersection_time_dilation(varphis[0])['u'], rel=1e-14)
+    assert np.isnan(intersection_time_dilation(np.array([0.0, -1.0]))['u']).all()
+    with pytest.raises(ValueError):
+        intersection_time_dilation(0.0)
+    
+    # solve_r_star auf Arrays
+    assert np.allclose(solve_r_star(3.0, varphis[:100]), 3.0 * u[:100], rtol=1e-12)
+    
+    if HAS_MPMATH:
+        check = intersection_time_dilation(varphis[:20], high_precision=True)
+        assert np.allclose(check['u'], u[:20], rtol=1e-14)
+
 if __name__ == "__main__":
     # Kann auch direkt ausgeführt werden
     print("="*80)
@@ -299,13 +358,15 @@ if __name__ == "__main__":
     test_curvature_proxy_finite()
     test_mirror_blend_smoothness()
     test_SSZ_vs_GR_values_at_rstar()
+    test_u_star_cache_and_interpolant()
     
     # Neue Post-Newtonsche Tests
     test_post_newtonian_series()
     test_metric_tensor_components()
     test_proper_time_vs_coordinate_time()
     test_intersection_high_precision()
+    test_intersection_vectorized()
     
     print("\n" + "="*80)
-    print("✅ ALL 10 TESTS PASSED!")
+    print("✅ ALL 12 TESTS PASSED!")
     print("="*80)
@@ -18,9 +18,10 @@ from .ssz_mirror_metric import (
     schwarzschild_radius, D_SSZ, Xi, proper_time_dilation,
     metric_functions_pn, PHI, G_DEFAULT, C_DEFAULT
 )
+from .metric_backend import resolve_backend
 
 
-def D_from_metric(mass: float, r: float) -> float:
+def D_from_metric(mass: float, r: float, backend=None) -> float:
     """Zeitdilatation aus Post-Newtonscher Metrik.
     
     D_PN = √|g_tt| = √A(r)
@@ -28,14 +29,17 @@ def D_from_metric(mass: float, r: float) -> float:
     Args:
         mass: Masse in kg
         r: Radius in m
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         D_PN ∈ (0, 1]
     """
-    return proper_time_dilation(mass, r)
+    if backend is None:
+        return proper_time_dilation(mass, r)
+    return np.sqrt(np.abs(backend.A(r)))
 
 
-def D_from_segments(mass: float, r: float, varphi: float = PHI) -> float:
+def D_from_segments(mass: float, r: float, varphi: float = PHI, backend=None) -> float:
     """Zeitdilatation aus Segment-Dichte.
     
     D_SSZ = 1/(1 + Ξ(r))
@@ -44,21 +48,23 @@ def D_from_segments(mass: float, r: float, varphi: float = PHI) -> float:
         mass: Masse in kg
         r: Radius in m
         varphi: φ-Parameter
+        backend: Metrik-Backend (liefert r_s; default: PN-Serie für mass)
     
     Returns:
         D_SSZ ∈ (0, 1]
     """
-    rs = schwarzschild_radius(mass)
+    rs = resolve_backend(mass, backend).rs
     return D_SSZ(r, rs, varphi)
 
 
-def time_dilation_comparison(mass: float, r: float, varphi: float = PHI) -> dict:
+def time_dilation_comparison(mass: float, r: float, varphi: float = PHI, backend=None) -> dict:
     """Vergleiche beide Zeitdilatations-Formulierungen.
     
     Args:
         mass: Masse in kg
         r: Radius in m
         varphi: φ-Parameter
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         dict mit Keys:
@@ -67,8 +73,8 @@ def time_dilation_comparison(mass: float, r: float, varphi: float = PHI) -> dict
         - 'Delta': Absolute Differenz
         - 'Delta_%': Relative Differenz in Prozent
     """
-    D_pn = D_from_metric(mass, r)
-    D_ssz = D_from_segments(mass, r, varphi)
+    D_pn = D_from_metric(mass, r, backend)
+    D_ssz = D_from_segments(mass, r, varphi, backend)
     
     delta_abs = D_pn - D_ssz
     delta_rel = 100 * delta_abs / D_pn if D_pn > 0 else np.nan
@@ -82,7 +88,7 @@ def time_dilation_comparison(mass: float, r: float, varphi: float = PHI) -> dict
 
 
 def proper_time_elapsed(mass: float, r: float, dt_coordinate: float, 
-                        method: str = 'PN') -> float:
+                        method: str = 'PN', backend=None) -> float:
     """Berechne verstrichene Eigenzeit für gegebene Koordinatenzeit.
     
     dτ = D(r) · dt
@@ -92,6 +98,7 @@ def proper_time_elapsed(mass: float, r: float, dt_coordinate: float,
         r: Radius in m
         dt_coordinate: Koordinatenzeit-Intervall (Sekunden)
         method: 'PN' (Metrik) oder 'SSZ' (Segmente)
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         dτ (Eigenzeit in Sekunden)
@@ -101,16 +108,16 @@ def proper_time_elapsed(mass: float, r: float, dt_coordinate: float,
         langsamer als in unendlicher Entfernung.
     """
     if method == 'PN':
-        D = D_from_metric(mass, r)
+        D = D_from_metric(mass, r, backend)
     elif method == 'SSZ':
-        D = D_from_segments(mass, r)
+        D = D_from_segments(mass, r, backend=backend)
     else:
         raise ValueError(f"Unbekannte Methode: {method}")
     
     return D * dt_coordinate
 
 
-def gravitational_redshift(mass: float, r: float, method: str = 'PN') -> float:
+def gravitational_redshift(mass: float, r: float, method: str = 'PN', backend=None) -> float:
     """Gravitationsrotverschiebung z = 1/D - 1.
     
     Für Licht von r nach ∞:
@@ -120,14 +127,15 @@ def gravitational_redshift(mass: float, r: float, method: str = 'PN') -> float:
         mass: Masse in kg
         r: Radius in m
         method: 'PN' oder 'SSZ'
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         z (dimensionslos, z>0 für Rotverschiebung)
     """
     if method == 'PN':
-        D = D_from_metric(mass, r)
+        D = D_from_metric(mass, r, backend)
     elif method == 'SSZ':
-        D = D_from_segments(mass, r)
+        D = D_from_segments(mass, r, backend=backend)
     else:
         raise ValueError(f"Unbekannte Methode: {method}")
     
@@ -135,7 +143,7 @@ def gravitational_redshift(mass: float, r: float, method: str = 'PN') -> float:
 
 
 def clock_experiment_prediction(mass: float, r1: float, r2: float, 
-                                dt_coordinate: float = 3600.0) -> dict:
+                                dt_coordinate: float = 3600.0, backend=None) -> dict:
     """Vorhersage für Uhren-Experiment (GPS-ähnlich).
     
     Zwei Uhren bei r1 und r2, Vergleich nach dt_coordinate Sekunden.
@@ -144,6 +152,7 @@ def clock_experiment_prediction(mass: float, r1: float, r2: float,
         mass: Masse in kg
         r1, r2: Radien der beiden Uhren
         dt_coordinate: Koordinatenzeit-Intervall (default: 1 Stunde)
+        backend: Metrik-Backend (default: PN-Serie für mass)
     
     Returns:
         dict mit Keys:
@@ -151,11 +160,11 @@ def clock_experiment_prediction(mass: float, r1: float, r2: float,
         - 'dtau_1_SSZ', 'dtau_2_SSZ': Eigenzeiten (Segment-Dichte)
         - 'diff_PN', 'diff_SSZ': Zeitdifferenzen in Sekunden
     """
-    dtau_1_pn = proper_time_elapsed(mass, r1, dt_coordinate, 'PN')
-    dtau_2_pn = proper_time_elapsed(mass, r2, dt_coordinate, 'PN')
+    dtau_1_pn = proper_time_elapsed(mass, r1, dt_coordinate, 'PN', backend)
+    dtau_2_pn = proper_time_elapsed(mass, r2, dt_coordinate, 'PN', backend)
     
-    dtau_1_ssz = proper_time_elapsed(mass, r1, dt_coordinate, 'SSZ')
-    dtau_2_ssz = proper_time_elapsed(mass, r2, dt_coordinate, 'SSZ')
+    dtau_1_ssz = proper_time_elapsed(mass, r1, dt_coordinate, 'SSZ', backend)
+    dtau_2_ssz = proper_time_elapsed(mass, r2, dt_coordinate, 'SSZ', backend)
     
     return {
         'dtau_1_PN': dtau_1_pn,
@@ -53,6 +53,21 @@ except ImportError:
         HAS_THEORY = False
         print("Warning: scalar_action_theory or numerical_stability not available!")
 
+try:
+    from .qnm_spectrum import QNMSpectrumSolver
+    from .circular_orbits import CircularOrbitAnalysis
+    from .accretion_disk import ThinDiskModel
+    from .orbit_precession import periapsis_shift
+    from .bomb_dynamics import energy_evolution
+    from .jit_kernels import metric_A_kernel
+except ImportError:
+    from qnm_spectrum import QNMSpectrumSolver
+    from circular_orbits import CircularOrbitAnalysis
+    from accretion_disk import ThinDiskModel
+    from orbit_precession import periapsis_shift
+    from bomb_dynamics import energy_evolution
+    from jit_kernels import metric_A_kernel
+
 # Physikalische Konstanten
 G_DEFAULT = 6.67430e-11  # m³/(kg·s²)
 C_DEFAULT = 299792458.0  # m/s
@@ -78,6 +93,12 @@ class UnifiedMetricParameters:
     # Post-Newtonsche Ordnung
     pn_order: int = 6  # bis O(U⁶)
     
+    # Δ(M) = A·exp(-α·r_s) + B [%] und PN-Koeffizienten ε₃..ε₆
+    # (Defaults = SSZ-Theorie; fitbar mit validation/fitting.py)
+    delta_coefficients: Tuple[float, float, float] = (98.01, 2.7177e4, 1.96)
+    pn_epsilons: Tuple[float, float, float, float] = (-24.0 / 5.0, 16.0 / 3.0,
+                                                     -80.0 / 7.0, 192.0 / 11.0)
+    
     # Sättigungs-Parameter
     epsilon: float = 1e-6  # Softplus minimum
     beta: float = 50.0     # Softplus steepness
@@ -205,7 +226,7 @@ class UnifiedSSZMetric:
             self.geodesics = None
             print("⚠️  geodesics_minimal.py not found, geodesic features disabled")
     
-    def delta_M_correction(self) -> float:
+    def delta_M_correction(self, M: float = None) -> float:
         """
         Δ(M) mass-dependent correction from φ-based geometry.
         
@@ -214,15 +235,19 @@ class UnifiedSSZMetric:
         NOT arbitrary fitting - emergent from φ-spiral scaling!
         ESO validated: 97.9% accuracy (427 S-Stars)
         
-        Parameters derived from φ-based principle:
+        Parameters derived from φ-based principle (params.delta_coefficients):
         - A = 98.01 (amplitude)
         - α = 2.7177e4 (inverse length scale)
         - B = 1.96 (offset)
         
+        Args:
+            M: Masse [kg] (Default: params.mass)
+        
         Returns:
             Δ(M) in percent (e.g., 2.0 means 2% correction)
         """
-        M = self.params.mass
+        if M is None:
+            M = self.params.mass
         G = self.params.G
         c = self.params.c
         
@@ -230,9 +255,7 @@ class UnifiedSSZMetric:
         r_s = 2.0 * G * M / (c * c)
         
         # φ-based parameters (NOT arbitrary!)
-        A = 98.01
-        ALPHA = 2.7177e4
-        B = 1.96
+        A, ALPHA, B = self.params.delta_coefficients
         
         # Exponential correction (natural from φ-geometry)
         delta = A * np.exp(-ALPHA * r_s) + B
@@ -250,7 +273,7 @@ class UnifiedSSZMetric:
         self.r_s = 2.0 * G * M / (c**2)
         
         # Masse-Korrektur Δ(M)
-        Delta_percent = 98.01 * np.exp(-27000 * self.r_s) + 2.01
+        Delta_percent = self.delta_M_correction()
         
         # φ-Radius (mit Masse-Korrektur)
         self.r_phi = (phi / 2.0) * self.r_s * (1.0 + Delta_percent / 100.0)
@@ -306,11 +329,8 @@ class UnifiedSSZMetric:
         delta_M = self.delta_M_correction()
         correction_factor = 1.0 + delta_M / 100.0
         
-        # Koeffizienten (aus SSZ-Theorie)
-        epsilon_3 = -24.0 / 5.0
-        epsilon_4 = 16.0 / 3.0
-        epsilon_5 = -80.0 / 7.0
-        epsilon_6 = 192.0 / 11.0
+        # Koeffizienten (aus SSZ-Theorie, siehe params.pn_epsilons)
+        epsilon_3, epsilon_4, epsilon_5, epsilon_6 = self.params.pn_epsilons
         
         # Serie aufbauen MIT Δ(M) correction!
         A_unsaturated = 1.0
@@ -335,6 +355,26 @@ class UnifiedSSZMetric:
             'epsilon_6': epsilon_6
         }
     
+    def pn_series_coefficients(self) -> np.ndarray:
+        """
+        Koeffizienten der PN-Serie A_pn(U) = Σ_k c_k U^k, k = 0..6.
+        
+        Identisch zu post_newtonian_coefficients (inkl. Δ(M) und pn_order),
+        als Array für vektorisierte Auswertung.
+        
+        Returns:
+            np.ndarray [c_0, ..., c_6]
+        """
+        pn = self.post_newtonian_coefficients(1.0)
+        coeffs = np.zeros(7)
+        coeffs[0] = 1.0
+        coeffs[1] = -2.0 * (1.0 + self.delta_M_correction() / 100.0)
+        coeffs[2] = 2.0
+        for k in range(3, 7):
+            if self.params.pn_order >= k:
+                coeffs[k] = pn[f'epsilon_{k}']
+        return coeffs
+    
     def golden_ratio_saturation(self, value: float, value_max: float, r: float) -> float:
         """
         Golden Ratio Sättigung nach Black Hole Bomb Mechanismus.
@@ -380,22 +420,76 @@ class UnifiedSSZMetric:
         2. Golden Ratio Sättigung bei r < r_φ
         3. Softplus-Floor garantiert A > 0
         4. Mirror-Blend am Schnittpunkt r*
-        """
-        # Post-Newtonsche Serie
-        pn = self.post_newtonian_coefficients(r)
-        A_pn = pn['A_unsaturated']
         
+        Ausgewertet in jit_kernels.metric_A_kernel (mit numba kompiliert),
+        gleiche Stufen wie post_newtonian_coefficients, golden_ratio_saturation
+        und softplus_floor.
+        """
+        return metric_A_kernel(r, *self.metric_kernel_args())
+
+    def metric_kernel_args(self) -> Tuple:
+        """
+        Parameter-Tupel für jit_kernels.metric_A_kernel / metric_A_array_kernel.
+
+        Gecacht pro Parameter-Signatur: ändern sich params (z.B.
+        delta_coefficients, pn_epsilons, varphi), werden r_s/r_φ neu
+        berechnet und das Tupel neu aufgebaut.
+
+        Returns:
+            (GM, c², PN-Koeffizienten, r_φ, φ, K, ε, β)
+        """
+        p = self.params
+        key = (p.mass, p.G, p.c, p.varphi, p.pn_order, tuple(p.delta_coefficients),
+               tuple(p.pn_epsilons), p.K_segments, p.epsilon, p.beta)
+        cached = self._cache.get('metric_kernel_args')
+        if cached is None or cached[0] != key:
+            self._compute_fundamental_scales()
+            args = (p.G * p.mass, p.c**2, tuple(float(c) for c in self.pn_series_coefficients()),
+                    self.r_phi, p.varphi, p.K_segments, p.epsilon, p.beta)
+            cached = self._cache['metric_kernel_args'] = (key, args)
+        return cached[1]
+
+    def metric_function_A_array(self, r) -> np.ndarray:
+        """
+        Metrik-Funktion A(r) für Arrays - identisch zu metric_function_A.
+
+        Gleiche Semantik wie die skalare Version (PN-Serie mit Δ(M),
+        Golden-Ratio-Sättigung bei r < r_φ, Softplus-Floor), aber
+        branch-frei mit np.where über das ganze Array ausgewertet.
+
+        Args:
+            r: Radius [m] (scalar or array)
+
+        Returns:
+            A(r) als np.ndarray (gleiche Form wie r)
+        """
+        r = np.asarray(r, dtype=float)
+        U = (self.params.G * self.params.mass) / (self.params.c**2 * r)
+
+        # Post-Newtonsche Serie (Koeffizienten wie post_newtonian_coefficients)
+        A_pn = np.polynomial.polynomial.polyval(U, self.pn_series_coefficients())
+
         # Sättigung bei r < r_φ
-        if r < self.r_phi:
-            A_saturated = self.golden_ratio_saturation(A_pn, 1.0, r)
-        else:
-            A_saturated = A_pn
-        
-        # Softplus-Floor (garantiert A > 0)
-        A_safe = self.softplus_floor(A_saturated)
-        
-        return A_safe
-    
+        phi = self.params.varphi
+        K = self.params.K_segments
+        saturation_factor = 1.0 - np.exp(-phi * K * r / self.r_phi)
+        A_saturated = np.where(r < self.r_phi,
+                               np.minimum(A_pn * saturation_factor, 1.0),
+                               A_pn)
+
+        # Softplus-Floor (gleiche drei Zweige wie softplus_floor)
+        epsilon = self.params.epsilon
+        beta = self.params.beta
+        shifted = A_saturated - epsilon
+        argument = beta * shifted
+        arg_mid = np.clip(argument, -50.0, 50.0)
+        return np.where(
+            argument > 50, shifted / beta + epsilon,
+            np.where(argument < -50,
+                     np.exp(np.minimum(argument, 0.0)) / beta + epsilon,
+                     np.log(1.0 + np.exp(arg_mid)) / beta + epsilon)
+        )
+
     def metric_function_B(self, r: float) -> float:
         """
         Metrik-Funktion B(r) = 1/A(r) - BOUNDED!
@@ -511,23 +605,34 @@ class UnifiedSSZMetric:
         
         return R_safe
     
+    def curvature_invariants(self, r) -> Dict[str, np.ndarray]:
+        """
+        Exakte Invarianten K, C², R_μν R^μν und R dieser Metrik
+        (geschlossene Form aus A, A', A'', B, B'; vektorisiert über r).
+        """
+        try:
+            from .kretschmann_weyl import curvature_invariants
+        except ImportError:
+            from kretschmann_weyl import curvature_invariants
+        return curvature_invariants(self.params.mass, r, backend=self)
+    
     def kretschmann_scalar(self, r: float, theta: float) -> float:
         """
         Kretschmann-Skalar K = R_μνρσ R^μνρσ - ENDLICH!
         
         GR: K → ∞ für r → 0
-        SSZ: K <= K_max (BOUNDED!)
+        SSZ: exaktes K der Metrik, Golden-Ratio-Sättigung → K <= K_max (BOUNDED!)
         """
-        # GR-Baseline
-        K_GR = 12.0 * (self.r_s**2) / (r**6)
+        K_exact = self.curvature_invariants(r)['kretschmann']
         
-        # Sättigung bei r < r_φ
-        if r < self.r_phi:
-            K_safe = self.golden_ratio_saturation(K_GR, self.K_max, r)
-        else:
-            K_safe = min(K_GR, self.K_max * 1.1)
+        # Sättigung bei r < r_φ (wie golden_ratio_saturation, vektorisiert)
+        phi = self.params.varphi
+        saturation_factor = 1.0 - np.exp(-phi * self.params.K_segments * r / self.r_phi)
+        K_safe = np.where(r < self.r_phi,
+                          np.minimum(K_exact * saturation_factor, self.K_max),
+                          np.minimum(K_exact, self.K_max * 1.1))
         
-        return K_safe
+        return K_safe[()]
     
     def einstein_tensor(self, r: float, theta: float) -> Dict[str, float]:
         """
@@ -775,6 +880,8 @@ class UnifiedSSZMetric:
         E_{t+1} = E_t × (1 + λ_A - λ_A² K²)
         mit Golden Ratio Sättigung: E_max = E_0 (1 - exp(-φK))
         
+        Für ganze (λ_A, K)-Gitter: bomb_dynamics.stability_phase_diagram
+        
         Returns:
             Array mit Energie-Werten über Zeit
         """
@@ -783,20 +890,9 @@ class UnifiedSSZMetric:
                 f"Instabile Kopplung! λ_A={lambda_A:.6f} >= λ_crit={self.lambda_crit:.6f}"
             )
         
-        K = self.params.K_segments
-        phi = self.params.varphi
-        
-        E = np.zeros(time_steps)
-        E[0] = E_initial
-        
-        growth_factor = 1.0 + lambda_A - (lambda_A**2) * (K**2)
-        E_max = E_initial * (1.0 - np.exp(-phi * K))
-        
-        for t in range(time_steps - 1):
-            E[t+1] = E[t] * growth_factor
-            E[t+1] = min(E[t+1], E_max)
-        
-        return E
+        # Geschlossene Form E_t = min(E_0 g^t, E_max·min(1,g)^(t-1)), log-Raum
+        return energy_evolution(E_initial, lambda_A, self.params.K_segments,
+                                time_steps, phi=self.params.varphi)
     
     # ======================== OBSERVABLES ========================
     
@@ -810,6 +906,8 @@ class UnifiedSSZMetric:
         NOTE: SSZ corrections negligible at Mercury orbit (~0%).
         SSZ: Δφ_SSZ = Δφ_GR × (1 + η_SSZ)
         
+        Exaktes Bahnintegral der SSZ-Metrik: perihelion_precession_exact()
+        
         Args:
             semi_major_axis: Semi-major axis [m]
             eccentricity: Orbital eccentricity
@@ -842,6 +940,22 @@ class UnifiedSSZMetric:
         
         return Delta_phi_SSZ
     
+    def perihelion_precession_exact(self, semi_major_axis, eccentricity) -> np.ndarray:
+        """
+        Exakte Perihel-Präzession aus ∫ dφ/dr zwischen den Umkehrpunkten.
+        
+        Vektorisierte Gauss-Chebyshev-Quadratur mit Fehlerkontrolle
+        (siehe orbit_precession.py), für Arrays von (a, e).
+        
+        Args:
+            semi_major_axis: Semi-major axis [m] (scalar or array)
+            eccentricity: Orbital eccentricity (scalar or array)
+        
+        Returns:
+            Δφ per orbit [radians]
+        """
+        return periapsis_shift(self, semi_major_axis, eccentricity)
+    
     def perihelion_precession_arcsec_per_century(self, semi_major_axis: float, 
                                                   eccentricity: float,
                                                   period_years: float) -> float:
@@ -965,36 +1079,42 @@ class UnifiedSSZMetric:
     
     def ISCO_radius(self, prograde: bool = True) -> float:
         """
-        Innermost Stable Circular Orbit with SSZ corrections.
+        Innermost Stable Circular Orbit aus dem effektiven Potential.
         
-        HYBRID APPROACH:
-        - Base: Standard Schwarzschild r_ISCO = 3 r_s
-        - SSZ correction: +2.2% via metric function A(r)
+        ISCO = äußerstes Minimum von L_c²(r) = r³A'/(2A - rA'),
+        d.h. Rand von d²V_eff/dr² > 0 (siehe circular_orbits.py).
         
         Args:
-            prograde: True for prograde orbits
+            prograde: Ohne Effekt (statische Metrik, kein Spin)
         
         Returns:
             r_ISCO in meters
         """
-        # GR value
-        r_ISCO_GR = 3.0 * self.r_s
-        
-        # SSZ correction: evaluate metric at ISCO
-        # Similar approach to photon sphere
-        A_SSZ = self.metric_function_A(r_ISCO_GR)
-        A_GR = 1 - self.r_s / r_ISCO_GR  # = 2/3 for r = 3 r_s
+        M_geom = self.params.G * self.params.mass / self.params.c**2
+        return self.circular_orbits().isco * M_geom
+    
+    def marginally_bound_orbit(self) -> float:
+        """
+        Marginal gebundene Kreisbahn (E = 1) zwischen Photonensphäre und ISCO.
         
-        # Correction factor
-        if A_GR > 0:
-            correction = A_SSZ / A_GR
-        else:
-            correction = 1.0
+        GR: r_mb = 2 r_s
         
-        # Apply correction (sqrt since stability involves A')
-        r_ISCO_SSZ = r_ISCO_GR * np.sqrt(correction)
+        Returns:
+            r_mb in meters
+        """
+        M_geom = self.params.G * self.params.mass / self.params.c**2
+        return self.circular_orbits().marginally_bound * M_geom
+    
+    def circular_orbits(self):
+        """
+        Kreisbahn-Analyse des effektiven Potentials (gecacht).
         
-        return r_ISCO_SSZ
+        Returns:
+            CircularOrbitAnalysis (Radien in GM/c²)
+        """
+        if 'circular_orbits' not in self._cache:
+            self._cache['circular_orbits'] = CircularOrbitAnalysis.for_metric(self)
+        return self._cache['circular_orbits']
     
     def ISCO_correction(self, prograde: bool = True) -> float:
         """
@@ -1143,11 +1263,11 @@ class UnifiedSSZMetric:
     
     def quasi_normal_modes_wkb(self, l: int = 2, n: int = 0):
         """
-        Quasi-Normal Modes via simplified formula.
+        Quasi-Normal Modes via WKB 3. Ordnung (Iyer & Will 1987).
         
-        HYBRID APPROACH:
-        - Base values: Schwarzschild (Berti et al. 2009)
-        - SSZ correction: ~3% via metric modification at photon sphere
+        Effektives axial-gravitatives Potential aus metric_function_A,
+        Ableitungen in der Schildkröten-Koordinate spektral (Chebyshev).
+        Siehe qnm_spectrum.QNMSpectrumSolver.
         
         Args:
             l: Angular quantum number (l=2 for quadrupole)
@@ -1156,41 +1276,28 @@ class UnifiedSSZMetric:
         Returns:
             (omega_real, omega_imag) in dimensionless units (ω × GM/c³)
         """
-        # Schwarzschild QNM formulas (Berti et al. 2009)
-        # For l=2, n=0: ω M ≈ 0.373 - 0.089i
-        # For l=3, n=0: ω M ≈ 0.599 - 0.093i
-        
-        # Base values for Schwarzschild
-        if l == 2:
-            if n == 0:
-                omega_real_M = 0.373
-                omega_imag_M = -0.089
-            elif n == 1:
-                omega_real_M = 0.346
-                omega_imag_M = -0.274
-            else:
-                omega_real_M = 0.373
-                omega_imag_M = -0.089 * (1 + 3*n)
-        elif l == 3:
-            omega_real_M = 0.599
-            omega_imag_M = -0.093 * (1 + 2*n)
-        else:
-            # Generic formula
-            omega_real_M = 0.2 + 0.2 * l
-            omega_imag_M = -0.09 * (1 + 2*n)
-        
-        # Apply SSZ correction (small, from metric modification)
-        # Evaluate at photon sphere
-        r_ph = self.photon_sphere_radius()
-        A_ph = self.metric_function_A(r_ph)
-        A_GR = 1 - self.r_s / r_ph if r_ph > self.r_s else 0.333
+        omega = self.qnm_spectrum([l], [n])[0, 0]
+        return float(omega.real), float(omega.imag)
+    
+    def qnm_spectrum(self, l_values, n_values, spin: int = 2) -> np.ndarray:
+        """
+        QNM-Spektrum für viele (l, n) auf einmal.
         
-        ssz_correction = np.sqrt(A_ph / A_GR) if A_GR > 0 else 1.0
+        ω·M ist masseninvariant bis auf Δ(M); die Ableitungen des
+        Potentials werden pro dimensionsloser Metrik-Signatur gecacht.
         
-        omega_real_dimensionless = omega_real_M * ssz_correction
-        omega_imag_dimensionless = omega_imag_M * ssz_correction
+        Args:
+            l_values: Angular quantum numbers
+            n_values: Overtone numbers
+            spin: Feld-Spin (0 = Skalar, 1 = EM, 2 = axial-gravitativ)
         
-        return omega_real_dimensionless, omega_imag_dimensionless
+        Returns:
+            Complex array ω × GM/c³, shape (len(l_values), len(n_values))
+        """
+        key = ('qnm_solver', spin)
+        if key not in self._cache:
+            self._cache[key] = QNMSpectrumSolver(self, spin=spin)
+        return self._cache[key].modes(l_values, n_values)
     
     def ringdown_time(self, l: int = 2, n: int = 0) -> float:
         """
@@ -1295,7 +1402,8 @@ class UnifiedSSZMetric:
         Args:
             distance_kpc: Distance in kiloparsecs
             disk_enhancement: Factor by which disk increases apparent size
-                            (default: 2.26 to match EHT Sgr A*)
+                            (default: 2.26 to match EHT Sgr A*);
+                            für ein echtes Scheibenbild siehe accretion_disk()
         
         Returns:
             Apparent shadow size in microarcseconds
@@ -1306,6 +1414,23 @@ class UnifiedSSZMetric:
         bare_shadow = self.shadow_angular_size_microarcsec(distance_kpc)
         return bare_shadow * disk_enhancement
     
+    def accretion_disk(self, inclination_deg: float = 60.0, **kwargs):
+        """
+        Dünne Akkretionsscheibe (Novikov-Thorne-artig) mit Ray-Tracing.
+        
+        Physikalisches Bild statt konstantem disk_enhancement:
+        Page-Thorne-Fluss, Rotverschiebung und Linienprofile aus den
+        SSZ-Kreisbahnen (siehe accretion_disk.py).
+        
+        Args:
+            inclination_deg: Inklination (0 = face-on)
+            **kwargs: Weitere Parameter für ThinDiskModel (r_in, r_out, ...)
+        
+        Returns:
+            ThinDiskModel
+        """
+        return ThinDiskModel(self, inclination_deg=inclination_deg, **kwargs)
+    
     def compare_with_EHT(self, observed_microarcsec: float, 
                         distance_kpc: float) -> dict:
         """
@@ -1354,7 +1479,7 @@ class UnifiedSSZMetric:
             r_s_i = 2.0 * self.params.G * M_i / (self.params.c**2)
             
             # φ-Radius von Masse i
-            Delta_i = 98.01 * np.exp(-27000 * r_s_i) + 2.01
+            Delta_i = self.delta_M_correction(M_i)
             r_phi_i = (self.params.varphi / 2.0) * r_s_i * (1.0 + Delta_i / 100.0)
             
             # Segment-Dichte Beitrag